@@ -1,17 +1,13 @@
 import streamlit as st
 import pandas as pd
 from utils.news_api import NewsFetcher
-from utils.real_time_analyzer import RealTimeAnalyzer
+from utils.real_time_analyzer import get_analyzer
 import time
-import plotly.express as px
 import os
 import utils.i18n as i18n
 
-# Safe import for FactChecker
-try:
-    from utils.fact_checker import FactChecker
-except ImportError:
-    FactChecker = None
+# plotly, the fact checker and the URL scraper are imported where they are used:
+# they pull in heavy dependencies that most page views never need.
 
 # --- 1. PAGE CONFIGURATION & CSS ---
 st.set_page_config(
@@ -203,10 +199,9 @@ def main():
 
     st.divider()
     
-    # Initialize components
-    with st.spinner("Initializing Analysis Engine..."):
-        news_fetcher = NewsFetcher()
-        analyzer = RealTimeAnalyzer()
+    # Initialize components (the analysis engine loads once per process, in the background)
+    news_fetcher = NewsFetcher()
+    analyzer = get_analyzer()
     
     # Render Sidebar Status
     render_sidebar_status(analyzer)
@@ -234,9 +229,30 @@ def render_sidebar_status(analyzer):
             if analyzer.model_loaded:
                 st.success(f"Engine Active")
                 st.caption(analyzer.get_model_info())
+                cascade_stats = analyzer.get_cascade_stats()
+                if cascade_stats and cascade_stats['articles']:
+                    st.caption(
+                        f"Cascade: {cascade_stats['escalation_rate']:.0%} escalated to BERT "
+                        f"({cascade_stats['stage1_ms_per_article']:.1f} / {cascade_stats['stage2_ms_per_article']:.0f} ms per article)"
+                    )
+            elif not analyzer.is_ready():
+                st.info("Engine Warming Up")
+                st.caption("Rule-based results until the AI model is ready")
             else:
                 st.warning("Engine Fallback")
             
+            stage_stats = analyzer.get_timing_stats()
+            if stage_stats:
+                st.caption("Latency p50 / p95 / p99 (ms)")
+                st.caption("  \n".join(
+                    f"{name}: {s['p50_ms']:.1f} / {s['p95_ms']:.1f} / {s['p99_ms']:.1f}"
+                    for name, s in stage_stats.items()
+                ))
+            
+            store_stats = analyzer.get_store_stats()
+            if store_stats and store_stats['entries']:
+                st.caption(f"Analysis store: {store_stats['entries']} results, {store_stats['hit_rate']:.0%} hits")
+            
             st.info("News API Ready")
             st.caption(f"Last Check: {time.strftime('%H:%M')}")
 
@@ -276,7 +292,7 @@ def render_dashboard(analyzer, news_fetcher):
             st.markdown("#### 📊 Insights")
             st.write("View detection trends.")
             if st.button(i18n.t('view_stats'), use_container_width=True):
-                show_sample_stats()
+                show_sample_stats(analyzer)
 
 def test_analysis(analyzer):
     """Quick test analysis"""
@@ -285,7 +301,8 @@ def test_analysis(analyzer):
         'content': 'Analysts report a significant upturn in global markets following the recent policy announcements.',
         'source': 'Financial Daily'
     }
-    prediction, confidence = analyzer.predict_article(test_article)
+    result = analyzer.analyze_article(test_article)
+    prediction, confidence = result['prediction'], result['confidence']
     
     # Classy Result Card
     st.markdown(f"""
@@ -296,15 +313,18 @@ def test_analysis(analyzer):
     </div>
     """, unsafe_allow_html=True)
 
-def show_sample_stats():
-    """Show sample statistics"""
-    data = {'Category': ['Real News', 'Fake News', 'Uncertain'], 'Count': [65, 23, 12]}
-    df = pd.DataFrame(data)
+def show_sample_stats(analyzer):
+    """Show detection statistics from the analyzer's running aggregates"""
+    df = analyzer.aggregates.pie_data({'REAL': 'Real News', 'FAKE': 'Fake News', 'UNCERTAIN': 'Uncertain'})
+    if df.empty:
+        st.info("No articles analyzed yet. Run the Live Monitor to collect statistics.")
+        return
     
-    colors = ['#0f172a', '#ef4444', '#cbd5e1'] 
+    colors = {'Real News': '#0f172a', 'Fake News': '#ef4444', 'Uncertain': '#cbd5e1'}
     
+    import plotly.express as px
     fig = px.pie(df, values='Count', names='Category', title='Detection Distribution', 
-                 hole=0.7, color_discrete_sequence=colors)
+                 hole=0.7, color='Category', color_discrete_map=colors)
     fig.update_layout(
         paper_bgcolor="rgba(0,0,0,0)", 
         plot_bgcolor="rgba(0,0,0,0)",
@@ -328,36 +348,65 @@ def live_news_monitor(news_fetcher, analyzer, lang_code='en'):
             search_query = st.text_input(i18n.t('search_placeholder'), default_search)
         with c2:
             num_articles = st.number_input(i18n.t('num_articles'), min_value=1, max_value=50, value=10)
+        
+        # News APIs only return a snippet: optionally scrape the full pages (concurrently)
+        full_text = st.checkbox("Fetch full article text", value=False)
 
         if st.button(i18n.t('fetch_analyze'), type="primary", use_container_width=True):
-            fetch_and_analyze_news(news_fetcher, analyzer, search_query, num_articles, lang_code)
-
-def fetch_and_analyze_news(news_fetcher, analyzer, query, num_articles, lang_code='en'):
+            fetch_and_analyze_news(news_fetcher, analyzer, search_query, num_articles, lang_code, full_text)
+
+def enrich_with_full_text(articles):
+    """Replace API snippets with the scraped page text, all URLs fetched concurrently"""
+    from utils.url_scraper import URLScraper
+    by_url = {}
+    for article in articles:
+        if article.get('url'):
+            by_url.setdefault(article['url'], []).append(article)
+    if not by_url:
+        return articles
+    
+    progress = st.progress(0.0, text="Fetching full text...")
+    for done, (url, data) in enumerate(URLScraper(quiet=True).scrape_many(list(by_url)), 1):
+        if data.get('success'):
+            for article in by_url[url]:
+                if len(data['content']) > len(article.get('content') or ''):
+                    article['content'] = data['content']
+        progress.progress(done / len(by_url), text=f"Fetching full text... {done}/{len(by_url)}")
+    progress.empty()
+    return articles
+
+def fetch_and_analyze_news(news_fetcher, analyzer, query, num_articles, lang_code='en', full_text=False):
     try:
         with st.spinner("Connecting to News Stream..."):
             articles = news_fetcher.fetch_real_time_news([query], lang=lang_code)
             articles = articles[:num_articles]
+        
+        if articles and full_text:
+            articles = enrich_with_full_text(articles)
             
-            if articles:
-                results = analyzer.analyze_news_batch(articles)
-                
-                # KPIs Container
-                with st.container(border=True):
-                    fakes = len([r for r in results if r['prediction'] == 'FAKE'])
-                    k1, k2, k3 = st.columns(3)
-                    k1.metric("Analyzed", len(results))
-                    k2.metric("Flagged", fakes, delta_color="inverse")
-                    k3.metric("Verified", len(results) - fakes)
-                
-                st.divider()
-                
-                # Display List
-                for i, result in enumerate(results):
+        if articles:
+            # KPIs Container (updated as each micro-batch comes in)
+            with st.container(border=True):
+                k1, k2, k3 = st.columns(3)
+                analyzed_kpi, flagged_kpi, verified_kpi = k1.empty(), k2.empty(), k3.empty()
+            
+            st.divider()
+            
+            # Display List: cards render as soon as their micro-batch is scored
+            results = []
+            for batch in analyzer.analyze_stream(articles):
+                for result in batch:
                     icon = "🛑" if result['prediction'] == 'FAKE' else "✅"
                     with st.expander(f"{icon} {result['title']}", expanded=False):
                         display_article_card(result)
-            else:
-                st.warning(i18n.t('no_articles_found'))
+                results.extend(batch)
+                
+                fakes = len([r for r in results if r['prediction'] == 'FAKE'])
+                analyzed_kpi.metric("Analyzed", len(results))
+                flagged_kpi.metric("Flagged", fakes, delta_color="inverse")
+                verified_kpi.metric("Verified", len(results) - fakes)
+        else:
+            st.warning(i18n.t('no_articles_found'))
     except Exception as e:
         st.error(f"Error: {str(e)}")
 
@@ -478,6 +527,12 @@ def single_article_analysis(analyzer, lang_code='en'):
                         run_fc = st.button("Verify Facts", key=f"fc_btn_run", type="primary", use_container_width=True)
                     
                     if run_fc:
+                        # Safe import for FactChecker
+                        try:
+                            from utils.fact_checker import FactChecker
+                        except ImportError:
+                            FactChecker = None
+
                         if FactChecker is None:
                             st.error("Fact Checker module inactive.")
                         else:
@@ -518,7 +573,12 @@ def single_article_analysis(analyzer, lang_code='en'):
             # 3. Source Content
             with st.expander("📄 View Raw Content"):
                 st.write(f"**Title:** {result_data['article'].get('title', 'N/A')}")
-                st.text_area("Content", result_data['article'].get('content', ''), height=150, disabled=True)
+                stored_at = result_data['article'].get('stored_at')
+                if stored_at is not None:
+                    # Store hit: the page was not downloaded again, only the verdict is kept
+                    st.caption(f"💾 Result from the analysis of {time.strftime('%Y-%m-%d %H:%M', time.localtime(stored_at))}, content not downloaded again.")
+                else:
+                    st.text_area("Content", result_data['article'].get('content', ''), height=150, disabled=True)
 
         else:
             st.info("👋 Select a method in 'Input Data' to begin analysis.")
@@ -526,6 +586,15 @@ def single_article_analysis(analyzer, lang_code='en'):
 # --- HELPER FUNCTIONS ---
 def analyze_url_content(url, analyzer):
     try:
+        # Recently analyzed URL: no scraping, no model
+        stored = analyzer.lookup_url(url)
+        if stored is not None:
+            article = {'title': stored['title'], 'content': '', 'url': url, 'source': 'Scraped', 'stored_at': stored['updated_at']}
+            st.session_state['url_analysis_result'] = {'prediction': stored['prediction'], 'confidence': stored['confidence'], 'article': article}
+            st.session_state.pop('text_analysis_result', None)
+            st.toast(f"Analyzed on {time.strftime('%Y-%m-%d %H:%M', time.localtime(stored['updated_at']))}", icon="💾")
+            return
+        
         from utils.url_scraper import URLScraper
         scraper = URLScraper()
         with st.spinner("Extracting content..."):
@@ -534,7 +603,8 @@ def analyze_url_content(url, analyzer):
         if data['success']:
             article = {'title': data['title'], 'content': data['content'], 'url': url, 'source': 'Scraped'}
             with st.spinner("Analyzing patterns..."):
-                pred, conf = analyzer.predict_article(article)
+                result = analyzer.analyze_article(article)
+            pred, conf = result['prediction'], result['confidence']
             
             st.session_state['url_analysis_result'] = {'prediction': pred, 'confidence': conf, 'article': article}
             st.session_state.pop('text_analysis_result', None)
@@ -547,7 +617,8 @@ def analyze_url_content(url, analyzer):
 def analyze_text_content(title, text, analyzer):
     with st.spinner("Analyzing patterns..."):
         article = {'title': title, 'content': text, 'source': 'Input'}
-        pred, conf = analyzer.predict_article(article)
+        result = analyzer.analyze_article(article)
+        pred, conf = result['prediction'], result['confidence']
         
         st.session_state['text_analysis_result'] = {'prediction': pred, 'confidence': conf, 'article': article}
         st.session_state.pop('url_analysis_result', None)
@@ -559,10 +630,21 @@ def batch_analysis(analyzer):
     with st.container(border=True):
         uploaded_file = st.file_uploader("Upload CSV (must have 'text' column)", type=['csv'])
         if uploaded_file:
-            df = pd.read_csv(uploaded_file)
+            from layouts.batch_analysis import load_file, count_rows, perform_batch_analysis
+            df = load_file(uploaded_file)
+            if df is None:
+                return
             st.write("Preview:", df.head())
+            
+            total_rows = max(count_rows(uploaded_file), 1)
+            c1, c2 = st.columns(2)
+            with c1:
+                confidence_threshold = st.slider("Confidence threshold", 0.5, 1.0, 0.7)
+            with c2:
+                max_articles = st.number_input("Max articles", 1, total_rows, total_rows)
+            
             if st.button("Process Batch", type="primary"):
-                st.info("Feature queued for next release.")
+                perform_batch_analysis(analyzer, uploaded_file, max_articles, confidence_threshold)
 
 def model_info_page(analyzer):
     st.header("🤖 Architecture")
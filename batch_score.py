@@ -0,0 +1,126 @@
+"""
+Headless bulk scoring: stream a CSV / JSONL / Parquet / Arrow file through the analyzer.
+
+The input is read CHUNK_SIZE rows at a time; each chunk is scored in one
+batched model call and appended to the output file before the next one is
+read, so memory stays constant whatever the input size. Throughput and ETA
+go to stderr.
+
+Articles are built from the 'title' column plus the first non-empty
+BATCH_CONFIG['TEXT_COLUMNS'] column ('text', then 'content'). Parquet and
+Arrow/Feather inputs (optional pyarrow) are read record batch by record
+batch, decoding only those columns plus --keep.
+
+Every run is a resumable job: a checkpoint (<output>.checkpoint.json) is
+saved every CHECKPOINT_INTERVAL seconds, and --resume continues an
+interrupted run from it instead of starting over.
+
+Usage:
+    python batch_score.py articles.csv scored.csv
+    python batch_score.py archive.jsonl scored.jsonl --chunk-size 5000 --keep id,url --workers 4
+    python batch_score.py archive.parquet scored.csv --keep id
+    python batch_score.py archive.parquet scored.csv --keep id --resume
+    python batch_score.py --status scored.csv
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import BATCH_CONFIG
+from utils.batch_jobs import BatchJob, JobMismatch, job_status
+
+
+def build_analyzer(models_dir=None, workers=1, use_store=True):
+    """Analyzer with its models loaded (and a process pool when workers > 1)"""
+    from utils.real_time_analyzer import RealTimeAnalyzer
+
+    analyzer = RealTimeAnalyzer(models_dir=models_dir, store=None if use_store else False)
+    if not analyzer.model_loaded:
+        print("⚠️ BERT model not available, falling back to rule-based scoring", file=sys.stderr)
+    elif workers != 1:
+        from utils.parallel_scoring import ParallelScorer
+        analyzer.scorer = ParallelScorer(predictor=analyzer.bert_predictor, workers=workers).start()
+    return analyzer
+
+
+def parse_columns(value):
+    return [column.strip() for column in value.split(',') if column.strip()] if value else []
+
+
+def run(args, analyzer=None):
+    """Score args.input into args.output; returns the number of rows in the output"""
+    job = BatchJob(
+        args.input, args.output,
+        chunk_size=args.chunk_size,
+        input_format=args.input_format,
+        output_format=args.output_format,
+        keep_columns=parse_columns(args.keep),
+        checkpoint_interval=args.checkpoint_interval
+    )
+
+    if analyzer is None:
+        analyzer = build_analyzer(args.models_dir, args.workers, not args.no_store)
+
+    try:
+        return job.run(analyzer, resume=args.resume)
+    finally:
+        if analyzer.scorer is not None:
+            analyzer.scorer.close()
+
+
+def print_status(output):
+    status = job_status(output)
+    if status is None:
+        print(f"No checkpoint for {output}")
+        return
+    total = f"/{status['total_rows']:,}" if status['total_rows'] else ""
+    updated = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(status['updated_at']))
+    print(f"{status['status']}: {status['rows_done']:,}{total} rows ({status['progress']:.1%}) "
+          f"from {status['input']}, last checkpoint {updated}")
+    if status['error']:
+        print(f"error: {status['error']}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Score a CSV / JSONL file of articles without the Streamlit UI")
+    parser.add_argument('input', nargs='?', help="CSV, JSONL, Parquet or Arrow/Feather file with 'title' and 'text' / 'content' columns")
+    parser.add_argument('output', nargs='?', help="CSV or JSONL results file (overwritten unless --resume)")
+    parser.add_argument('--chunk-size', type=int, default=BATCH_CONFIG['CHUNK_SIZE'])
+    parser.add_argument('--keep', default='', help="comma-separated input columns copied to the output (e.g. id,url)")
+    parser.add_argument('--input-format', choices=['csv', 'jsonl', 'parquet', 'arrow'], default=None,
+                        help="default: from the extension (.parquet / .feather / .arrow need pyarrow)")
+    parser.add_argument('--output-format', choices=['csv', 'jsonl'], default=None)
+    parser.add_argument('--models-dir', default=None)
+    parser.add_argument('--workers', type=int, default=1, help="scoring processes (0 = one per core)")
+    parser.add_argument('--no-store', action='store_true', help="don't read or write the analysis store")
+    parser.add_argument('--resume', action='store_true', help="continue from OUTPUT's checkpoint if there is one")
+    parser.add_argument('--checkpoint-interval', type=float, default=None,
+                        help=f"seconds between checkpoints (default {BATCH_CONFIG['CHECKPOINT_INTERVAL']:g})")
+    parser.add_argument('--status', metavar='OUTPUT', help="show the progress of the job writing OUTPUT and exit")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.status:
+        print_status(args.status)
+        return
+    if not args.input or not args.output:
+        parser.error("input and output are required")
+    try:
+        rows = run(args)
+    except JobMismatch as e:
+        print(f"❌ Cannot resume: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\n⏸️ Interrupted, continue with --resume", file=sys.stderr)
+        sys.exit(130)
+    print(f"✅ {rows:,} rows scored -> {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+HTTP benchmark: bare requests.get vs the shared keep-alive session.
+
+Starts --hosts local stand-in servers (one port each) that add --setup-ms of
+delay to every NEW connection, standing in for the TCP + TLS handshake to a
+remote site (localhost connects are otherwise almost free). Then fetches
+--requests pages spread over those hosts:
+  - with requests.get (a new connection per call, the old scraper / news API path),
+  - with utils.http_session.get (pooled keep-alive connections per host).
+Reports latency per request and the number of connections each opened.
+
+Usage:
+    python benchmarks/bench_http_session.py --requests 200 --hosts 4 --setup-ms 30
+"""
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import http_session
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes: without this, Nagle + delayed ACK add ~40 ms
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+        # Connection setup cost of a real remote host
+        time.sleep(self.server.setup_delay)
+
+    def do_GET(self):
+        body = self.server.page
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_hosts(count, setup_ms, page_kb):
+    servers = []
+    for _ in range(count):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        server.daemon_threads = True
+        server.lock = threading.Lock()
+        server.connections = 0
+        server.setup_delay = setup_ms / 1000
+        server.page = b"<html><body><article>" + b"<p>Lorem ipsum dolor sit amet.</p>" * (page_kb * 30) + b"</article></body></html>"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+def run(fetch, urls, servers):
+    before = sum(server.connections for server in servers)
+    latencies = []
+    start = time.perf_counter()
+    for url in urls:
+        request_start = time.perf_counter()
+        response = fetch(url)
+        response.content
+        latencies.append(time.perf_counter() - request_start)
+    elapsed = time.perf_counter() - start
+    connections = sum(server.connections for server in servers) - before
+    return elapsed, np.array(latencies) * 1000, connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bare requests.get vs shared keep-alive session")
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--hosts', type=int, default=4)
+    parser.add_argument('--setup-ms', type=float, default=30.0, help="simulated handshake cost per new connection")
+    parser.add_argument('--page-kb', type=int, default=30)
+    args = parser.parse_args()
+
+    servers = start_hosts(args.hosts, args.setup_ms, args.page_kb)
+    urls = [
+        f"http://127.0.0.1:{servers[i % len(servers)].server_address[1]}/article/{i}"
+        for i in range(args.requests)
+    ]
+
+    print(f"\n📊 {args.requests} requests over {args.hosts} hosts, {args.setup_ms:g} ms per new connection")
+    print("=" * 72)
+    print(f"{'client':<24}{'total s':>9}{'mean ms':>9}{'p50 ms':>9}{'p95 ms':>9}{'connections':>12}")
+    results = {}
+    for name, fetch in (
+        ('requests.get', lambda url: requests.get(url, timeout=15)),
+        ('http_session.get', http_session.get)
+    ):
+        elapsed, latencies, connections = run(fetch, urls, servers)
+        results[name] = latencies.mean()
+        print(f"{name:<24}{elapsed:9.2f}{latencies.mean():9.1f}{np.percentile(latencies, 50):9.1f}"
+              f"{np.percentile(latencies, 95):9.1f}{connections:12}")
+    print(f"\nSaved per request: {results['requests.get'] - results['http_session.get']:.1f} ms")
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Scaling benchmark for process-pool scoring (ParallelScorer).
+
+Scores the same articles with one process using torch's default intra-op
+threads (the current path), then with 1/2/4/8 worker processes pinned to
+--threads-per-worker torch threads each. Uses --models-dir when given,
+otherwise a randomly initialised BERT-small-sized model written to a temp
+folder (same loading path as real models). The embedding cache is disabled
+so every run does the full work.
+
+Usage:
+    python benchmarks/bench_parallel.py --models-dir models --articles 2000 --workers 1,2,4,8
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_synthetic_models(folder, hidden_size=256, layers=4):
+    """Random BERT + tokenizer + LogisticRegression in the layout BERTPredictor expects"""
+    import joblib
+    import numpy as np
+    import torch
+    from sklearn.linear_model import LogisticRegression
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    words = [f"w{i}" for i in range(3000)]
+    vocab_path = os.path.join(folder, "vocab.txt")
+    with open(vocab_path, "w") as f:
+        f.write("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + words))
+    BertTokenizerFast(vocab_path).save_pretrained(os.path.join(folder, "bert_tokenizer"))
+
+    torch.manual_seed(0)
+    config = BertConfig(vocab_size=len(words) + 5, hidden_size=hidden_size, num_hidden_layers=layers,
+                        num_attention_heads=4, intermediate_size=hidden_size * 4)
+    BertModel(config).save_pretrained(os.path.join(folder, "bert_model"))
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(500, hidden_size))
+    joblib.dump(LogisticRegression().fit(X, (X[:, 0] > 0).astype(int)), os.path.join(folder, "fake_news_model.pkl"))
+    return words
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ParallelScorer scaling benchmark")
+    parser.add_argument('--models-dir', default=None)
+    parser.add_argument('--articles', type=int, default=2000)
+    parser.add_argument('--workers', default='1,2,4,8')
+    parser.add_argument('--threads-per-worker', type=int, default=1)
+    parser.add_argument('--shard-size', type=int, default=None)
+    parser.add_argument('--start-method', default=None)
+    args = parser.parse_args()
+
+    from config import CACHE_CONFIG
+    CACHE_CONFIG['ENABLED'] = False
+
+    import torch
+    from utils.bert_predictor import BERTPredictor
+    from utils.parallel_scoring import ParallelScorer
+
+    models_dir = args.models_dir
+    random.seed(0)
+    if models_dir is None:
+        models_dir = tempfile.mkdtemp()
+        words = build_synthetic_models(models_dir)
+    else:
+        words = ("officials announced new measures today while researchers published a study "
+                 "markets reacted strongly according to experts").split()
+    texts = [" ".join(random.choices(words, k=random.randint(40, 300))) for _ in range(args.articles)]
+
+    predictor = BERTPredictor(models_dir=models_dir, load=False)
+    if not predictor.load_models(verbose=False):
+        print(f"❌ Could not load models from {models_dir}")
+        return
+    predictor.warm_up()
+
+    print(f"\n📊 Scoring {len(texts)} articles on {os.cpu_count()} cores")
+    print("=" * 70)
+    start = time.perf_counter()
+    baseline = ParallelScorer(predictor=predictor, workers=1).score(texts)
+    baseline_s = time.perf_counter() - start
+    print(f"{'1 process, ' + str(torch.get_num_threads()) + ' torch threads':34}{baseline_s:9.2f} s"
+          f"{len(texts) / baseline_s:10.1f} articles/s")
+
+    for workers in [int(w) for w in args.workers.split(',')]:
+        scorer = ParallelScorer(predictor=predictor, workers=workers, threads_per_worker=args.threads_per_worker,
+                                shard_size=args.shard_size, start_method=args.start_method)
+        with scorer:
+            if workers == 1:
+                torch.set_num_threads(args.threads_per_worker)
+            start = time.perf_counter()
+            results = scorer.score(texts)
+            elapsed = time.perf_counter() - start
+        same = [label for label, _ in results] == [label for label, _ in baseline]
+        label = f"{workers} worker(s) x {args.threads_per_worker} thread(s)"
+        print(f"{label:34}{elapsed:9.2f} s{len(texts) / elapsed:10.1f} articles/s"
+              f"{baseline_s / elapsed:8.2f}x  {'✅' if same else '❌ labels differ'}")
+
+
+if __name__ == '__main__':
+    main()
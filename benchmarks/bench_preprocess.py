@@ -0,0 +1,115 @@
+"""
+Text cleaning benchmark: per-article vs batch preprocessing.
+
+Cleans N articles (default 10k) with the BERT cleaning path (old per-call
+regexes, BERTPredictor.preprocess_text, BERTPredictor.preprocess_texts) and,
+when the NLTK data is installed, the utils.preprocess path. Articles come
+from a CSV 'text' column when given, otherwise synthetic text with URLs,
+HTML and punctuation.
+
+Usage:
+    python benchmarks/bench_preprocess.py --articles 10000
+"""
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_articles(csv_path, count, text_column):
+    if csv_path:
+        import pandas as pd
+        return pd.read_csv(csv_path, usecols=[text_column], nrows=count)[text_column].tolist()
+
+    random.seed(0)
+    words = ("Government officials announced new economic measures today, while researchers "
+             "published a peer-reviewed study on climate change! Markets reacted strongly... "
+             "SHOCKING secret miracle cure: doctors & experts (university report) 2024 100%").split()
+    extras = ["https://example.com/story?id=42", "<b>", "</b>", "<a href='x'>", "www.news.org", "\n"]
+    return [" ".join(random.choices(words + extras, k=random.randint(80, 600))) for _ in range(count)]
+
+
+def old_bert_clean(text):
+    """BERTPredictor.preprocess_text before batching (patterns rebuilt on every call)"""
+    if not isinstance(text, str):
+        return ""
+    text = text.lower()
+    text = re.sub(r'https?://\S+|www\.\S+', '', text)
+    text = re.sub(r'<.*?>', '', text)
+    text = text.translate(str.maketrans('', '', string.punctuation))
+    text = re.sub(r'\n', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def old_nltk_clean(text, stop_words, lemmatizer, word_tokenize):
+    """utils.preprocess.preprocess_text before batching"""
+    if not isinstance(text, str) or not text.strip():
+        return ""
+    text = text.lower()
+    text = re.sub(r'http\S+', '', text)
+    text = re.sub(r'[^a-zA-Z\s]', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return ' '.join(lemmatizer.lemmatize(token) for token in word_tokenize(text)
+                    if token not in stop_words and len(token) > 2)
+
+
+def timed(label, fn, count, baseline=None):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    speedup = f"{baseline / elapsed:8.1f}x" if baseline else ""
+    print(f"{label:32}{elapsed:9.3f} s{count / elapsed:12.0f} articles/s{speedup}")
+    return list(result), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-article and batch text cleaning")
+    parser.add_argument('--csv', default=None)
+    parser.add_argument('--text-column', default='text')
+    parser.add_argument('--articles', type=int, default=10000)
+    args = parser.parse_args()
+
+    from utils.bert_predictor import BERTPredictor
+    import utils.preprocess as preprocess
+
+    texts = load_articles(args.csv, args.articles, args.text_column)
+    count = len(texts)
+    predictor = BERTPredictor(models_dir=tempfile.mkdtemp(), load=False)
+
+    print(f"\n📊 BERT cleaning ({count} articles)")
+    print("=" * 70)
+    old, old_s = timed("old, one by one", lambda: [old_bert_clean(t) for t in texts], count)
+    single, _ = timed("preprocess_text, one by one", lambda: [predictor.preprocess_text(t) for t in texts], count, old_s)
+    batch, _ = timed("preprocess_texts", lambda: predictor.preprocess_texts(texts), count, old_s)
+    print(f"Identical output: {'✅' if old == single == batch else '❌'}")
+
+    try:
+        preprocess.ensure_nltk_data()
+        from nltk.tokenize import word_tokenize
+        word_tokenize("warm up")
+    except Exception as e:
+        print(f"\n⚠️ NLTK data unavailable, skipping utils.preprocess benchmark ({e})")
+        return
+
+    print(f"\n📊 NLTK cleaning ({count} articles)")
+    print("=" * 70)
+    old, old_s = timed(
+        "old, one by one",
+        lambda: [old_nltk_clean(t, preprocess.stop_words, preprocess.lemmatizer, word_tokenize) for t in texts],
+        count)
+    preprocess._normalize_token.cache_clear()
+    single, _ = timed("preprocess_text, one by one", lambda: [preprocess.preprocess_text(t) for t in texts], count, old_s)
+    preprocess._normalize_token.cache_clear()
+    batch, _ = timed("preprocess_texts", lambda: preprocess.preprocess_texts(texts), count, old_s)
+    print(f"Identical output: {'✅' if old == single == batch else '❌'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+Rule engine benchmark: per-pattern loops vs the compiled RuleEngine.
+
+Runs pre-detection and the rule-based analysis over N synthetic articles
+(default 100k, about 1% of words are rule phrases; --hit-rate changes it) with:
+  - the old implementation (re.search per pattern, substring scan per
+    indicator, lists rebuilt on every call),
+  - one combined alternation regex (named groups for the patterns, an
+    overlapping lookahead for the indicator terms),
+  - an Aho-Corasick automaton over all literals, if pyahocorasick is installed,
+  - the RuleEngine.
+
+Usage:
+    python benchmarks/bench_rules.py --articles 100000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def synthetic_articles(count, hit_rate):
+    """
+    Articles drawn from a 5k pseudo-word vocabulary; each word is replaced by a
+    phrase the rules look for with probability hit_rate.
+    """
+    random.seed(0)
+    letters = "abcdefghiklmnoprstuvwy"
+    vocabulary = ["".join(random.choices(letters, k=random.randint(2, 10))) for _ in range(5000)]
+    phrases = ("breaking shocking secret hidden miracle cure instant urgent warning alert hoax "
+               "alien abduction ghost killed zombie government university journal study").split()
+    phrases += ["according to study", "research shows", "official report", "experts say",
+                "doctors hate", "weight loss", "2026"]
+    articles = []
+    for _ in range(count):
+        words = random.choices(vocabulary, k=random.randint(60, 500))
+        for i in range(len(words)):
+            if random.random() < hit_rate:
+                words[i] = random.choice(phrases)
+        articles.append(" ".join(words).capitalize())
+    return articles
+
+
+def old_pre_detection(text):
+    text_lower = text.lower()
+    obvious_fake_patterns = [
+        r'vampire', r'werewolf', r'zombie', r'alien.*abduction', r'bigfoot',
+        r'loch ness', r'ghost.*killed', r'supernatural.*kill',
+        r'miracle.*cure', r'instant.*weight loss', r'one weird trick',
+        r'doctors hate', r'secret.*government', r'202[5-9].*killed'
+    ]
+    fake_matches = 0
+    for pattern in obvious_fake_patterns:
+        if re.search(pattern, text_lower):
+            fake_matches += 1
+    if fake_matches >= 1:
+        return True, 0.95
+    return None, None
+
+
+def old_rule_based(text):
+    text_lower = text.lower()
+    fake_indicators = [
+        'breaking', 'shocking', 'secret', 'hidden', 'they don\'t want you to know',
+        'miracle', 'instant', 'urgent', 'warning', 'alert', 'fake', 'hoax',
+        'vampire', 'werewolf', 'zombie', 'alien', 'bigfoot', 'ghost'
+    ]
+    reliability_indicators = [
+        'according to study', 'research shows', 'official report',
+        'experts say', 'peer-reviewed', 'journal', 'university', 'study'
+    ]
+    fake_score = sum(2 for word in fake_indicators if word in text_lower)
+    reliability_score = sum(1 for word in reliability_indicators if word in text_lower)
+    total_score = reliability_score - fake_score
+    if total_score >= 2:
+        return "REAL", 0.8
+    elif total_score <= -1:
+        return "FAKE", 0.9
+    return "UNCERTAIN", 0.5
+
+
+class AlternationRules:
+    """Everything in two combined regexes, all matches in one pass each"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.pre = re.compile('|'.join(
+            f'(?P<{name}>{pattern.pattern})' for name, pattern, _ in engine.pre_rules))
+        # Longest first so each position reports its longest term; shorter terms
+        # inside it come from the containment map
+        terms = sorted(engine.term_literals, key=len, reverse=True)
+        self.terms = re.compile('(?=(' + '|'.join(map(re.escape, terms)) + '))')
+        self.contained = {term: {other for other in terms if other in term} for term in terms}
+
+    def pre_detection(self, text):
+        if self.pre.search(text.lower()):
+            return True, self.engine.pre_confidence
+        return None, None
+
+    def rule_based(self, text):
+        found = set()
+        for term in self.terms.findall(text.lower()):
+            found |= self.contained[term]
+        return self.engine.verdict(found)
+
+
+class AutomatonRules:
+    """Aho-Corasick over every literal, then the same checks as RuleEngine"""
+
+    def __init__(self, engine):
+        import ahocorasick
+        self.engine = engine
+        self.automaton = ahocorasick.Automaton()
+        for literal in engine.literals:
+            self.automaton.add_word(literal, literal)
+        self.automaton.make_automaton()
+
+    def find(self, text_lower):
+        return {literal for _, literal in self.automaton.iter(text_lower)}
+
+    def pre_detection(self, text):
+        text_lower = text.lower()
+        found = self.find(text_lower)
+        for _, pattern, requires in self.engine.pre_rules:
+            if found.issuperset(requires) and pattern.search(text_lower):
+                return True, self.engine.pre_confidence
+        return None, None
+
+    def rule_based(self, text):
+        return self.engine.verdict(self.find(text.lower()))
+
+
+def run(label, pre_detection, rule_based, articles, baseline=None):
+    start = time.perf_counter()
+    results = [(pre_detection(text), rule_based(text)) for text in articles]
+    elapsed = time.perf_counter() - start
+    speedup = f"{baseline / elapsed:8.1f}x" if baseline else ""
+    print(f"{label:30}{elapsed:9.2f} s{len(articles) / elapsed:12.0f} articles/s{speedup}")
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compiled rule engine")
+    parser.add_argument('--articles', type=int, default=100000)
+    parser.add_argument('--hit-rate', type=float, default=0.01, help="share of words that are rule phrases")
+    parser.add_argument('--rules', default=None, help="rules file (default: ANALYSIS_CONFIG['RULES_PATH'])")
+    args = parser.parse_args()
+
+    from utils.rules import RuleEngine, load_rules
+
+    articles = synthetic_articles(args.articles, args.hit_rate)
+    rules = load_rules(args.rules)
+    engine = RuleEngine(rules)
+
+    sample = articles[:1000]
+    hits = sum(sum(1 for literal in engine.literals for _ in re.finditer(re.escape(literal), text.lower())) for text in sample)
+    print(f"\n📊 Pre-detection + rule-based analysis ({len(articles)} articles, rules {engine.version})")
+    print(f"   {hits / len(sample):.1f} rule literal occurrences per article (--hit-rate {args.hit_rate})")
+    print("=" * 70)
+    old, old_s = run("per-pattern loops", old_pre_detection, old_rule_based, articles)
+    identical = True
+
+    alternation = AlternationRules(engine)
+    results, _ = run("combined alternation regex", alternation.pre_detection, alternation.rule_based, articles, old_s)
+    identical &= results == old
+
+    try:
+        automaton = AutomatonRules(engine)
+        results, _ = run("Aho-Corasick (pyahocorasick)", automaton.pre_detection, automaton.rule_based, articles, old_s)
+        identical &= results == old
+    except ImportError:
+        print("⚠️ pyahocorasick not installed, skipping the automaton run")
+
+    results, _ = run("RuleEngine", engine.pre_detection, engine.rule_based, articles, old_s)
+    identical &= results == old
+    print(f"Identical verdicts: {'✅' if identical else '❌'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Slow (pure Python) vs fast (Rust) BERT tokenizer benchmark.
+
+Loads both tokenizers from the same bert_tokenizer folder and encodes a few
+thousand articles: slow one-by-one (the old path), slow batched, fast batched.
+Articles come from a CSV 'text' column when given, otherwise synthetic text.
+
+Usage:
+    python benchmarks/bench_tokenizers.py --tokenizer-dir models/bert_tokenizer --articles 3000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_articles(csv_path, count, text_column):
+    if csv_path:
+        import pandas as pd
+        return pd.read_csv(csv_path, usecols=[text_column], nrows=count)[text_column].dropna().astype(str).tolist()
+
+    random.seed(0)
+    words = ("government officials announced new economic measures today while researchers "
+             "published a peer reviewed study on climate change markets reacted strongly "
+             "shocking secret miracle cure doctors experts university report").split()
+    return [" ".join(random.choices(words, k=random.randint(80, 600))) for _ in range(count)]
+
+
+def timed(label, fn, count):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:28}{elapsed:10.2f} s{count / elapsed:12.0f} articles/s")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare BertTokenizer and BertTokenizerFast")
+    parser.add_argument('--tokenizer-dir', required=True)
+    parser.add_argument('--csv', default=None)
+    parser.add_argument('--text-column', default='text')
+    parser.add_argument('--articles', type=int, default=3000)
+    parser.add_argument('--max-length', type=int, default=128)
+    args = parser.parse_args()
+
+    from transformers import BertTokenizer, BertTokenizerFast
+    from utils.bert_predictor import BERTPredictor
+
+    # Same cleaning the predictor applies before tokenization (no BERT / classifier loaded)
+    predictor = BERTPredictor(models_dir=os.path.dirname(os.path.abspath(args.tokenizer_dir)), load=False)
+    texts = predictor.preprocess_texts(load_articles(args.csv, args.articles, args.text_column))
+
+    slow = BertTokenizer.from_pretrained(args.tokenizer_dir)
+    fast = BertTokenizerFast.from_pretrained(args.tokenizer_dir)
+    kwargs = dict(truncation=True, padding=False, max_length=args.max_length)
+
+    print(f"\n📊 Tokenizing {len(texts)} articles (max_length={args.max_length})")
+    print("=" * 60)
+    slow_single, slow_single_s = timed(
+        "slow, one by one", lambda: [slow(text, **kwargs)['input_ids'] for text in texts], len(texts))
+    slow_batch, _ = timed("slow, batched", lambda: slow(texts, **kwargs)['input_ids'], len(texts))
+    fast_batch, fast_batch_s = timed("fast, batched", lambda: fast(texts, **kwargs)['input_ids'], len(texts))
+
+    identical = slow_single == slow_batch == fast_batch
+    print("=" * 60)
+    print(f"Speed-up fast batched vs slow one-by-one: {slow_single_s / fast_batch_s:.1f}x")
+    print(f"Identical token ids: {'✅' if identical else '❌'}")
+
+
+if __name__ == '__main__':
+    main()
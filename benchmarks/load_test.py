@@ -0,0 +1,164 @@
+"""
+Load test for server.py: throughput and latency percentiles.
+
+N client threads (one keep-alive connection each) send /predict requests
+(or /predict_batch with --batch-size > 1) for --duration seconds against a
+running instance, or against one started here with --spawn. Reports
+requests/s, articles/s, p50/p95/p99 latency and the server's average
+micro-batch size.
+
+Usage:
+    python server.py --port 8000 &
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --concurrency 16 --duration 20
+    python benchmarks/load_test.py --spawn --models-dir models --concurrency 1,4,16
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+
+def make_articles(count):
+    random.seed(0)
+    words = ("government officials announced new economic measures today while researchers "
+             "published a peer reviewed study on climate change markets reacted strongly "
+             "shocking secret miracle cure doctors experts university report").split()
+    return [
+        {'title': " ".join(random.choices(words, k=8)), 'content': " ".join(random.choices(words, k=random.randint(40, 200)))}
+        for _ in range(count)
+    ]
+
+
+def request_json(connection, method, path, body=None):
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    headers = {'Content-Type': 'application/json'} if data is not None else {}
+    connection.request(method, path, body=data, headers=headers)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read() or b'null')
+
+
+def wait_ready(host, port, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=5)
+            status, _ = request_json(connection, 'GET', '/ready')
+            connection.close()
+            if status == 200:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.5)
+    return False
+
+
+def client(host, port, articles, batch_size, stop_at, latencies, errors, lock):
+    connection = http.client.HTTPConnection(host, port, timeout=120)
+    local = []
+    failed = 0
+    index = random.randrange(len(articles))
+    while time.perf_counter() < stop_at:
+        if batch_size > 1:
+            path, body = '/predict_batch', {'articles': [articles[(index + i) % len(articles)] for i in range(batch_size)]}
+        else:
+            path, body = '/predict', articles[index % len(articles)]
+        index += batch_size
+        start = time.perf_counter()
+        try:
+            status, _ = request_json(connection, 'POST', path, body)
+            if status != 200:
+                failed += 1
+        except (OSError, http.client.HTTPException):
+            failed += 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=120)
+            continue
+        local.append(time.perf_counter() - start)
+    connection.close()
+    with lock:
+        latencies.extend(local)
+        errors[0] += failed
+
+
+def batching_stats(host, port):
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    _, stats = request_json(connection, 'GET', '/stats')
+    connection.close()
+    return stats['batching']
+
+
+def run_level(host, port, articles, concurrency, duration, batch_size):
+    latencies, errors, lock = [], [0], threading.Lock()
+    before = batching_stats(host, port)
+    stop_at = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=client, args=(host, port, articles, batch_size, stop_at, latencies, errors, lock))
+        for _ in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    after = batching_stats(host, port)
+    batches = after['batches'] - before['batches']
+    avg_batch = (after['items'] - before['items']) / batches if batches else 0.0
+
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99]) if latencies else (0, 0, 0)
+    print(f"{concurrency:>11}{len(latencies) / elapsed:10.1f}{len(latencies) * batch_size / elapsed:11.1f}"
+          f"{p50:9.1f}{p95:9.1f}{p99:9.1f}{errors[0]:8}{avg_batch:12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput / latency load test for server.py")
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--spawn', action='store_true', help="start server.py on --url's port for the test")
+    parser.add_argument('--models-dir', default=None, help="with --spawn")
+    parser.add_argument('--concurrency', default='1,4,16', help="comma-separated client thread counts")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds per concurrency level")
+    parser.add_argument('--batch-size', type=int, default=1, help="> 1: use /predict_batch with this many articles")
+    parser.add_argument('--articles', type=int, default=2000)
+    args = parser.parse_args()
+
+    parts = urlsplit(args.url)
+    host, port = parts.hostname, parts.port or 80
+
+    process = None
+    if args.spawn:
+        command = [sys.executable, os.path.join(ROOT, 'server.py'), '--host', host, '--port', str(port), '--no-store']
+        if args.models_dir:
+            command += ['--models-dir', args.models_dir]
+        process = subprocess.Popen(command)
+
+    try:
+        if not wait_ready(host, port, timeout=300):
+            print("❌ Server not ready", file=sys.stderr)
+            sys.exit(1)
+
+        articles = make_articles(args.articles)
+        print(f"\n📊 Load test against {args.url} ({'batches of ' + str(args.batch_size) if args.batch_size > 1 else 'single /predict'})")
+        print("=" * 82)
+        print(f"{'concurrency':>11}{'req/s':>10}{'articles/s':>11}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}{'avg batch':>12}")
+        for concurrency in [int(value) for value in args.concurrency.split(',')]:
+            run_level(host, port, articles, concurrency, args.duration, args.batch_size)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Accuracy / latency / memory report: fp32 vs INT8 dynamic-quantized BERT.
+
+Scores a labeled CSV (the cleaned_fake_news.csv produced by eda_cleaning.ipynb,
+columns 'text' and 'class' with 0=Fake, 1=Real) once per mode. Each mode runs
+in its own subprocess so resident memory is measured independently.
+
+Usage:
+    python benchmarks/quantization_report.py --csv cleaned_fake_news.csv --models-dir models --limit 500
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def resident_memory_mb():
+    """Current RSS of this process in MB"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        # Peak RSS as a last resort (KB on Linux)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def score_mode(args):
+    """Child process: load one mode, score the CSV, print a JSON line"""
+    import numpy as np
+    import pandas as pd
+    from utils.bert_predictor import BERTPredictor
+
+    df = pd.read_csv(args.csv, usecols=[args.text_column, args.label_column], nrows=args.limit)
+    df = df.dropna()
+
+    rss_before = resident_memory_mb()
+    load_start = time.perf_counter()
+    predictor = BERTPredictor(models_dir=args.models_dir, backend='torch', quantize=(args.mode == 'int8'))
+    load_time = time.perf_counter() - load_start
+    if predictor.bert is None:
+        print(json.dumps({'mode': args.mode, 'error': 'models not found'}))
+        return
+    # Measure the model, not the embedding cache
+    predictor.embedding_cache = None
+    rss_loaded = resident_memory_mb()
+
+    latencies = []
+    correct = 0
+    for text, label in zip(df[args.text_column], df[args.label_column]):
+        start = time.perf_counter()
+        prediction, _ = predictor.predict(text)
+        latencies.append(time.perf_counter() - start)
+        correct += int((prediction == "REAL") == (int(label) == 1))
+
+    print(json.dumps({
+        'mode': args.mode,
+        'articles': len(latencies),
+        'accuracy': correct / len(latencies) if latencies else 0.0,
+        'p50_ms': float(np.percentile(latencies, 50) * 1000) if latencies else 0.0,
+        'p95_ms': float(np.percentile(latencies, 95) * 1000) if latencies else 0.0,
+        'load_s': load_time,
+        'model_rss_mb': rss_loaded - rss_before,
+        'peak_rss_mb': resident_memory_mb()
+    }))
+
+
+def run_report(args):
+    """Parent process: run both modes and print the comparison"""
+    results = {}
+    for mode in ('fp32', 'int8'):
+        cmd = [
+            sys.executable, os.path.abspath(__file__), '--mode', mode,
+            '--csv', args.csv, '--limit', str(args.limit),
+            '--text-column', args.text_column, '--label-column', args.label_column
+        ]
+        if args.models_dir:
+            cmd += ['--models-dir', args.models_dir]
+        print(f"🔄 Scoring {mode}...", file=sys.stderr)
+        output = subprocess.run(cmd, capture_output=True, text=True).stdout
+        lines = [line for line in output.splitlines() if line.startswith('{')]
+        if not lines:
+            print(f"❌ {mode} run produced no result", file=sys.stderr)
+            return
+        results[mode] = json.loads(lines[-1])
+        if 'error' in results[mode]:
+            print(f"❌ {mode}: {results[mode]['error']}", file=sys.stderr)
+            return
+
+    fp32, int8 = results['fp32'], results['int8']
+    print(f"\n📊 Quantization report ({fp32['articles']} articles)")
+    print("=" * 60)
+    print(f"{'':18}{'fp32':>12}{'int8':>12}{'delta':>14}")
+    rows = [
+        ('accuracy', 'accuracy', '{:.4f}'),
+        ('p50 latency (ms)', 'p50_ms', '{:.1f}'),
+        ('p95 latency (ms)', 'p95_ms', '{:.1f}'),
+        ('load time (s)', 'load_s', '{:.2f}'),
+        ('model RSS (MB)', 'model_rss_mb', '{:.0f}'),
+        ('peak RSS (MB)', 'peak_rss_mb', '{:.0f}')
+    ]
+    for name, key, fmt in rows:
+        delta = int8[key] - fp32[key]
+        print(f"{name:18}{fmt.format(fp32[key]):>12}{fmt.format(int8[key]):>12}{fmt.format(delta):>14}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fp32 and INT8 BERT inference")
+    parser.add_argument('--csv', default='cleaned_fake_news.csv')
+    parser.add_argument('--models-dir', default=None)
+    parser.add_argument('--limit', type=int, default=500)
+    parser.add_argument('--text-column', default='text')
+    parser.add_argument('--label-column', default='class')
+    parser.add_argument('--mode', choices=['fp32', 'int8'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        score_mode(args)
+    else:
+        run_report(args)
+
+
+if __name__ == '__main__':
+    main()
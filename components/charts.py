@@ -3,7 +3,9 @@ import plotly.graph_objects as go
 import pandas as pd
 
 def create_analysis_pie_chart(data, title="Distribution des Analyses"):
-    """Créer un graphique circulaire d'analyse"""
+    """Créer un graphique circulaire d'analyse (DataFrame Category/Count ou AnalysisAggregates)"""
+    if hasattr(data, 'pie_data'):
+        data = data.pie_data()
     fig = px.pie(
         data, 
         values='Count', 
@@ -56,7 +58,9 @@ def create_confidence_gauge(confidence_score, title="Niveau de Confiance"):
     return fig
 
 def create_trend_chart(data, title="Évolution des Analyses"):
-    """Créer un graphique de tendance"""
+    """Créer un graphique de tendance (DataFrame Date/Real/Fake/Uncertain ou AnalysisAggregates)"""
+    if hasattr(data, 'trend_data'):
+        data = data.trend_data()
     fig = px.line(
         data, 
         x='Date', 
@@ -27,11 +27,120 @@ ANALYSIS_CONFIG = {
         'LOW': 0.4
     },
     'MAX_ARTICLES': 50,
-    'BATCH_SIZE': 10
+    'BATCH_SIZE': 10,
+    # Intervalle minimal (secondes) entre deux mises à jour de la barre de progression
+    'PROGRESS_INTERVAL': 0.25,
+    # Règles de pré-détection / indicateurs (fichier versionné, règles intégrées si absent)
+    'RULES_PATH': 'rules/detection_rules.json'
 }
 
 # Configuration API
 API_CONFIG = {
     'NEWS_API_TIMEOUT': 30,
     'MAX_RETRIES': 3
+}
+
+# Session HTTP partagée (utils/http_session.py) : pools keep-alive par hôte, reprises avec attente aléatoire
+HTTP_CONFIG = {
+    'CONNECT_TIMEOUT': 5,  # secondes pour ouvrir la connexion (le délai de lecture vient de l'appelant)
+    'READ_TIMEOUT': 15,  # délai de lecture par défaut (scraping)
+    'POOL_HOSTS': 32,  # hôtes dont les connexions sont gardées ouvertes
+    'POOL_SIZE_PER_HOST': 8,  # connexions gardées par hôte
+    'BACKOFF_FACTOR': 0.5,  # attente max avant la n-ième reprise : BACKOFF_FACTOR * 2**(n-1) secondes
+    'BACKOFF_MAX': 10,
+    'RETRY_STATUSES': [429, 500, 502, 503, 504]
+}
+
+# URLScraper.scrape_many : extraction concurrente, polie envers chaque site
+SCRAPER_CONFIG = {
+    'MAX_WORKERS': 8,  # pages téléchargées / analysées en même temps, tous sites confondus
+    'PER_HOST': 2,  # requêtes simultanées maximum vers un même site
+    'HOST_INTERVAL': 0.5,  # secondes minimum entre deux départs de requête vers un même site
+    'URL_DEADLINE': 20  # secondes par URL (à partir de son départ) avant de l'abandonner
+}
+
+# Configuration du modèle BERT
+BERT_CONFIG = {
+    'MAX_LENGTH': 128,
+    'EMBED_BATCH_SIZE': 16,
+    'TOKEN_CACHE_ENTRIES': 4096,
+    # 'torch' (PyTorch eager) ou 'onnx' (onnxruntime CPU, repli sur torch)
+    'BACKEND': 'torch',
+    'ONNX_PATH': 'bert_model.onnx',
+    'ONNX_THREADS': None,
+    # Quantification dynamique INT8 des couches Linear (backend torch uniquement)
+    'QUANTIZE': False,
+    'QUANTIZED_PATH': 'bert_model_int8.pt',
+    # Mode articles longs : fenêtres glissantes de MAX_LENGTH tokens qui se chevauchent
+    'LONG_DOCUMENT': False,
+    'WINDOW_STRIDE': 96,
+    'MAX_WINDOWS': 8
+}
+
+# Cache des embeddings BERT (mémoire + disque)
+CACHE_CONFIG = {
+    'ENABLED': True,
+    'MEMORY_ENTRIES': 2048,
+    'DISK_PATH': 'cache/embeddings.sqlite',
+    'MAX_DISK_MB': 256
+}
+
+# Cascade : modèle TF-IDF/linéaire d'abord, BERT seulement pour les cas incertains
+CASCADE_CONFIG = {
+    'ENABLED': False,
+    'MODELS_DIR': None,  # None = même dossier que le modèle BERT
+    'UNCERTAINTY_MARGIN': 1.0  # |marge| < seuil => escalade vers BERT
+}
+
+# Scoring multi-processus pour les gros lots (CSV) : le modèle est chargé une fois puis partagé par fork
+PARALLEL_CONFIG = {
+    'WORKERS': 1,  # 1 = pas de pool, None = un worker par cœur
+    'TORCH_THREADS_PER_WORKER': 1,
+    'SHARD_SIZE': 64,  # articles envoyés à un worker à la fois
+    'START_METHOD': 'fork'  # 'spawn' sur Windows / macOS : chaque worker recharge le modèle
+}
+
+# Démarrage : budget pour un import à froid de app.py (mesuré avec python -X importtime)
+STARTUP_CONFIG = {
+    'IMPORT_TIME_BUDGET_MS': 3000
+}
+
+# Instrumentation : durée par étape (traduction, tokenisation, BERT...), fenêtre glissante pour p50/p95/p99
+TIMING_CONFIG = {
+    'ENABLED': True,
+    'WINDOW': 2048  # dernières mesures gardées par étape
+}
+
+# Résultats d'analyse : SQLite (WAL) indexé par URL canonique et hash du contenu, partagé entre utilisateurs
+STORE_CONFIG = {
+    'ENABLED': True,
+    'DB_PATH': 'cache/analyses.sqlite',
+    'URL_MAX_AGE_HOURS': 24  # au-delà, une URL est re-scrapée (le contenu a pu changer)
+}
+
+# Tableau de bord : agrégats mis à jour à chaque résultat (pas de re-scan de l'historique)
+AGGREGATES_CONFIG = {
+    'HOURS_KEPT': 168,  # 7 jours de tendance horaire
+    'CONFIDENCE_BINS': 10
+}
+
+# Traitement par lot (CLI batch_score.py, page Batch) : lecture par morceaux, mémoire constante
+BATCH_CONFIG = {
+    'CHUNK_SIZE': 1000,  # lignes lues, scorées et écrites à la fois
+    'TEXT_COLUMNS': ['text', 'content'],  # première colonne non vide utilisée comme contenu (+ 'title')
+    'PROGRESS_INTERVAL': 2.0,  # secondes entre deux lignes de progression sur stderr
+    'UI_CHUNK_SIZE': 500,  # page Batch : lignes par morceau (une mise à jour de la progression)
+    'DOWNLOAD_EVERY_CHUNKS': 10,  # page Batch : résultats partiels téléchargeables tous les N morceaux
+    'CHECKPOINT_INTERVAL': 30.0  # batch_score.py : secondes entre deux points de reprise (<sortie>.checkpoint.json)
+}
+
+# Serveur HTTP (server.py) : requêtes concurrentes regroupées en micro-lots
+SERVER_CONFIG = {
+    'HOST': '127.0.0.1',
+    'PORT': 8000,
+    'MAX_BATCH_SIZE': 32,  # articles par passe du modèle
+    'MAX_WAIT_MS': 10,  # attente max pour remplir un lot après la première requête
+    'MAX_REQUEST_ARTICLES': 1000,  # par appel /predict_batch
+    'MAX_BODY_MB': 10,
+    'REQUEST_TIMEOUT': 120  # secondes
 }
\ No newline at end of file
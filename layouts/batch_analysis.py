@@ -1,9 +1,18 @@
+import os
+import tempfile
 import streamlit as st
 import pandas as pd
+from config import BATCH_CONFIG
+from utils.batch_io import RESULT_FIELDS, INPUT_FORMATS, COLUMNAR_FORMATS, ColumnarSource, ResultWriter, score_chunk
 from components.cards import MetricCard
 from components.charts import create_confidence_gauge
 from utils.translator import t
 
+# Lignes gardées en mémoire pour l'aperçu (le reste est dans le fichier de résultats)
+PREVIEW_ROWS = 200
+
+UPLOAD_TYPES = ['csv', 'xlsx', 'parquet', 'pq', 'feather', 'arrow']
+
 def show(analyzer=None):
     """Page d'analyse par lot avec design professionnel."""
     
@@ -79,11 +88,12 @@ def show(analyzer=None):
     # =======================
     # Upload fichier
     # =======================
-    uploaded_file = st.file_uploader("Choisir un fichier CSV ou XLSX", type=['csv','xlsx'])
+    uploaded_file = st.file_uploader("Choisir un fichier CSV, XLSX, Parquet ou Arrow/Feather", type=UPLOAD_TYPES)
     if uploaded_file:
         df = load_file(uploaded_file)
         if df is not None:
-            st.success(f"Fichier chargé : {len(df)} articles")
+            total_rows = count_rows(uploaded_file)
+            st.success(f"Fichier chargé : {total_rows} articles")
             st.dataframe(df.head(), use_container_width=True)
 
             # Options d'analyse
@@ -93,57 +103,169 @@ def show(analyzer=None):
                 detect_sources = st.checkbox("Vérifier les sources", value=True)
             with col2:
                 confidence_threshold = st.slider("Seuil de confiance", 0.5, 1.0, 0.7)
-                max_articles = st.number_input("Nombre max d'articles", 1, 1000, len(df))
+                max_articles = st.number_input("Nombre max d'articles", 1, max(total_rows, 1), max(total_rows, 1))
 
             if st.button("Lancer l'Analyse"):
-                perform_batch_analysis(df, max_articles, confidence_threshold)
+                if analyzer is None:
+                    from utils.real_time_analyzer import get_analyzer
+                    analyzer = get_analyzer()
+                perform_batch_analysis(analyzer, uploaded_file, max_articles, confidence_threshold)
 
 # =======================
 # Charger fichier CSV/XLSX
 # =======================
-def load_file(uploaded_file):
+def upload_format(uploaded_file):
+    """'csv', 'parquet', 'arrow' ou 'excel' d'après l'extension"""
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    return INPUT_FORMATS.get(extension, 'excel')
+
+def load_file(uploaded_file, nrows=PREVIEW_ROWS):
+    """Aperçu : seulement les premières lignes du fichier"""
     try:
-        if uploaded_file.name.endswith('.csv'):
-            return pd.read_csv(uploaded_file)
+        uploaded_file.seek(0)
+        fmt = upload_format(uploaded_file)
+        if fmt == 'csv':
+            return pd.read_csv(uploaded_file, nrows=nrows)
+        elif fmt in COLUMNAR_FORMATS:
+            return next(ColumnarSource(uploaded_file, fmt).chunks(nrows), pd.DataFrame())
         else:
-            return pd.read_excel(uploaded_file)
+            return pd.read_excel(uploaded_file, nrows=nrows)
     except Exception as e:
         st.error(f"Erreur lors du chargement : {e}")
         return None
+    finally:
+        uploaded_file.seek(0)
+
+def count_rows(uploaded_file):
+    """Nombre de lignes sans parser le fichier (CSV : lignes du texte brut)"""
+    try:
+        fmt = upload_format(uploaded_file)
+        if fmt == 'csv':
+            data = uploaded_file.getvalue()
+            lines = data.count(b'\n') + (0 if data.endswith(b'\n') else 1)
+            return max(lines - 1, 0)
+        uploaded_file.seek(0)
+        if fmt in COLUMNAR_FORMATS:
+            # Métadonnées (Parquet, Arrow fichier) ; flux Arrow : somme des lots, sans colonnes
+            source = ColumnarSource(uploaded_file, fmt, columns=[])
+            if source.num_rows is not None:
+                return source.num_rows
+            return sum(batch.num_rows for batch in source.record_batches(65536))
+        return len(pd.read_excel(uploaded_file, usecols=[0]))
+    except Exception as e:
+        return 0
+    finally:
+        uploaded_file.seek(0)
+
+def iter_chunks(uploaded_file, chunk_size, limit):
+    """DataFrames of at most chunk_size rows, only the title / text columns, limit rows in total"""
+    columns = {'title', *BATCH_CONFIG['TEXT_COLUMNS']}
+    uploaded_file.seek(0)
+    fmt = upload_format(uploaded_file)
+    if fmt == 'csv':
+        yield from pd.read_csv(uploaded_file, chunksize=chunk_size, nrows=limit, usecols=lambda c: c in columns)
+    elif fmt in COLUMNAR_FORMATS:
+        # Projection : seules les colonnes title / text / content sont décodées
+        read = 0
+        for chunk in ColumnarSource(uploaded_file, fmt, columns).chunks(chunk_size):
+            chunk = chunk.iloc[:limit - read]
+            chunk.index = range(read, read + len(chunk))
+            read += len(chunk)
+            yield chunk
+            if read >= limit:
+                return
+    else:
+        # XLSX ne se lit pas par morceaux : on limite aux colonnes et lignes utiles
+        df = pd.read_excel(uploaded_file, nrows=limit, usecols=lambda c: c in columns)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
 
 # =======================
-# Analyse par lot simulée
+# Analyse par lot (par morceaux)
 # =======================
-def perform_batch_analysis(df, max_articles, confidence_threshold):
+def perform_batch_analysis(analyzer, uploaded_file, max_articles, confidence_threshold):
+    """
+    Score the upload chunk by chunk through the analyzer. Results go to a
+    temporary CSV as they are produced and the rows written so far can be
+    downloaded every DOWNLOAD_EVERY_CHUNKS chunks; only running counts and
+    the first PREVIEW_ROWS rows are kept in memory.
+    """
     progress_bar = st.progress(0)
     status_text = st.empty()
-    results = []
-    total_articles = min(len(df), max_articles)
-
-    for i in range(total_articles):
-        progress_bar.progress((i+1)/total_articles)
-        status_text.text(f"Analyse {i+1}/{total_articles}...")
-        results.append({
-            'title': df.iloc[i]['title'] if 'title' in df.columns else f'Article {i+1}',
-            'prediction': 'REAL' if i % 4 != 0 else 'FAKE',
-            'confidence': 0.85 + (i * 0.01) % 0.15
-        })
-
-    display_batch_results(results, confidence_threshold)
+    metrics_slot = st.empty()
+    download_slot = st.empty()
+
+    # Un seul fichier de résultats par session
+    previous = st.session_state.get('batch_results_path')
+    if previous and os.path.exists(previous):
+        os.remove(previous)
+    handle, path = tempfile.mkstemp(prefix='batch_results_', suffix='.csv')
+    os.close(handle)
+    st.session_state['batch_results_path'] = path
+
+    counts = {'total': 0, 'real': 0, 'fake': 0, 'confident': 0}
+    preview = []
+    fields = ['title'] + RESULT_FIELDS
+    with ResultWriter(path, fields) as writer:
+        for chunks_done, chunk in enumerate(iter_chunks(uploaded_file, BATCH_CONFIG['UI_CHUNK_SIZE'], max_articles), 1):
+            keep = ['title'] if 'title' in chunk.columns else []
+            rows = score_chunk(analyzer, chunk, keep)
+            writer.write(rows)
+
+            for row in rows:
+                counts['total'] += 1
+                counts['real'] += row['prediction'] == "REAL"
+                counts['fake'] += row['prediction'] == "FAKE"
+                counts['confident'] += row['confidence'] >= confidence_threshold
+            preview.extend(rows[:PREVIEW_ROWS - len(preview)])
+
+            # Progression par morceau, pas par ligne
+            progress_bar.progress(min(counts['total'] / max_articles, 1.0))
+            status_text.text(f"Analyse {counts['total']}/{max_articles}...")
+            with metrics_slot.container():
+                render_batch_metrics(counts)
+
+            # Résultats partiels : même emplacement, le bouton précédent est remplacé
+            if chunks_done % BATCH_CONFIG['DOWNLOAD_EVERY_CHUNKS'] == 0:
+                offer_download(download_slot, path, counts['total'], writer.sync(), f"batch_download_{chunks_done}")
+
+        offer_download(download_slot, path, counts['total'], writer.sync(), "batch_download_final")
     progress_bar.empty()
     status_text.empty()
+    display_batch_results(preview, counts)
+
+def offer_download(slot, path, rows_done, size, key):
+    """
+    Download button for the first `size` bytes of the results, i.e. the
+    rows_done rows written so far (no rerun on click). The file is read only
+    when the button is clicked, so buttons cost no memory during the run;
+    the download itself is still served from memory by Streamlit.
+    """
+    def read_results():
+        with open(path, 'rb') as f:
+            return f.read(size)
+
+    slot.download_button(
+        f"Télécharger les résultats ({rows_done} lignes)",
+        data=read_results,
+        file_name="batch_results.csv",
+        mime="text/csv",
+        key=key,
+        on_click="ignore"
+    )
 
 # =======================
 # Affichage des résultats
 # =======================
-def display_batch_results(results, confidence_threshold):
-    st.success("Analyse terminée !")
-    df_results = pd.DataFrame(results)
-
+def render_batch_metrics(counts):
     col1, col2, col3, col4 = st.columns(4)
-    with col1: MetricCard("Total", len(df_results), icon="📊").render()
-    with col2: MetricCard("Réels", len(df_results[df_results['prediction']=="REAL"]), icon="✅").render()
-    with col3: MetricCard("Fake", len(df_results[df_results['prediction']=="FAKE"]), icon="❌").render()
-    with col4: MetricCard("Haute confiance", len(df_results[df_results['confidence']>=confidence_threshold]), icon="🎯").render()
+    with col1: MetricCard("Total", counts['total'], icon="📊").render()
+    with col2: MetricCard("Réels", counts['real'], icon="✅").render()
+    with col3: MetricCard("Fake", counts['fake'], icon="❌").render()
+    with col4: MetricCard("Haute confiance", counts['confident'], icon="🎯").render()
 
-    st.dataframe(df_results, use_container_width=True)
+def display_batch_results(preview, counts):
+    st.success("Analyse terminée !")
+    if counts['total'] > len(preview):
+        st.caption(f"Aperçu des {len(preview)} premières lignes sur {counts['total']} (fichier complet à télécharger)")
+    st.dataframe(pd.DataFrame(preview), use_container_width=True)
@@ -135,7 +135,9 @@ def render_main_metrics(analyzer):
     
     col1, col2, col3, col4 = st.columns(4, gap="medium")
 
-    total_articles = getattr(analyzer, 'total_articles', 0)
+    # Agrégats tenus à jour par l'analyseur (pas de parcours de l'historique)
+    summary = analyzer.aggregates.summary()
+    total_articles = summary['total']
     with col1:
         st.markdown(f"""
         <div class='metric-card'>
@@ -163,7 +165,7 @@ def render_main_metrics(analyzer):
         </div>
         """, unsafe_allow_html=True)
 
-    fake_count = getattr(analyzer, 'fake_count', 0)
+    fake_count = summary['fake']
     with col3:
         st.markdown(f"""
         <div class='metric-card'>
@@ -177,7 +179,7 @@ def render_main_metrics(analyzer):
         </div>
         """, unsafe_allow_html=True)
 
-    avg_confidence = f"{getattr(analyzer, 'avg_confidence', 0):.1f}%"
+    avg_confidence = f"{summary['avg_confidence'] * 100:.1f}%"
     with col4:
         st.markdown(f"""
         <div class='metric-card'>
@@ -195,7 +197,8 @@ def render_analysis_charts(analyzer):
     """Graphiques d'analyse dans une boîte stylée"""
     st.markdown("### Analyse des Résultats")
     
-    if not hasattr(analyzer, 'results') or len(analyzer.results) == 0:
+    aggregates = analyzer.aggregates
+    if aggregates.summary()['total'] == 0:
         st.markdown("""
         <div class='info-custom'>
             <i class='fas fa-database' style='color:#3b82f6; font-size:1.2rem;'></i>
@@ -204,17 +207,15 @@ def render_analysis_charts(analyzer):
         """, unsafe_allow_html=True)
         return
 
-    df = pd.DataFrame(analyzer.results)
-
     tab1, tab2 = st.tabs(["Distribution", "Tendance Temporelle"])
     
     with tab1:
-        fig_pie = create_analysis_pie_chart(df, "Distribution des Résultats d'Analyse")
+        fig_pie = create_analysis_pie_chart(aggregates, "Distribution des Résultats d'Analyse")
         st.plotly_chart(fig_pie, use_container_width=True)
 
     with tab2:
-        if 'date' in df.columns:
-            trend_data = df.groupby('date').sum().reset_index()
+        trend_data = aggregates.trend_data()
+        if len(trend_data) > 1:
             fig_trend = create_trend_chart(trend_data, "Évolution des Détections sur la Période")
             st.plotly_chart(fig_trend, use_container_width=True)
         else:
@@ -299,7 +300,8 @@ def render_quick_analysis(analyzer):
         if analyze_btn and test_text.strip():
             with st.spinner("Analyse en cours..."):
                 test_article = {'title': 'Article Test', 'content': test_text, 'source': 'Input Utilisateur'}
-                prediction, confidence = analyzer.predict_article(test_article)
+                result = analyzer.analyze_article(test_article)
+                prediction, confidence = result['prediction'], result['confidence']
                 
                 if prediction == "FAKE":
                     st.error(f"### Résultat: FAKE NEWS\n**Niveau de confiance:** {confidence:.1%}")
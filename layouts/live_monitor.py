@@ -117,14 +117,44 @@ def fetch_and_analyze_news(news_fetcher, analyzer, query, num_articles, lang='en
             articles = news_fetcher.fetch_real_time_news([query], lang=lang)[:num_articles]
             if articles:
                 st.success(f"✅ {len(articles)} articles récupérés")
-                st.session_state.results = analyzer.analyze_news_batch(articles)
             else:
                 st.warning("❌ Aucun article trouvé")
                 st.session_state.results = []
+        
+        if articles:
+            st.session_state.results = stream_results(analyzer, articles)
     except Exception as e:
         st.error(f"❌ Erreur: {e}")
         st.session_state.results = []
 
+def stream_results(analyzer, articles):
+    """Affiche un aperçu de chaque article dès que son micro-lot est analysé."""
+    
+    results = []
+    preview = st.empty()
+    with preview.container():
+        progress_bar = st.progress(0)
+        for batch in analyzer.analyze_stream(articles):
+            for result in batch:
+                display_result_preview(result, len(results) + 1)
+                results.append(result)
+            progress_bar.progress(len(results) / len(articles))
+    
+    # La vue complète (onglets, traduction) est affichée ensuite par display_real_time_results
+    preview.empty()
+    return results
+
+def display_result_preview(result, index):
+    """Ligne compacte : titre + verdict (sans widgets, pour l'affichage en direct)."""
+    
+    pred = result['prediction']
+    badge = {"FAKE": "fake-badge", "REAL": "real-badge"}.get(pred, "uncertain-badge")
+    st.markdown(
+        f"<div class='article-card'><b>{index}. {result['title']}</b> "
+        f"<span class='prediction-badge {badge}'>{pred} • {result['confidence']:.1%}</span></div>",
+        unsafe_allow_html=True
+    )
+
 def display_real_time_results():
     """Affiche les résultats dans un format unifié."""
     
@@ -1,4 +1,5 @@
 import streamlit as st
+import time
 from components.cards import MetricCard
 from components.charts import create_confidence_gauge
 from utils.translator import t
@@ -136,6 +137,15 @@ def analyze_from_text(analyzer):
             st.rerun()
 
 def perform_url_analysis(url, analyzer):
+    # URL analysée récemment : ni extraction ni modèle
+    stored = analyzer.lookup_url(url)
+    if stored is not None:
+        analyzed_on = time.strftime('%Y-%m-%d %H:%M', time.localtime(stored['updated_at']))
+        alert_box(f"Résultat de l'analyse du {analyzed_on} (contenu non retéléchargé)", "info")
+        article = {'title': stored['title'], 'content': '', 'source': 'URL Scraping', 'url': url, 'stored_at': stored['updated_at']}
+        display_analysis_results(stored['prediction'], stored['confidence'], article, analyzer)
+        return
+    
     with st.spinner("Extraction du contenu de l'URL..."):
         scraper = URLScraper()
         scraped_data = scraper.scrape_article(url)
@@ -165,7 +175,8 @@ def perform_text_analysis(text, analyzer):
 
 def perform_analysis(article, analyzer):
     with st.spinner("Analyse en cours avec l'IA..."):
-        prediction, confidence = analyzer.predict_article(article)
+        result = analyzer.analyze_article(article)
+    prediction, confidence = result['prediction'], result['confidence']
     display_analysis_results(prediction, confidence, article, analyzer)
 
 def display_analysis_results(prediction, confidence, article, analyzer):
@@ -206,9 +217,11 @@ def display_analysis_results(prediction, confidence, article, analyzer):
     if 'url' in article:
         st.markdown(f"**URL:** {article['url']}")
     st.markdown(f"**Confiance:** {confidence:.2%}")
-    st.markdown("**Extrait du contenu:**")
-    content_preview = article['content'][:500] + "..." if len(article['content']) > 500 else article['content']
-    st.markdown(f"<div style='background: rgba(255,255,255,0.02); padding:1rem; border-radius:8px; margin:0.5rem 0;'>{content_preview}</div>", unsafe_allow_html=True)
+    # Résultat repris du store : le contenu n'a pas été retéléchargé
+    if 'stored_at' not in article:
+        st.markdown("**Extrait du contenu:**")
+        content_preview = article['content'][:500] + "..." if len(article['content']) > 500 else article['content']
+        st.markdown(f"<div style='background: rgba(255,255,255,0.02); padding:1rem; border-radius:8px; margin:0.5rem 0;'>{content_preview}</div>", unsafe_allow_html=True)
     st.markdown("</div>")
     
     st.markdown("<div class='result-card'>", unsafe_allow_html=True)
@@ -0,0 +1,205 @@
+"""
+Standalone HTTP inference server on top of RealTimeAnalyzer.
+
+Endpoints (JSON in, JSON out):
+    GET  /health          process is up
+    GET  /ready           200 once the model finished loading, 503 before
+    GET  /stats           micro-batching and per-stage latency statistics
+    POST /predict         {"title": ..., "content" | "text": ..., "id": ...}
+    POST /predict_batch   {"articles": [{...}, ...]}
+
+Concurrent /predict calls are coalesced into model batches of at most
+MAX_BATCH_SIZE articles, waiting at most MAX_WAIT_MS for a batch to fill.
+Until the model is ready, results come from the rule-based fallback.
+
+Usage:
+    python server.py --port 8000 --models-dir models
+"""
+import argparse
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import SERVER_CONFIG
+from utils.batch_io import row_to_article
+from utils.micro_batcher import MicroBatcher
+
+
+class BadRequest(Exception):
+    """Client error, answered with HTTP 400"""
+    status = 400
+
+
+class PayloadTooLarge(BadRequest):
+    """Request body over MAX_BODY_MB, answered with HTTP 413"""
+    status = 413
+
+
+def parse_article(payload):
+    """Article dict from a request object (title + content / text)"""
+    if not isinstance(payload, dict):
+        raise BadRequest("each article must be a JSON object")
+    article = row_to_article(payload)
+    if not article['title'] and not article['content']:
+        raise BadRequest("article needs a 'title', 'content' or 'text' field")
+    return article
+
+
+def public_result(result, request_id=None):
+    """Fields returned to clients for one analysis result"""
+    response = {
+        'prediction': result['prediction'],
+        'confidence': float(result['confidence']),
+        'method': result['method']
+    }
+    if request_id is not None:
+        response['id'] = request_id
+    if 'timings' in result:
+        response['timings'] = result['timings']
+    return response
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive for load tests and service clients
+
+    def do_GET(self):
+        analyzer = self.server.analyzer
+        if self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        elif self.path == '/ready':
+            ready = analyzer.is_ready()
+            self._send(200 if ready else 503, {
+                'ready': ready,
+                'status': analyzer.status,
+                'model': analyzer.get_model_info()
+            })
+        elif self.path == '/stats':
+            self._send(200, {
+                'batching': self.server.batcher.stats(),
+                'timings': analyzer.get_timing_stats()
+            })
+        else:
+            self._send(404, {'error': 'not found'})
+
+    def do_POST(self):
+        try:
+            if self.path == '/predict':
+                payload = self._read_json()
+                future = self.server.batcher.submit(parse_article(payload))
+                result = future.result(timeout=self.server.request_timeout)
+                self._send(200, public_result(result, payload.get('id')))
+            elif self.path == '/predict_batch':
+                payload = self._read_json()
+                items = payload.get('articles') if isinstance(payload, dict) else payload
+                if not isinstance(items, list):
+                    raise BadRequest("expected {'articles': [...]}")
+                if len(items) > self.server.max_request_articles:
+                    self._send(413, {'error': f"at most {self.server.max_request_articles} articles per request"})
+                    return
+                futures = self.server.batcher.submit_many([parse_article(item) for item in items])
+                results = [future.result(timeout=self.server.request_timeout) for future in futures]
+                self._send(200, {'results': [
+                    public_result(result, item.get('id')) for item, result in zip(items, results)
+                ]})
+            else:
+                self._discard_body()
+                self._send(404, {'error': 'not found'})
+        except BadRequest as e:
+            self._send(e.status, {'error': str(e)})
+        except Exception as e:
+            self._send(500, {'error': str(e)})
+
+    def _content_length(self):
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # Where the body ends is unknown: this connection can't be reused
+            self.close_connection = True
+            raise BadRequest("invalid Content-Length header")
+        return length
+
+    def _read_json(self):
+        length = self._content_length()
+        if length > self.server.max_body_bytes:
+            # Body left unread: this connection can't be reused
+            self.close_connection = True
+            raise PayloadTooLarge("request body too large")
+        try:
+            return json.loads(self.rfile.read(length) or b'null')
+        except ValueError:
+            raise BadRequest("invalid JSON")
+
+    def _discard_body(self):
+        length = self._content_length()
+        if length:
+            self.rfile.read(length)
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(analyzer, host=None, port=None, max_batch_size=None, max_wait_ms=None, verbose=False):
+    """HTTP server bound to host:port (port 0 = any free port), not started yet"""
+    host = SERVER_CONFIG['HOST'] if host is None else host
+    port = SERVER_CONFIG['PORT'] if port is None else port
+
+    def score(articles):
+        # One model batch for everything collected by the batcher
+        return [
+            result
+            for batch in analyzer.analyze_stream(articles, batch_size=len(articles))
+            for result in batch
+        ]
+
+    server = ThreadingHTTPServer((host, port), PredictionHandler)
+    server.daemon_threads = True
+    server.analyzer = analyzer
+    server.batcher = MicroBatcher(score, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    server.max_request_articles = SERVER_CONFIG['MAX_REQUEST_ARTICLES']
+    server.max_body_bytes = SERVER_CONFIG['MAX_BODY_MB'] * 1024 * 1024
+    server.request_timeout = SERVER_CONFIG['REQUEST_TIMEOUT']
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP fake-news detection service with micro-batching")
+    parser.add_argument('--host', default=SERVER_CONFIG['HOST'])
+    parser.add_argument('--port', type=int, default=SERVER_CONFIG['PORT'])
+    parser.add_argument('--models-dir', default=None)
+    parser.add_argument('--max-batch-size', type=int, default=SERVER_CONFIG['MAX_BATCH_SIZE'])
+    parser.add_argument('--max-wait-ms', type=float, default=SERVER_CONFIG['MAX_WAIT_MS'])
+    parser.add_argument('--no-store', action='store_true', help="don't read or write the analysis store")
+    parser.add_argument('--verbose', action='store_true', help="log every request")
+    args = parser.parse_args(argv)
+
+    from utils.real_time_analyzer import RealTimeAnalyzer
+    # Model loads in the background; /ready flips to 200 when it is done
+    analyzer = RealTimeAnalyzer(background=True, models_dir=args.models_dir, store=False if args.no_store else None)
+    server = create_server(analyzer, args.host, args.port, args.max_batch_size, args.max_wait_ms, args.verbose)
+    print(f"🚀 Serving on http://{args.host}:{server.server_address[1]}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+
+
+if __name__ == '__main__':
+    main()
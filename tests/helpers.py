@@ -0,0 +1,64 @@
+"""Fixtures shared by the test scripts (fake predictors, small datasets, a tiny BERT)"""
+import os
+import numpy as np
+import pandas as pd
+
+class RecordingPredictor:
+    """Stands in for BERTPredictor: labels by text length, records batch sizes and texts scored"""
+    def __init__(self, model_version="v1"):
+        self.model_version = model_version
+        self.batches = []
+        self.scored = 0
+
+    def predict_many(self, texts):
+        self.batches.append(len(texts))
+        self.scored += len(texts)
+        return [("REAL" if len(text) % 2 else "FAKE", 0.75) for text in texts]
+
+def make_articles(count, sensational_every=5):
+    """Articles with tracking-param URLs; every n-th title is caught by pre-detection (0: none)"""
+    articles = []
+    for i in range(count):
+        sensational = sensational_every and i % sensational_every == 0
+        title = "Doctors hate this miracle cure" if sensational else f"Council approves budget {i}"
+        articles.append({
+            'title': title, 'content': "x" * i, 'source': f"source-{i}",
+            'url': f"https://www.example.com/news/{i}/?utm_source=feed"
+        })
+    return articles
+
+def make_frame(count):
+    """Batch input rows: id, title, text (with newlines and quotes) and a column nobody reads"""
+    return pd.DataFrame({
+        'id': range(count),
+        'title': [f"Shocking secret {i}" if i % 3 == 0 else f"Council meeting {i}" for i in range(count)],
+        'text': ['According to study,\nresearch "shows"' if i % 2 else "" for i in range(count)],
+        'unused': ["x" * 50] * count
+    })
+
+def build_tiny_predictor(workdir):
+    """BERTPredictor with a small random BERT and a fitted classifier, in memory only"""
+    import torch
+    import transformers
+    from sklearn.linear_model import LogisticRegression
+    from utils.bert_predictor import BERTPredictor
+
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [f"word{i}" for i in range(60)]
+    vocab_path = os.path.join(workdir, "vocab.txt")
+    with open(vocab_path, "w") as f:
+        f.write("\n".join(vocab))
+
+    torch.manual_seed(0)
+    config = transformers.BertConfig(
+        vocab_size=len(vocab), hidden_size=32, num_hidden_layers=2,
+        num_attention_heads=2, intermediate_size=64
+    )
+    predictor = BERTPredictor(models_dir=workdir, load=False)
+    predictor.tokenizer = transformers.BertTokenizerFast(vocab_path)
+    predictor.bert = transformers.BertModel(config).eval()
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 32))
+    predictor.classifier = LogisticRegression().fit(X, (X[:, 0] > 0).astype(int))
+    predictor.linear_head = predictor._extract_linear_head(predictor.classifier)
+    return predictor
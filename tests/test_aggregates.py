@@ -0,0 +1,69 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+from utils.aggregates import AnalysisAggregates
+from utils.analysis_store import AnalysisStore
+from utils.real_time_analyzer import RealTimeAnalyzer
+
+def make_result(prediction, confidence, source, hour):
+    return {'prediction': prediction, 'confidence': confidence, 'source': source, 'analysis_time': hour * 3600 + 60}
+
+def test_rollups():
+    print("🧪 Testing incremental aggregates")
+    print("=" * 50)
+
+    aggregates = AnalysisAggregates(hours_kept=2, confidence_bins=10)
+    aggregates.update_many([
+        make_result("REAL", 0.95, "BBC", 10),
+        make_result("FAKE", 0.90, "Blog", 10),
+        make_result("FAKE", 1.0, "Blog", 11),
+        make_result("UNCERTAIN", 0.5, None, 12),
+        make_result("ERROR", 0.0, None, 12)
+    ])
+
+    summary = aggregates.summary()
+    assert summary['total'] == 4 and summary['real'] == 1 and summary['fake'] == 2 and summary['uncertain'] == 1
+    assert summary['errors'] == 1
+    assert abs(summary['avg_confidence'] - 3.35 / 4) < 1e-9
+    assert aggregates.top_sources(1) == [("Blog", 2)]
+
+    pie = dict(zip(*aggregates.pie_data().values.T))
+    assert pie == {'Réel': 1, 'Fake News': 2, 'Incertain': 1}
+    print(f"✅ Pie data: {pie}")
+
+    # Only the last two hours stay in the trend
+    trend = aggregates.trend_data()
+    assert list(trend.columns) == ['Date', 'Real', 'Fake', 'Uncertain']
+    assert trend[['Real', 'Fake', 'Uncertain']].values.tolist() == [[0, 1, 0], [0, 0, 1]]
+
+    histogram = aggregates.confidence_histogram()
+    assert histogram['FAKE'][9] == 2 and histogram['REAL'][9] == 1 and histogram['UNCERTAIN'][5] == 1
+    assert 'ERROR' not in histogram
+    print("✅ Hourly trend and confidence histograms")
+
+def test_analyzer_feeds_aggregates():
+    print("🧪 Testing the analysis pipeline updates the aggregates")
+    print("=" * 50)
+
+    analyzer = RealTimeAnalyzer(models_dir=tempfile.mkdtemp(), store=False)
+    articles = [{'title': f"Shocking secret {i}", 'content': "", 'source': "Blog"} for i in range(12)]
+    results = analyzer.analyze_news_batch(articles)
+
+    summary = analyzer.aggregates.summary()
+    assert summary['total'] == len(results)
+    assert summary['fake'] == sum(1 for r in results if r['prediction'] == "FAKE")
+    assert analyzer.aggregates.top_sources() == [("Blog", 12)]
+    print(f"✅ {summary['total']} results counted")
+
+    # Served again from the store: not counted twice
+    analyzer = RealTimeAnalyzer(models_dir=tempfile.mkdtemp(), store=AnalysisStore())
+    analyzer.analyze_article(articles[0])
+    analyzer.analyze_article(articles[0])
+    assert analyzer.aggregates.summary()['total'] == 1
+    print("✅ Store hits are not aggregated again")
+
+if __name__ == "__main__":
+    test_rollups()
+    test_analyzer_feeds_aggregates()
@@ -0,0 +1,110 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+from utils.analysis_store import AnalysisStore, canonical_url, content_hash
+from utils.real_time_analyzer import RealTimeAnalyzer
+from tests.helpers import RecordingPredictor, make_articles
+
+def test_canonical_url_and_hash():
+    print("🧪 Testing canonical URLs and content hashes")
+    print("=" * 50)
+
+    assert canonical_url("http://WWW.Example.com/a/?utm_source=x&b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+    assert canonical_url("example.com") == "https://example.com/"
+    assert canonical_url(None) is None
+    assert content_hash("Some  Title\ntext") == content_hash("some title text")
+    print("✅ Tracking params, www., fragments and whitespace don't change the keys")
+
+def test_store_round_trip():
+    print("🧪 Testing AnalysisStore")
+    print("=" * 50)
+
+    path = os.path.join(tempfile.mkdtemp(), "analyses.sqlite")
+    store = AnalysisStore(path)
+    store.put_many([{
+        'content_hash': "h1", 'model_version': "v1", 'url': "https://www.example.com/a/",
+        'title': "A", 'prediction': "FAKE", 'confidence': 0.9, 'method': "BERT", 'updated_at': 100.0
+    }])
+    store.put_many([{
+        'content_hash': "h1", 'model_version': "v1", 'url': None,
+        'title': "A", 'prediction': "REAL", 'confidence': 0.6, 'method': "BERT"
+    }])
+    store.close()
+
+    # Reopened from disk: latest prediction, first created_at, URL kept
+    store = AnalysisStore(path, url_max_age_hours=0)
+    row = store.get("h1", "v1")
+    assert row['prediction'] == "REAL" and row['created_at'] == 100.0
+    assert store.get_by_url("example.com/a", "v1")['content_hash'] == "h1"
+    assert store.get("h1", "v2") is None
+    assert store.stats()['entries'] == 1
+    print("✅ Upserts survive a reopen, other model versions miss")
+
+def test_analyzer_uses_store():
+    print("🧪 Testing analysis paths look in the store first")
+    print("=" * 50)
+
+    store = AnalysisStore()
+    analyzer = RealTimeAnalyzer(models_dir=tempfile.mkdtemp(), store=store)
+    predictor = RecordingPredictor()
+    analyzer.bert_predictor = predictor
+    analyzer.model_loaded = True
+    articles = make_articles(25, sensational_every=0)
+
+    first = analyzer.analyze_news_batch(articles)
+    assert predictor.scored == 25
+    second = analyzer.analyze_news_batch(articles)
+    assert predictor.scored == 25
+    strip = lambda results: [{k: v for k, v in r.items() if k != 'timings'} for r in results]
+    assert strip(first) == strip(second)
+    print("✅ Second run served from the store with identical results")
+
+    assert analyzer.analyze_article(articles[0])['prediction'] == first[0]['prediction']
+    assert analyzer.lookup_url("https://example.com/news/3")['title'] == articles[3]['title']
+    assert predictor.scored == 25
+
+    # New model version: everything is scored again
+    predictor.model_version = "v2"
+    analyzer.analyze_news_batch(articles)
+    assert predictor.scored == 50
+    assert analyzer.lookup_url(articles[3]['url'])['model_version'] == analyzer.analysis_version()
+    print("✅ A new model version invalidates stored results")
+
+class FlakyPredictor(RecordingPredictor):
+    """First call: model error (ERROR verdicts), then an exception, then real results"""
+    def predict_many(self, texts):
+        self.scored += len(texts)
+        if self.scored == len(texts):
+            return [("ERROR", 0.0) for _ in texts]
+        if self.scored == 2 * len(texts):
+            raise RuntimeError("model crashed")
+        return [("REAL", 0.75) for _ in texts]
+
+def test_failures_not_stored():
+    print("🧪 Testing failed model output is not persisted")
+    print("=" * 50)
+
+    store = AnalysisStore()
+    analyzer = RealTimeAnalyzer(models_dir=tempfile.mkdtemp(), store=store)
+    analyzer.bert_predictor = FlakyPredictor()
+    analyzer.model_loaded = True
+    article = make_articles(1, sensational_every=0)[0]
+
+    assert analyzer.analyze_article(article)['prediction'] == "ERROR"
+    fallback = analyzer.analyze_article(article)
+    assert fallback['method'] == "Rule-Based"
+    assert store.stats()['entries'] == 0
+    recovered = analyzer.analyze_article(article)
+    assert (recovered['prediction'], recovered['method']) == ("REAL", analyzer.get_model_info())
+    assert store.stats()['entries'] == 1
+    assert analyzer.analyze_article(article)['prediction'] == "REAL"
+    assert analyzer.bert_predictor.scored == 3
+    print("✅ ERROR and rule-based fallback results are scored again, real verdicts are stored")
+
+if __name__ == "__main__":
+    test_canonical_url_and_hash()
+    test_store_round_trip()
+    test_analyzer_uses_store()
+    test_failures_not_stored()
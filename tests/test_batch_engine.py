@@ -0,0 +1,81 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+from config import ANALYSIS_CONFIG, TIMING_CONFIG
+from utils.real_time_analyzer import RealTimeAnalyzer
+from tests.helpers import RecordingPredictor, make_articles
+
+def test_batch_engine():
+    print("🧪 Testing batched analyze_news_batch")
+    print("=" * 50)
+
+    analyzer = RealTimeAnalyzer(models_dir=tempfile.mkdtemp(), store=False)
+    articles = make_articles(37)
+
+    # Without a model: rule-based results, same schema
+    results = analyzer.analyze_news_batch(articles)
+    assert len(results) == len(articles)
+    for article, result in zip(articles, results):
+        expected_keys = {'prediction', 'confidence', 'analysis_time', 'method'}
+        if TIMING_CONFIG['ENABLED']:
+            expected_keys.add('timings')
+        assert set(result) == set(article) | expected_keys
+        assert result['method'] == "Rule-Based"
+        assert (result['prediction'], result['confidence']) == analyzer.rule_based_analysis(analyzer.article_text(article))
+    print("✅ Rule-based fallback keeps the result schema")
+
+    # With a model: pre-detected articles skip it, the rest go in BATCH_SIZE chunks
+    predictor = RecordingPredictor()
+    analyzer.bert_predictor = predictor
+    analyzer.model_loaded = True
+    results = analyzer.analyze_news_batch(articles)
+
+    survivors = sum(1 for a in articles if not a['title'].startswith("Doctors"))
+    batch_size = ANALYSIS_CONFIG['BATCH_SIZE']
+    assert sum(predictor.batches) == survivors
+    assert all(size == batch_size for size in predictor.batches[:-1])
+
+    expected = [analyzer.predict_article(article) for article in articles]
+    assert [(r['prediction'], r['confidence']) for r in results] == expected
+    assert [r['source'] for r in results] == [a['source'] for a in articles]
+    assert all(r['method'] == analyzer.get_model_info() for r in results)
+    print(f"✅ {survivors} articles scored in batches of {batch_size}, order preserved")
+
+    assert analyzer.analyze_news_batch([]) == []
+
+def test_analyze_stream():
+    print("🧪 Testing analyze_stream micro-batches")
+    print("=" * 50)
+
+    analyzer = RealTimeAnalyzer(models_dir=tempfile.mkdtemp(), store=False)
+    predictor = RecordingPredictor()
+    analyzer.bert_predictor = predictor
+    analyzer.model_loaded = True
+    articles = make_articles(50)
+
+    consumed = []
+    def source():
+        for article in articles:
+            consumed.append(article)
+            yield article
+
+    stream = analyzer.analyze_stream(source())
+    first = next(stream)
+
+    # First results arrive after one model batch, not after the whole list
+    assert predictor.batches == [ANALYSIS_CONFIG['BATCH_SIZE']]
+    assert len(consumed) < len(articles)
+    assert first and len(first) == len(consumed)
+    print(f"✅ First {len(first)} results after one model call ({len(consumed)}/{len(articles)} articles read)")
+
+    streamed = first + [result for batch in stream for result in batch]
+    batched = analyzer.analyze_news_batch(articles)
+    strip = lambda results: [{k: v for k, v in r.items() if k not in ('analysis_time', 'timings')} for r in results]
+    assert strip(streamed) == strip(batched)
+    print("✅ Concatenated stream equals analyze_news_batch")
+
+if __name__ == "__main__":
+    test_batch_engine()
+    test_analyze_stream()
@@ -0,0 +1,111 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import json
+import tempfile
+import pandas as pd
+from utils.batch_jobs import BatchJob, JobMismatch, job_status, read_checkpoint
+from utils.real_time_analyzer import RealTimeAnalyzer
+from tests.helpers import make_frame
+
+class CrashingAnalyzer:
+    """Delegates to a real analyzer, fails on the n-th chunk"""
+
+    def __init__(self, analyzer, crash_on):
+        self.analyzer = analyzer
+        self.crash_on = crash_on
+        self.calls = 0
+
+    def analysis_version(self):
+        return self.analyzer.analysis_version()
+
+    def analyze_stream(self, articles, batch_size=None):
+        self.calls += 1
+        if self.calls == self.crash_on:
+            raise RuntimeError("worker died")
+        return self.analyzer.analyze_stream(articles, batch_size=batch_size)
+
+def test_resume_after_crash():
+    print("🧪 Testing resumable batch jobs")
+    print("=" * 50)
+
+    folder = tempfile.mkdtemp()
+    analyzer = RealTimeAnalyzer(models_dir=folder, store=False)
+    for name in ("in.csv", "in.jsonl"):
+        source = os.path.join(folder, name)
+        if name.endswith('.csv'):
+            make_frame(47).to_csv(source, index=False)
+        else:
+            make_frame(47).to_json(source, orient='records', lines=True)
+        output = os.path.join(folder, "out_" + name.split('.')[1] + ".csv")
+
+        job = BatchJob(source, output, chunk_size=10, keep_columns=['id'], checkpoint_interval=0)
+        try:
+            job.run(CrashingAnalyzer(analyzer, crash_on=4), progress_stream=io.StringIO())
+            assert False, "the job should have failed"
+        except RuntimeError:
+            pass
+        status = job_status(output)
+        assert status['status'] == 'failed' and status['rows_done'] == 30
+        assert 0 < status['progress'] <= 1  # read-ahead position for text formats
+        print(f"✅ {name}: crash at chunk 4 leaves a checkpoint at 30 rows")
+
+        # Rows written after the last checkpoint are dropped, not duplicated
+        with open(output, 'a', encoding='utf-8') as f:
+            f.write("999,30,FAKE,0.5,partial\n")
+
+        job = BatchJob(source, output, chunk_size=10, keep_columns=['id'], checkpoint_interval=0)
+        crashing = CrashingAnalyzer(analyzer, crash_on=0)
+        assert job.run(crashing, resume=True, progress_stream=io.StringIO()) == 47
+        assert crashing.calls == 2  # only rows 30-46 scored again
+
+        scored = pd.read_csv(output)
+        assert list(scored['row']) == list(range(47))
+        assert list(scored['id']) == list(range(47))
+        expected = [analyzer.predict_article({'title': r['title'], 'content': r['text'] if isinstance(r['text'], str) else ''})[0]
+                    for r in make_frame(47).to_dict('records')]
+        assert list(scored['prediction']) == expected
+        assert job_status(output)['status'] == 'completed'
+        print(f"✅ {name}: resumed run scores only the remaining rows, output complete")
+
+def test_resume_checks():
+    print("🧪 Testing checkpoint validation")
+    print("=" * 50)
+
+    folder = tempfile.mkdtemp()
+    analyzer = RealTimeAnalyzer(models_dir=folder, store=False)
+    source = os.path.join(folder, "in.jsonl")
+    make_frame(12).to_json(source, orient='records', lines=True)
+    output = os.path.join(folder, "out.jsonl")
+
+    BatchJob(source, output, chunk_size=5, checkpoint_interval=0).run(analyzer, progress_stream=io.StringIO())
+    with open(output + '.checkpoint.json', encoding='utf-8') as f:
+        assert json.load(f)['output_bytes'] == os.path.getsize(output)
+
+    # Completed jobs are not scored again
+    crashing = CrashingAnalyzer(analyzer, crash_on=1)
+    assert BatchJob(source, output, chunk_size=5).run(crashing, resume=True) == 12
+    assert crashing.calls == 0
+
+    state = read_checkpoint(output)
+    state['status'] = 'failed'
+    state['analysis_version'] = 'rules:old'
+    with open(output + '.checkpoint.json', 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    try:
+        BatchJob(source, output, chunk_size=5).run(analyzer, resume=True)
+        assert False, "a different model version must not be mixed in"
+    except JobMismatch:
+        pass
+    try:
+        BatchJob(source, output, chunk_size=5, keep_columns=['id']).run(analyzer, resume=True)
+        assert False, "different output fields"
+    except JobMismatch:
+        pass
+    print("✅ Completed jobs skipped, model / layout changes refused")
+
+if __name__ == "__main__":
+    test_resume_after_crash()
+    test_resume_checks()
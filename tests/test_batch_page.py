@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import tempfile
+import pandas as pd
+from layouts.batch_analysis import count_rows, iter_chunks, load_file, offer_download
+from utils.batch_io import ResultWriter
+
+def make_upload(count):
+    buffer = io.StringIO()
+    pd.DataFrame({
+        'title': [f"Article {i}" for i in range(count)],
+        'text': ["Body"] * count,
+        'junk': ["x" * 20] * count
+    }).to_csv(buffer, index=False)
+    upload = io.BytesIO(buffer.getvalue().encode('utf-8'))
+    upload.name = "upload.csv"
+    return upload
+
+def test_upload_chunks():
+    print("🧪 Testing batch page chunked reading")
+    print("=" * 50)
+
+    upload = make_upload(1234)
+    assert count_rows(upload) == 1234
+    assert len(load_file(upload, nrows=5)) == 5
+
+    chunks = list(iter_chunks(upload, 500, 1100))
+    assert [len(chunk) for chunk in chunks] == [500, 500, 100]
+    assert set(chunks[0].columns) == {'title', 'text'}
+    assert list(chunks[-1].index)[:2] == [1000, 1001]
+    print("✅ 1100 of 1234 rows read in 3 chunks, only title/text parsed")
+
+class RecordingSlot:
+    """Stands in for st.empty(): keeps the last download button's arguments"""
+    def download_button(self, label, **kwargs):
+        self.label = label
+        self.kwargs = kwargs
+
+def test_partial_download():
+    print("🧪 Testing partial result downloads")
+    print("=" * 50)
+
+    path = os.path.join(tempfile.mkdtemp(), "results.csv")
+    slot = RecordingSlot()
+    with ResultWriter(path, ['row', 'prediction']) as writer:
+        writer.write([{'row': i, 'prediction': "REAL"} for i in range(3)])
+        offer_download(slot, path, 3, writer.sync(), "partial")
+        writer.write([{'row': i, 'prediction': "FAKE"} for i in range(3, 10)])
+
+        # Read on click, cut at the size given when the button was made
+        assert callable(slot.kwargs['data'])
+        partial = pd.read_csv(io.BytesIO(slot.kwargs['data']()))
+        assert partial['row'].tolist() == [0, 1, 2] and "3 lignes" in slot.label
+        offer_download(slot, path, 10, writer.sync(), "final")
+    assert pd.read_csv(io.BytesIO(slot.kwargs['data']()))['row'].tolist() == list(range(10))
+    print("✅ Buttons serve the rows written when they were offered, read only on click")
+
+if __name__ == "__main__":
+    test_upload_chunks()
+    test_partial_download()
@@ -0,0 +1,135 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from tests.helpers import build_tiny_predictor
+
+def make_texts(count, seed=0):
+    """Texts of very different token lengths, in random order"""
+    rng = np.random.default_rng(seed)
+    return [" ".join(f"word{i}" for i in rng.integers(0, 60, size=rng.integers(1, 50))) for _ in range(count)]
+
+def reference_embedding(predictor, text):
+    """One text, no padding: plain mean of BERT's last hidden state"""
+    ids = predictor.tokenizer(text, truncation=True, max_length=predictor.max_length)['input_ids']
+    with torch.no_grad():
+        hidden = predictor.bert(input_ids=torch.tensor([ids])).last_hidden_state
+    return hidden[0].mean(dim=0).numpy()
+
+def test_bucketed_embeddings():
+    print("🧪 Testing length-bucketed embeddings")
+    print("=" * 50)
+
+    predictor = build_tiny_predictor(tempfile.mkdtemp())
+    texts = make_texts(23)
+
+    # Batches of 4: six buckets, each padded to its own longest text
+    batched = predictor.get_bert_embeddings(texts, batch_size=4)
+    one_by_one = np.vstack([predictor.get_bert_embeddings([text]) for text in texts])
+    reference = np.vstack([reference_embedding(predictor, text) for text in texts])
+
+    assert batched.shape == (len(texts), predictor.bert.config.hidden_size)
+    assert np.allclose(batched, one_by_one, atol=1e-5)
+    assert np.allclose(batched, reference, atol=1e-5)
+    print(f"✅ {len(texts)} mixed-length texts: bucketed = one at a time = unpadded mean pooling")
+
+    # Same embeddings whatever the input order: rows follow the input, not the buckets
+    reverse = predictor.get_bert_embeddings(texts[::-1], batch_size=4)
+    assert np.allclose(reverse[::-1], batched, atol=1e-5)
+    print("✅ Output order follows the input across buckets")
+
+def test_long_document_windows():
+    print("🧪 Testing long-document windows")
+    print("=" * 50)
+
+    predictor = build_tiny_predictor(tempfile.mkdtemp())
+    short_text = "word1 word2 word3"
+    short_embedding = predictor.get_bert_embeddings([short_text])
+    predictor.long_document = True
+    predictor.max_length = 16
+    predictor.window_stride = 10
+    predictor.max_windows = 4
+
+    # 60 words, cut to the 4-window budget: 3 * 10 + 16 = 46 tokens with [CLS] / [SEP]
+    long_text = " ".join(f"word{i}" for i in range(60))
+    ids = predictor._encode([long_text], predictor._token_budget())[0]
+    assert len(ids) == 46
+    windows, owners = predictor._split_windows([ids])
+    content = ids[1:-1]
+    assert len(windows) == 4 and owners == [0, 0, 0, 0]
+    for index, window in enumerate(windows):
+        assert len(window) <= predictor.max_length
+        assert (window[0], window[-1]) == (ids[0], ids[-1])
+        assert window[1:-1] == content[index * 10:index * 10 + 14]
+    # Consecutive windows share max_length - 2 - stride tokens
+    assert windows[0][-5:-1] == windows[1][1:5]
+    print(f"✅ {len(content)} content tokens -> 4 windows of <= 16 tokens, stride 10")
+
+    # Short text: a single window, same embedding as without long-document mode
+    short_ids = predictor._encode([short_text], predictor._token_budget())
+    assert predictor._split_windows(short_ids) == (short_ids, [0])
+    assert np.allclose(predictor.get_bert_embeddings([short_text]), short_embedding, atol=1e-5)
+    print("✅ Short text is not split")
+
+    # Article embedding: token-weighted mean of its window embeddings
+    window_embeddings = np.vstack([predictor._embed_bucket([window]) for window in windows])
+    weights = np.array([len(window) for window in windows], dtype=np.float64)
+    expected = (window_embeddings * weights[:, None]).sum(axis=0) / weights.sum()
+    embeddings = predictor.get_bert_embeddings([long_text, short_text], batch_size=3)
+    assert np.allclose(embeddings[0], expected, atol=1e-5)
+    assert np.allclose(embeddings[1], short_embedding[0], atol=1e-5)
+    print("✅ Windows pooled back per article, weighted by their token counts")
+
+class CountingTokenizer:
+    """Wraps a tokenizer, records the texts it actually encodes"""
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.pad_token_id = tokenizer.pad_token_id
+        self.encoded = []
+
+    def __call__(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        return self.tokenizer(texts, **kwargs)
+
+def test_token_cache():
+    print("🧪 Testing the token id LRU")
+    print("=" * 50)
+
+    workdir = tempfile.mkdtemp()
+    predictor = build_tiny_predictor(workdir)
+    tokenizer = CountingTokenizer(predictor.tokenizer)
+    predictor.tokenizer = tokenizer
+    text = " ".join(f"word{i}" for i in range(30))
+
+    long_ids = predictor._encode([text, text], max_length=32)
+    assert tokenizer.encoded == [text] and long_ids[0] == long_ids[1] and len(long_ids[0]) == 32
+    # Same text, other max_length: its own entry, not the truncated ids above
+    short_ids = predictor._encode([text], max_length=8)
+    assert len(short_ids[0]) == 8 and short_ids[0] == long_ids[0][:7] + [long_ids[0][-1]]
+    assert predictor.token_cache.get((32, text)) == long_ids[0]
+    assert predictor.token_cache.get((8, text)) == short_ids[0]
+    assert predictor._encode([text], max_length=32) == [long_ids[0]]
+    assert tokenizer.encoded == [text, text]
+    print("✅ Cached per (max_length, text), each pair tokenized once")
+
+    # Fast (Rust) tokenizer gives the ids the slow BertTokenizer gave
+    import transformers
+    slow = transformers.BertTokenizer(os.path.join(workdir, "vocab.txt"))
+    samples = make_texts(20, seed=3) + [
+        "Word1, WORD2! word3's (word4)", "wörd5 café word6-word7", "", "unknownword word8"
+    ]
+    kwargs = dict(truncation=True, padding=False, max_length=predictor.max_length)
+    assert tokenizer.tokenizer(samples, **kwargs)['input_ids'] == slow(samples, **kwargs)['input_ids']
+    print("✅ BertTokenizerFast ids match BertTokenizer")
+
+if __name__ == "__main__":
+    test_bucketed_embeddings()
+    test_long_document_windows()
+    test_token_cache()
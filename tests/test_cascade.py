@@ -0,0 +1,166 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import joblib
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import make_pipeline
+from sklearn.svm import LinearSVC
+from utils.bert_predictor import clean_text_for_bert
+from utils.cascade import CascadeScorer
+
+REAL_TEXTS = [
+    "council approves annual budget after public debate",
+    "officials confirm new school funding for the district",
+    "ministry publishes quarterly employment figures",
+    "court upholds ruling on regional water rights",
+    "city council votes on transport budget",
+    "officials publish report on school funding",
+]
+FAKE_TEXTS = [
+    "shocking secret cure doctors hate revealed",
+    "miracle pill melts fat overnight secret revealed",
+    "celebrity shocking secret they hide from you",
+    "doctors hate this one weird miracle trick",
+    "shocking miracle cure hidden by doctors",
+    "secret trick they hide revealed overnight",
+]
+TRANSLATIONS = {"Le conseil approuve le budget annuel": "Council approves annual budget"}
+
+class StubBERT:
+    """Stands in for BERTPredictor: translates from a fixed table, records escalated texts"""
+    bert = object()
+
+    def __init__(self):
+        self.escalated = []
+
+    def translate_to_english(self, text):
+        return TRANSLATIONS.get(text, text)
+
+    def predict_many(self, texts, translated=False):
+        assert translated
+        self.escalated.extend(texts)
+        return [("REAL", 0.99) for _ in texts]
+
+def save_models(folder, labels=(0, 1), pipeline=False):
+    texts = REAL_TEXTS + FAKE_TEXTS
+    y = [labels[1]] * len(REAL_TEXTS) + [labels[0]] * len(FAKE_TEXTS)
+    if pipeline:
+        joblib.dump(make_pipeline(TfidfVectorizer(), MultinomialNB()).fit(texts, y), os.path.join(folder, "nb_model.pkl"))
+    else:
+        vectorizer = TfidfVectorizer().fit(texts)
+        joblib.dump(vectorizer, os.path.join(folder, "tfidf_vectorizer.pkl"))
+        joblib.dump(LinearSVC().fit(vectorizer.transform(texts), y), os.path.join(folder, "svm_model.pkl"))
+    return folder
+
+ARTICLES = [
+    "Council approves annual budget after public debate!",
+    "SHOCKING secret cure doctors hate: http://example.com/cure",
+    "Officials publish report on the regional budget",
+    "Secret trick revealed at the council",
+    "Le conseil approuve le budget annuel",
+]
+
+def test_cascade_band_and_escalation():
+    print("🧪 Testing the TF-IDF → BERT cascade")
+    print("=" * 50)
+
+    bert = StubBERT()
+    scorer = CascadeScorer(bert, models_dir=save_models(tempfile.mkdtemp()), uncertainty_margin=0.0)
+    assert scorer.loaded and scorer.kind == 'separate'
+    cleaned = [clean_text_for_bert(bert.translate_to_english(text)) for text in ARTICLES]
+    margins = scorer._margins(cleaned)
+
+    # Empty band: nothing escalated, labels follow the model's own predictions
+    results = scorer.score_texts(ARTICLES)
+    expected = ["REAL" if label == 1 else "FAKE" for label in scorer.model.predict(scorer.vectorizer.transform(cleaned))]
+    assert [label for label, _ in results] == expected
+    assert all(0.5 <= confidence <= 1.0 for _, confidence in results)
+    assert bert.escalated == []
+    print("✅ Stage-1 labels match LinearSVC.predict through classes_")
+
+    # Translated before stage 1: the French article scores like its English version
+    assert results[4] == scorer.score_texts(["Council approves annual budget"])[0]
+    print("✅ Stage 1 sees the translated, cleaned text")
+
+    # Band between the smallest and largest |margin|: only the articles inside go to BERT
+    scorer.uncertainty_margin = float(np.median(np.abs(margins)))
+    scorer.reset_stats()
+    results = scorer.score_texts(ARTICLES)
+    inside = [i for i, margin in enumerate(margins) if abs(margin) < scorer.uncertainty_margin]
+    assert 0 < len(inside) < len(ARTICLES)
+    assert bert.escalated == [bert.translate_to_english(ARTICLES[i]) for i in inside]
+    assert all(results[i] == ("REAL", 0.99) for i in inside)
+
+    stats = scorer.get_stats()
+    assert stats['articles'] == len(ARTICLES) and stats['escalated'] == len(inside)
+    assert stats['escalation_rate'] == len(inside) / len(ARTICLES)
+    assert stats['stage1_ms_per_article'] > 0 and stats['stage2_ms_per_article'] > 0
+    print(f"✅ {len(inside)}/{len(ARTICLES)} articles escalated to predict_many, stats agree")
+
+    # No BERT loaded: uncertain articles keep the stage-1 guess at 0.5
+    scorer.bert_predictor = None
+    scorer.reset_stats()
+    results = scorer.score_texts(ARTICLES)
+    assert all(results[i][1] == 0.5 for i in inside)
+    assert scorer.get_stats()['escalated'] == 0
+    assert scorer.score_texts([]) == []
+
+def test_cascade_probabilistic_pipeline():
+    print("🧪 Testing the cascade with a predict_proba pipeline and string labels")
+    print("=" * 50)
+
+    scorer = CascadeScorer(StubBERT(), models_dir=save_models(tempfile.mkdtemp(), labels=("FAKE", "REAL"), pipeline=True),
+                           uncertainty_margin=0.0)
+    assert scorer.kind == 'pipeline' and not hasattr(scorer.model, 'decision_function')
+    assert list(scorer.model.classes_) == ["FAKE", "REAL"]
+
+    cleaned = [clean_text_for_bert(scorer.bert_predictor.translate_to_english(text)) for text in ARTICLES]
+    probabilities = scorer.model.predict_proba(cleaned)[:, 1]
+    results = scorer.score_texts(ARTICLES)
+    assert [label for label, _ in results] == list(scorer.model.predict(cleaned))
+    # Log-odds margin: the confidence is the probability of the predicted class
+    for (_, confidence), probability in zip(results, probabilities):
+        assert np.isclose(confidence, max(probability, 1 - probability))
+    print("✅ Log-odds margins from predict_proba, labels mapped from classes_")
+
+class CountingTranslator:
+    """Stands in for deep_translator.GoogleTranslator: counts network round-trips"""
+    calls = 0
+
+    def __init__(self, source, target):
+        pass
+
+    def translate(self, text):
+        CountingTranslator.calls += 1
+        return text
+
+def test_cascade_translates_once(monkeypatch):
+    print("🧪 Testing escalated articles are translated once")
+    print("=" * 50)
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    deep_translator = pytest.importorskip("deep_translator")
+    from tests.helpers import build_tiny_predictor
+
+    monkeypatch.setattr(deep_translator, "GoogleTranslator", CountingTranslator)
+    CountingTranslator.calls = 0
+    predictor = build_tiny_predictor(tempfile.mkdtemp())
+    # Huge band: every article goes on to BERT
+    scorer = CascadeScorer(predictor, models_dir=save_models(tempfile.mkdtemp()), uncertainty_margin=1e9)
+
+    # Common English punctuation fails translate_to_english's English check
+    articles = ["Budget: council approves 5% rise (final)", "Secret cure - doctors hate it: revealed"]
+    results = scorer.score_texts(articles)
+    assert scorer.get_stats()['escalated'] == len(articles)
+    assert {label for label, _ in results} <= {"REAL", "FAKE"}
+    assert CountingTranslator.calls == len(articles)
+    print(f"✅ {len(articles)} escalated articles, {CountingTranslator.calls} translator calls")
+
+if __name__ == "__main__":
+    test_cascade_band_and_escalation()
+    test_cascade_probabilistic_pipeline()
@@ -0,0 +1,89 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import json
+import tempfile
+import pytest
+pa = pytest.importorskip("pyarrow")
+import pyarrow.feather
+import pyarrow.ipc
+import pyarrow.parquet
+import pandas as pd
+from utils.batch_io import ChunkReader
+from utils.real_time_analyzer import RealTimeAnalyzer
+from layouts.batch_analysis import count_rows, iter_chunks
+import batch_score
+
+def make_table(count):
+    return pa.table({
+        'id': list(range(count)),
+        'title': [f"Shocking secret {i}" if i % 3 == 0 else f"Council meeting {i}" for i in range(count)],
+        'text': ["According to study, research shows" if i % 2 else "" for i in range(count)],
+        'unused': ["x" * 50] * count
+    })
+
+def write_inputs(folder, table):
+    paths = {
+        'parquet': os.path.join(folder, "in.parquet"),
+        'feather': os.path.join(folder, "in.feather"),
+        'stream': os.path.join(folder, "in.arrows")
+    }
+    # Several row groups / record batches, not aligned with the chunk size
+    pa.parquet.write_table(table, paths['parquet'], row_group_size=8)
+    pa.feather.write_feather(table, paths['feather'], chunksize=12)
+    with pa.ipc.new_stream(paths['stream'], table.schema) as writer:
+        writer.write_table(table, max_chunksize=30)
+    return paths
+
+def test_columnar_chunk_reader():
+    print("🧪 Testing Parquet / Arrow chunked reading")
+    print("=" * 50)
+
+    folder = tempfile.mkdtemp()
+    paths = write_inputs(folder, make_table(25))
+
+    for name, path in paths.items():
+        reader = ChunkReader(path, chunk_size=10, columns=['title', 'text'])
+        chunks = list(reader)
+        assert sum(len(chunk) for chunk in chunks) == 25, name
+        assert max(len(chunk) for chunk in chunks) <= 10, name
+        assert set(chunks[0].columns) == {'title', 'text'}, name
+        assert list(pd.concat(chunks).index) == list(range(25)), name
+        assert reader.position == reader.total_bytes, name
+    print("✅ Parquet, Feather and Arrow stream: projected columns, chunks of at most 10 rows")
+
+    with open(paths['parquet'], 'rb') as f:
+        upload = io.BytesIO(f.read())
+    upload.name = "upload.parquet"
+    assert count_rows(upload) == 25
+    chunks = list(iter_chunks(upload, 10, 22))
+    assert sum(len(chunk) for chunk in chunks) == 22
+    assert set(chunks[0].columns) == {'title', 'text'}
+    print("✅ Batch page reads Parquet uploads with a row limit")
+
+def test_batch_score_parquet():
+    print("🧪 Testing batch_score on Parquet")
+    print("=" * 50)
+
+    folder = tempfile.mkdtemp()
+    table = make_table(23)
+    source = write_inputs(folder, table)['parquet']
+    output = os.path.join(folder, "scored.jsonl")
+
+    analyzer = RealTimeAnalyzer(models_dir=folder, store=False)
+    args = batch_score.build_parser().parse_args([source, output, '--chunk-size', '7', '--keep', 'id'])
+    assert batch_score.run(args, analyzer=analyzer) == 23
+
+    with open(output, encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+    assert [row['id'] for row in rows] == list(range(23))
+    for row, record in zip(rows, table.to_pylist()):
+        article = {'title': record['title'], 'content': record['text']}
+        assert (row['prediction'], row['confidence']) == analyzer.predict_article(article)
+    print(f"✅ {len(rows)} Parquet rows scored, same results as predict_article")
+
+if __name__ == "__main__":
+    test_columnar_chunk_reader()
+    test_batch_score_parquet()
@@ -0,0 +1,46 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import numpy as np
+from utils.embedding_cache import EmbeddingCache
+
+def test_embedding_cache():
+    print("🧪 Testing Embedding Cache")
+    print("=" * 50)
+
+    db_path = os.path.join(tempfile.mkdtemp(), "embeddings.sqlite")
+    vector_bytes = 768 * 4
+
+    # Memory tier holds 2 vectors, disk tier roughly 5
+    cache = EmbeddingCache(db_path, memory_entries=2, max_disk_bytes=vector_bytes * 5, model_version="v1")
+    keys = [cache.make_key(f"article {i}") for i in range(3)]
+    cache.put_many({key: np.full(768, i, dtype=np.float32) for i, key in enumerate(keys)})
+
+    found = cache.get_many(keys)
+    stats = cache.stats()
+    print(f"   Stats after first lookup: {stats}")
+    assert len(found) == 3
+    assert stats['hits_memory'] == 2 and stats['hits_disk'] == 1
+    assert float(found[keys[2]][0]) == 2.0
+    cache.close()
+
+    # Disk tier survives a restart
+    reopened = EmbeddingCache(db_path, max_disk_bytes=vector_bytes * 5, model_version="v1")
+    assert len(reopened.get_many(keys)) == 3
+
+    # A new model version never sees old vectors
+    other_version = EmbeddingCache(db_path, model_version="v2")
+    new_keys = [other_version.make_key(f"article {i}") for i in range(3)]
+    assert other_version.get_many(new_keys) == {}
+    assert other_version.stats()['misses'] == 3
+
+    # Size-based eviction keeps the disk tier under budget
+    many = {reopened.make_key(f"bulk {i}"): np.zeros(768, dtype=np.float32) for i in range(20)}
+    reopened.put_many(many)
+    assert reopened.stats()['disk_bytes'] <= vector_bytes * 5
+    print("✅ Embedding cache OK")
+
+if __name__ == "__main__":
+    test_embedding_cache()
@@ -0,0 +1,86 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils import http_session
+from utils.url_scraper import URLScraper
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        if self.path == '/flaky' and self.server.failures_left > 0:
+            self.server.failures_left -= 1
+            self._send(503, b"busy")
+        else:
+            body = b"<html><head><title>Stub</title></head><body><article><p>" + b"Stub article text. " * 30 + b"</p></article></body></html>"
+            self._send(200, body)
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.failures_left = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def test_keep_alive_and_retries():
+    print("🧪 Testing shared HTTP session")
+    print("=" * 50)
+
+    server, base = start_stub()
+    try:
+        session = http_session.get_session()
+        assert http_session.get_session() is session
+        for _ in range(10):
+            assert http_session.get(base + '/page').status_code == 200
+        assert server.connections == 1
+        print("✅ 10 requests to one host over a single keep-alive connection")
+
+        server.failures_left = 2
+        response = http_session.get(base + '/flaky')
+        assert response.status_code == 200 and server.failures_left == 0
+
+        server.failures_left = 10
+        assert http_session.get(base + '/flaky').status_code == 503
+        assert server.failures_left == 10 - (http_session.API_CONFIG['MAX_RETRIES'] + 1)
+        print("✅ 503s retried with backoff, at most MAX_RETRIES times")
+
+        result = URLScraper().scrape_with_bs4(base + '/article')
+        assert result['success'] and "Stub article text." in result['content']
+        print("✅ URLScraper fetches through the shared session")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_backoff_is_jittered():
+    retry = http_session.make_retry()
+    assert retry.get_backoff_time() == 0
+    for _ in range(3):
+        retry = retry.increment(method='GET', url='/x')
+    waits = {retry.get_backoff_time() for _ in range(20)}
+    ceiling = min(http_session.HTTP_CONFIG['BACKOFF_MAX'], http_session.HTTP_CONFIG['BACKOFF_FACTOR'] * 4)
+    assert len(waits) > 1 and all(0 <= wait <= ceiling for wait in waits)
+    assert http_session.default_timeout(30) == (http_session.HTTP_CONFIG['CONNECT_TIMEOUT'], 30)
+
+if __name__ == "__main__":
+    test_keep_alive_and_retries()
+    test_backoff_is_jittered()
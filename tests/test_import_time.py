@@ -0,0 +1,62 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import subprocess
+import pytest
+from config import STARTUP_CONFIG
+
+pytest.importorskip("streamlit")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must not be imported by `import app`: they load on the pages that need them
+HEAVY_MODULES = [
+    'torch', 'transformers', 'sentence_transformers', 'duckduckgo_search',
+    'newspaper', 'nltk', 'deep_translator', 'sklearn', 'plotly.express', 'bs4'
+]
+
+def import_app():
+    """Import app in a fresh interpreter; return (cumulative import µs, heavy modules loaded)"""
+    code = (
+        "import sys, json, app; "
+        f"print(json.dumps(sorted(set({HEAVY_MODULES!r}) & set(sys.modules))))"
+    )
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=300
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if line.startswith('import time:') and len(parts) == 3 and parts[2].strip() == 'app':
+            cumulative_us = int(parts[1])
+    assert cumulative_us is not None, "no importtime entry for app"
+
+    loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    return cumulative_us, loaded
+
+def test_import_time():
+    print("🧪 Testing cold import time of app.py")
+    print("=" * 50)
+
+    budget_ms = float(os.environ.get('IMPORT_TIME_BUDGET_MS', STARTUP_CONFIG['IMPORT_TIME_BUDGET_MS']))
+
+    # Fastest of a few fresh interpreters to damp scheduler noise
+    runs = [import_app() for _ in range(3)]
+    best_ms = min(us for us, _ in runs) / 1000
+    print(f"⏱️ import app: {best_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+
+    loaded = runs[0][1]
+    assert not loaded, f"heavy modules imported by app: {loaded}"
+    print("✅ No heavy dependency imported at startup")
+
+    assert best_ms <= budget_ms, f"import app took {best_ms:.0f} ms > {budget_ms:.0f} ms budget"
+    print("✅ Cold import within budget")
+
+if __name__ == "__main__":
+    test_import_time()
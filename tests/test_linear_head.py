@@ -0,0 +1,46 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.ensemble import RandomForestClassifier
+from utils.bert_predictor import BERTPredictor
+
+def check_against_sklearn(predictor, classifier, X, expect_fast_path=True):
+    predictor.classifier = classifier
+    predictor.linear_head = predictor._extract_linear_head(classifier)
+    assert (predictor.linear_head is not None) == expect_fast_path
+
+    predictions, confidences = predictor._classify(X)
+    assert np.array_equal(predictions, classifier.predict(X))
+    assert np.allclose(confidences, classifier.predict_proba(X).max(axis=1), atol=1e-9)
+
+def test_linear_head():
+    print("🧪 Testing fused predict/predict_proba fast path")
+    print("=" * 50)
+
+    # No model files: only the classification helpers are exercised
+    predictor = BERTPredictor(models_dir=tempfile.mkdtemp())
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(300, 768))
+    y_binary = (X[:, 0] + 0.5 * X[:, 1] > 0).astype(int)
+    y_multi = np.digitize(X[:, 0], [-0.5, 0.5])
+
+    check_against_sklearn(predictor, LogisticRegression(max_iter=1000).fit(X, y_binary), X)
+    print("✅ Binary LogisticRegression matches sklearn")
+
+    check_against_sklearn(predictor, LogisticRegression(max_iter=1000).fit(X, y_multi), X)
+    print("✅ Multinomial LogisticRegression matches sklearn")
+
+    check_against_sklearn(predictor, LogisticRegression(solver='liblinear').fit(X, y_multi), X)
+    print("✅ One-vs-rest LogisticRegression matches sklearn")
+
+    forest = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y_binary)
+    check_against_sklearn(predictor, forest, X, expect_fast_path=False)
+    print("✅ Other estimators fall back to sklearn")
+
+if __name__ == "__main__":
+    test_linear_head()
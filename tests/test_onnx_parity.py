@@ -0,0 +1,75 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("onnxruntime")
+transformers = pytest.importorskip("transformers")
+
+from utils.onnx_backend import OnnxBertEncoder, export_bert_to_onnx
+from tests.helpers import build_tiny_predictor
+
+def test_onnx_parity():
+    print("🧪 Testing ONNX / torch embedding parity")
+    print("=" * 50)
+
+    workdir = tempfile.mkdtemp()
+    predictor = build_tiny_predictor(workdir)
+
+    # Buckets of different lengths exercise the dynamic batch/sequence axes
+    buckets = [
+        [[2, 10, 11, 3]],
+        [[2, 12, 13, 14, 15, 3], [2, 16, 3]],
+        [[2] + list(range(5, 60)) + [3], [2, 20, 21, 3], [2, 3]]
+    ]
+    torch_embeddings = [predictor._embed_bucket(ids) for ids in buckets]
+
+    onnx_path = os.path.join(workdir, "bert_model.onnx")
+    assert export_bert_to_onnx(predictor.bert, onnx_path)
+    predictor.onnx_encoder = OnnxBertEncoder(onnx_path)
+    onnx_embeddings = [predictor._embed_bucket(ids) for ids in buckets]
+
+    for expected, actual in zip(torch_embeddings, onnx_embeddings):
+        diff = np.abs(expected - actual).max()
+        print(f"   Max abs diff: {diff:.2e}")
+        assert expected.shape == actual.shape
+        assert np.allclose(expected, actual, atol=1e-4)
+    print("✅ ONNX embeddings match torch")
+
+def test_onnx_export_follows_weights():
+    print("🧪 Testing ONNX export is redone when BERT is retrained")
+    print("=" * 50)
+
+    workdir = tempfile.mkdtemp()
+    predictor = build_tiny_predictor(workdir)
+    bert_path = os.path.join(workdir, "bert_model")
+    predictor.bert.save_pretrained(bert_path)
+    onnx_path = os.path.join(workdir, "bert_model.onnx")
+    ids = [[2, 10, 11, 12, 3]]
+
+    predictor.onnx_encoder = predictor._load_onnx_encoder(bert_path)
+    assert predictor.onnx_encoder is not None
+    exported_at = os.path.getmtime(onnx_path)
+    predictor._load_onnx_encoder(bert_path)
+    assert os.path.getmtime(onnx_path) == exported_at
+    print("✅ Unchanged weights: exported graph reused")
+
+    # "Retrained" model: new weights saved over the old ones
+    torch.manual_seed(1)
+    predictor.bert = transformers.BertModel(predictor.bert.config).eval()
+    predictor.bert.save_pretrained(bert_path)
+    for name in os.listdir(bert_path):
+        os.utime(os.path.join(bert_path, name), (exported_at + 10, exported_at + 10))
+    predictor.onnx_encoder = None
+    expected = predictor._embed_bucket(ids)
+    predictor.onnx_encoder = predictor._load_onnx_encoder(bert_path)
+    assert np.allclose(expected, predictor._embed_bucket(ids), atol=1e-4)
+    print("✅ New weights: graph exported again, embeddings follow the new model")
+
+if __name__ == "__main__":
+    test_onnx_parity()
+    test_onnx_export_follows_weights()
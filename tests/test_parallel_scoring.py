@@ -0,0 +1,76 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import multiprocessing
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from utils.parallel_scoring import ParallelScorer
+from tests.helpers import build_tiny_predictor
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_parallel_scoring():
+    print("🧪 Testing process-pool scoring")
+    print("=" * 50)
+
+    predictor = build_tiny_predictor(tempfile.mkdtemp())
+    rng = np.random.default_rng(1)
+    texts = [" ".join(f"word{i}" for i in rng.integers(0, 60, size=rng.integers(1, 40))) for _ in range(45)]
+    expected = predictor.predict_many(texts)
+
+    def same_results(results):
+        # Shards are padded differently from one big batch: allow float noise
+        return ([label for label, _ in results] == [label for label, _ in expected]
+                and np.allclose([c for _, c in results], [c for _, c in expected], atol=1e-5))
+
+    with ParallelScorer(predictor=predictor, workers=2, shard_size=7, start_method='fork') as scorer:
+        assert same_results(scorer.score(texts))
+    print(f"✅ {len(texts)} texts scored by 2 forked workers, order preserved")
+
+    assert same_results(ParallelScorer(predictor=predictor, workers=1, shard_size=7).score(texts))
+    print("✅ Single-worker mode scores in-process")
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_parallel_scoring_onnx():
+    print("🧪 Testing forked workers with the ONNX backend")
+    print("=" * 50)
+    pytest.importorskip("onnxruntime")
+
+    workdir = tempfile.mkdtemp()
+    predictor = build_tiny_predictor(workdir)
+    predictor.backend = 'onnx'
+    predictor.bert.save_pretrained(os.path.join(workdir, "bert_model"))
+    predictor.onnx_encoder = predictor._load_onnx_encoder()
+    assert predictor.onnx_encoder is not None
+
+    texts = [f"word{i} word{i + 1} word{i + 2}" for i in range(20)]
+    expected = predictor.predict_many(texts)
+    assert {label for label, _ in expected} <= {"REAL", "FAKE"}
+
+    # Each worker reopens its own ONNX session from the exported graph
+    with ParallelScorer(predictor=predictor, workers=2, shard_size=4, start_method='fork') as scorer:
+        results = scorer.score(texts)
+    assert [label for label, _ in results] == [label for label, _ in expected]
+    assert np.allclose([c for _, c in results], [c for _, c in expected], atol=1e-4)
+    print("✅ ONNX workers return the same labels as the parent")
+
+def test_worker_load_failure():
+    print("🧪 Testing a worker that can't load the model")
+    print("=" * 50)
+
+    predictor = build_tiny_predictor(tempfile.mkdtemp())
+    # Spawned workers load from models_dir, which holds no model files
+    with ParallelScorer(predictor=predictor, workers=2, shard_size=4, start_method='spawn') as scorer:
+        with pytest.raises(RuntimeError, match="could not load the model"):
+            scorer.score(["word1 word2"] * 8)
+    print("✅ Load failure raised instead of UNCERTAIN results")
+
+if __name__ == "__main__":
+    test_parallel_scoring()
+    test_parallel_scoring_onnx()
+    test_worker_load_failure()
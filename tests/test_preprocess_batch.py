@@ -0,0 +1,84 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import numpy as np
+import pandas as pd
+import pytest
+from utils.bert_predictor import BERTPredictor
+import utils.preprocess as preprocess
+
+SAMPLES = [
+    "Breaking: Officials CONFIRM the <b>new</b> budget!\nRead more at https://example.com/a?b=1",
+    "   ",
+    "",
+    None,
+    float('nan'),
+    42,
+    "Visit www.fake-news.net <a href='x'>NOW</a>!!! Doctors hate this 100% secret...",
+    "Multi\nline\ttext   with\r\nodd   spacing and émojis 🚀 and l'apostrophe",
+    "<div>\n<p>tag across</p>\n</div> lines",
+]
+
+def nltk_data_available():
+    try:
+        import nltk
+        for resource in ('corpora/stopwords', 'corpora/wordnet'):
+            nltk.data.find(resource)
+        return True
+    except (ImportError, LookupError):
+        return False
+
+def test_bert_batch_cleaning():
+    print("🧪 Testing BERTPredictor.preprocess_texts")
+    print("=" * 50)
+
+    predictor = BERTPredictor(models_dir=tempfile.mkdtemp(), load=False)
+    expected = [predictor.preprocess_text(text) for text in SAMPLES]
+
+    assert predictor.preprocess_texts(SAMPLES) == expected
+    print("✅ List input matches preprocess_text")
+
+    series = pd.Series(SAMPLES, index=range(100, 100 + len(SAMPLES)))
+    result = predictor.preprocess_texts(series)
+    assert list(result.index) == list(series.index)
+    assert result.tolist() == expected
+    print("✅ Series input keeps its index")
+
+    assert predictor.preprocess_texts([]) == []
+
+def test_series_embeddings():
+    print("🧪 Testing get_bert_embeddings with a Series")
+    print("=" * 50)
+
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    from tests.helpers import build_tiny_predictor
+
+    predictor = build_tiny_predictor(tempfile.mkdtemp())
+    texts = ["word1 word2 word3", "word4", "word5 word6"]
+    series = pd.Series(texts, index=[7, 3, 5])
+
+    expected = predictor.get_bert_embeddings(texts)
+    assert np.allclose(predictor.get_bert_embeddings(series), expected, atol=1e-6)
+    assert predictor.get_bert_embeddings(pd.Series([], dtype=object)).shape == (0, 32)
+    print("✅ Series input gives the same embeddings as a list, in order")
+
+@pytest.mark.skipif(not nltk_data_available(), reason="NLTK stopwords/wordnet not installed")
+def test_nltk_batch_cleaning():
+    print("🧪 Testing utils.preprocess.preprocess_texts")
+    print("=" * 50)
+
+    expected = [preprocess.preprocess_text(text) for text in SAMPLES]
+    assert preprocess.preprocess_texts(SAMPLES) == expected
+
+    series = pd.Series(SAMPLES)
+    assert preprocess.preprocess_texts(series).tolist() == expected
+    print("✅ Batch NLTK cleaning matches preprocess_text")
+
+if __name__ == "__main__":
+    test_bert_batch_cleaning()
+    test_series_embeddings()
+    if nltk_data_available():
+        test_nltk_batch_cleaning()
@@ -0,0 +1,84 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import re
+import json
+import random
+import tempfile
+from utils.rules import RuleEngine, load_rules, DEFAULT_RULES
+
+# Reference implementation: the per-pattern loops the engine replaces
+def reference_pre_detection(text, rules):
+    text_lower = text.lower()
+    for rule in rules['pre_detection']['rules']:
+        if re.search(rule['pattern'], text_lower):
+            return True, rules['pre_detection']['confidence']
+    return None, None
+
+def reference_rule_based(text, rules):
+    text_lower = text.lower()
+    fake = rules['indicators']['fake']
+    reliable = rules['indicators']['reliable']
+    fake_score = sum(fake['weight'] for word in fake['terms'] if word in text_lower)
+    reliability_score = sum(reliable['weight'] for word in reliable['terms'] if word in text_lower)
+    total_score = reliability_score - fake_score
+    if total_score >= 2:
+        return "REAL", 0.8
+    elif total_score <= -1:
+        return "FAKE", 0.9
+    return "UNCERTAIN", 0.5
+
+def random_texts(count):
+    random.seed(7)
+    vocabulary = (
+        "the council approved budget on Monday according to study research shows "
+        "Official Report experts say peer-reviewed journal university study students "
+        "breaking shocking secret hidden miracle cure instant weight loss alien abduction "
+        "ghost killed supernatural killer government 2026 2019 zombie bigfoot loch ness "
+        "doctors hate one weird trick they don't want you to know hoaxes alerts"
+    ).split()
+    return [" ".join(random.choices(vocabulary, k=random.randint(0, 40))) for _ in range(count)]
+
+def test_rule_engine_matches_reference():
+    print("🧪 Testing compiled rule engine against per-pattern loops")
+    print("=" * 50)
+
+    rules = load_rules()
+    texts = random_texts(3000)
+    engine = RuleEngine(rules)
+
+    for text in texts:
+        assert engine.pre_detection(text) == reference_pre_detection(text, rules), text
+        assert engine.rule_based(text) == reference_rule_based(text, rules), text
+        matches = engine.scan(text)
+        assert bool(matches.pre_detection) == (reference_pre_detection(text, rules)[0] is not None)
+    print("✅ Same verdicts as the per-pattern loops")
+
+def test_rules_file_fallback():
+    print("🧪 Testing rules file loading")
+    print("=" * 50)
+
+    assert load_rules()['schema'] == 1
+    assert load_rules(os.path.join(tempfile.mkdtemp(), "missing.json")) is DEFAULT_RULES
+
+    path = os.path.join(tempfile.mkdtemp(), "rules.json")
+    broken = json.loads(json.dumps(DEFAULT_RULES))
+    broken['pre_detection']['rules'][0]['pattern'] = "(unclosed"
+    with open(path, 'w') as f:
+        json.dump(broken, f)
+    assert load_rules(path) is DEFAULT_RULES
+
+    custom = json.loads(json.dumps(DEFAULT_RULES))
+    custom['version'] = "test"
+    custom['indicators']['fake']['terms'].append("clickbait")
+    with open(path, 'w') as f:
+        json.dump(custom, f)
+    engine = RuleEngine.from_file(path)
+    assert engine.version == "test"
+    assert engine.rule_based("Clickbait headline") == ("FAKE", 0.9)
+    print("✅ Missing or invalid files fall back to the built-in rules")
+
+if __name__ == "__main__":
+    test_rule_engine_matches_reference()
+    test_rules_file_fallback()
@@ -0,0 +1,100 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils.url_scraper import URLScraper
+
+PAGE = (b"<html><head><title>Stub page title here</title></head><body><article><p>"
+        + b"Council members approved the annual budget after a long public debate. " * 10
+        + b"</p></article></body></html>")
+
+class SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        site = self.server
+        with site.lock:
+            site.active += 1
+            site.max_active = max(site.max_active, site.active)
+            site.starts.append(time.monotonic())
+        time.sleep(site.delay)
+        with site.lock:
+            site.active -= 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(site.page)))
+        self.end_headers()
+        self.wfile.write(site.page)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_site(delay, page=PAGE):
+    site = ThreadingHTTPServer(('127.0.0.1', 0), SiteHandler)
+    site.daemon_threads = True
+    # Clients that gave up close their connection mid-response
+    site.handle_error = lambda request, client_address: None
+    site.lock = threading.Lock()
+    site.delay = delay
+    site.page = page
+    site.active = site.max_active = 0
+    site.starts = []
+    threading.Thread(target=site.serve_forever, daemon=True).start()
+    return site, f"http://127.0.0.1:{site.server_address[1]}"
+
+def test_scrape_many():
+    print("🧪 Testing concurrent scraping with per-host limits")
+    print("=" * 50)
+
+    slow, slow_base = start_site(delay=2.0)
+    fast, fast_base = start_site(delay=0.05)
+    try:
+        urls = [f"{slow_base}/a{i}" for i in range(3)] + [f"{fast_base}/b{i}" for i in range(8)]
+        start = time.monotonic()
+        finished = []
+        for url, result in URLScraper().scrape_many(urls, max_workers=4, per_host=2, host_interval=0.1, deadline=0.5):
+            finished.append((url, result, time.monotonic() - start))
+
+        assert sorted(url for url, _, _ in finished) == sorted(urls)
+        fast_results = [(result, at) for url, result, at in finished if url.startswith(fast_base)]
+        slow_results = [(result, at) for url, result, at in finished if url.startswith(slow_base)]
+        assert all(result['success'] and "annual budget" in result['content'] for result, _ in fast_results)
+        assert all(not result['success'] and 'Timed out' in result['error'] for result, _ in slow_results)
+        # Fast site not held up by the slow one, whose URLs are given up on at their deadline
+        assert max(at for _, at in fast_results) < 1.5
+        assert min(at for _, at in slow_results) < 1.0
+        print(f"✅ 8 fast URLs done in {max(at for _, at in fast_results):.2f}s, 3 slow ones timed out")
+
+        # (the slow stub keeps serving requests its clients already gave up on, so only the fast one is measured)
+        assert fast.max_active <= 2
+        gaps = [b - a for a, b in zip(fast.starts, fast.starts[1:])]
+        assert fast.starts and min(gaps) >= 0.08
+        print("✅ At most 2 requests per host, starts spaced by the host interval")
+    finally:
+        for site in (slow, fast):
+            site.shutdown()
+            site.server_close()
+
+def test_utf8_without_charset():
+    print("🧪 Testing UTF-8 pages served without a charset")
+    print("=" * 50)
+
+    body = "Le conseil a approuvé le budget après un débat très animé à l'hôtel de ville. " * 5
+    page = f"<html><head><title>Budget approuvé</title></head><body><article><p>{body}</p></article></body></html>"
+    site, base = start_site(delay=0, page=page.encode('utf-8'))
+    try:
+        scraper = URLScraper(quiet=True)
+        assert "approuvé" in scraper.fetch_html(f"{base}/fr").text
+        result = scraper.scrape_article(f"{base}/fr")
+        assert result['success'] and "débat très animé" in result['content']
+        print("✅ Accents decoded from the page bytes, not as ISO-8859-1")
+    finally:
+        site.shutdown()
+        site.server_close()
+
+if __name__ == "__main__":
+    test_scrape_many()
+    test_utf8_without_charset()
@@ -0,0 +1,106 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import http.client
+import json
+import tempfile
+import threading
+import time
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from utils.micro_batcher import MicroBatcher
+from utils.real_time_analyzer import RealTimeAnalyzer
+import server
+
+def test_micro_batcher():
+    print("🧪 Testing MicroBatcher coalescing")
+    print("=" * 50)
+
+    sizes = []
+    def score(items):
+        sizes.append(len(items))
+        time.sleep(0.02)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(score, max_batch_size=8, max_wait_ms=50)
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(lambda i: batcher.submit(i).result(timeout=10), range(20)))
+    assert results == [i * 2 for i in range(20)]
+    assert max(sizes) <= 8 and len(sizes) < 20
+    print(f"✅ 20 concurrent requests scored in {len(sizes)} batches {sizes}")
+
+    def broken(items):
+        raise ValueError("model failure")
+    failing = MicroBatcher(broken, max_batch_size=4, max_wait_ms=1)
+    try:
+        failing.submit(1).result(timeout=10)
+        assert False, "exception not propagated"
+    except ValueError:
+        pass
+    failing.close(timeout=5)
+    batcher.close(timeout=5)
+    print("✅ Scoring errors reach the callers")
+
+def call(base, path, body=None):
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    request = urllib.request.Request(base + path, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_http_endpoints():
+    print("🧪 Testing server endpoints")
+    print("=" * 50)
+
+    analyzer = RealTimeAnalyzer(models_dir=tempfile.mkdtemp(), store=False)
+    httpd = server.create_server(analyzer, '127.0.0.1', 0, max_batch_size=16, max_wait_ms=5)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    try:
+        assert call(base, '/health') == (200, {'status': 'ok'})
+        status, body = call(base, '/ready')
+        assert status == 200 and body['ready']
+
+        article = {'id': 7, 'title': "Doctors hate this miracle cure", 'text': "Shocking secret"}
+        status, body = call(base, '/predict', article)
+        assert status == 200 and body['id'] == 7
+        expected = analyzer.predict_article({'title': article['title'], 'content': article['text']})
+        assert (body['prediction'], body['confidence']) == expected
+
+        articles = [{'id': i, 'title': f"Council meeting {i}", 'content': "According to study"} for i in range(5)]
+        status, body = call(base, '/predict_batch', {'articles': articles})
+        assert status == 200 and [r['id'] for r in body['results']] == list(range(5))
+        print("✅ /health, /ready, /predict and /predict_batch answer")
+
+        assert call(base, '/predict', {'foo': 1})[0] == 400
+        assert call(base, '/predict_batch', {'articles': "nope"})[0] == 400
+        assert call(base, '/missing')[0] == 404
+
+        # Oversized body: 413, not the 400 of malformed JSON; broken Content-Length: 400
+        httpd.max_body_bytes = 100
+        assert call(base, '/predict', {'title': "x" * 200})[0] == 413
+        httpd.max_body_bytes = 1024 * 1024
+        for path in ('/predict', '/missing'):
+            connection = http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=30)
+            connection.putrequest('POST', path)
+            connection.putheader('Content-Length', "abc")
+            connection.endheaders()
+            response = connection.getresponse()
+            assert response.status == 400 and "Content-Length" in json.loads(response.read())['error']
+            connection.close()
+        status, body = call(base, '/stats')
+        assert status == 200 and body['batching']['items'] == 6
+        print("✅ Bad requests rejected, stats exposed")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        httpd.batcher.close(timeout=5)
+
+if __name__ == "__main__":
+    test_micro_batcher()
+    test_http_endpoints()
@@ -0,0 +1,76 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import time
+from utils.timing import StageTimings, timings
+from utils.real_time_analyzer import RealTimeAnalyzer
+
+class SleepyPredictor:
+    """Stands in for BERTPredictor: records a 'forward' stage per batch"""
+    def predict_many(self, texts):
+        with timings.stage('forward'):
+            time.sleep(0.01)
+        return [("REAL", 0.75) for _ in texts]
+
+def test_stage_timings():
+    print("🧪 Testing rolling stage timings")
+    print("=" * 50)
+
+    recorder = StageTimings(window=100, enabled=True)
+    for ms in range(1, 201):
+        recorder.record('forward', ms / 1000)
+    stats = recorder.get_stats()['forward']
+
+    # Only the last 100 samples (101..200 ms) are in the window
+    assert stats['count'] == 200
+    assert 150 <= stats['p50_ms'] <= 151
+    assert 195 <= stats['p95_ms'] <= 196
+    assert stats['p50_ms'] <= stats['p95_ms'] <= stats['p99_ms'] <= 200
+    print(f"✅ p50={stats['p50_ms']:.1f} p95={stats['p95_ms']:.1f} p99={stats['p99_ms']:.1f} ms")
+
+    with recorder.collect() as outer:
+        with recorder.stage('tokenize'):
+            pass
+        with recorder.collect() as inner:
+            recorder.record('forward', 0.5)
+    assert set(outer) == {'tokenize', 'forward'} and inner == {'forward': 0.5}
+    print("✅ Nested collectors see the stages recorded inside them")
+
+    disabled = StageTimings(enabled=False)
+    with disabled.stage('forward'):
+        pass
+    assert disabled.get_stats() == {}
+    print("✅ Disabled recorder keeps nothing")
+
+def test_result_timings():
+    print("🧪 Testing per-article timing breakdown")
+    print("=" * 50)
+
+    if not timings.enabled:
+        print("⏭️ Timing disabled in config")
+        return
+
+    analyzer = RealTimeAnalyzer(models_dir=tempfile.mkdtemp(), store=False)
+    analyzer.bert_predictor = SleepyPredictor()
+    analyzer.model_loaded = True
+    articles = [{'title': f"Council approves budget {i}", 'content': "text"} for i in range(10)]
+
+    results = analyzer.analyze_news_batch(articles)
+    for result in results:
+        breakdown = result['timings']
+        assert {'pre_detection', 'forward', 'total'} <= set(breakdown)
+        # One 10 ms forward pass shared by the articles of the batch
+        assert breakdown['forward'] < 10
+        assert abs(breakdown['total'] - sum(v for k, v in breakdown.items() if k != 'total')) < 0.01
+    print(f"✅ Breakdown attached: {results[0]['timings']}")
+
+    info = analyzer.get_model_info(include_timings=True)
+    assert info['model'] == analyzer.get_model_info()
+    assert {'pre_detection', 'forward'} <= set(info['timings'])
+    print("✅ Aggregates exposed through get_model_info")
+
+if __name__ == "__main__":
+    test_stage_timings()
+    test_result_timings()
@@ -0,0 +1,115 @@
+import threading
+from collections import Counter
+
+import pandas as pd
+
+from config import AGGREGATES_CONFIG
+
+LABELS = ('REAL', 'FAKE', 'UNCERTAIN')
+
+# Names used by the dashboard charts (components/charts.py colour map)
+CHART_NAMES = {'REAL': 'Réel', 'FAKE': 'Fake News', 'UNCERTAIN': 'Incertain'}
+
+class AnalysisAggregates:
+    """
+    Rollups of analysis results, updated as each result is produced.
+
+    Counts by label, source and hour plus a confidence histogram per label.
+    Reading them costs the same whatever the number of past results; only
+    the last HOURS_KEPT hours are kept for the trend. Model failures
+    ("ERROR") are only counted in `errors`, not as verdicts.
+    """
+
+    def __init__(self, hours_kept=None, confidence_bins=None):
+        self.hours_kept = hours_kept or AGGREGATES_CONFIG['HOURS_KEPT']
+        self.confidence_bins = confidence_bins or AGGREGATES_CONFIG['CONFIDENCE_BINS']
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.total = 0
+            self.errors = 0
+            self.confidence_sum = 0.0
+            self.by_label = Counter()
+            self.by_source = Counter()
+            self.by_hour = {}  # hour (epoch // 3600) -> Counter of labels
+            self.histograms = {}  # label -> count per confidence bin
+
+    def update(self, result):
+        self.update_many([result])
+
+    def update_many(self, results):
+        """Add result dicts (prediction, confidence, source, analysis_time)"""
+        with self._lock:
+            for result in results:
+                label = result.get('prediction', 'UNCERTAIN')
+                if label == 'ERROR':
+                    self.errors += 1
+                    continue
+                confidence = float(result.get('confidence') or 0.0)
+
+                self.total += 1
+                self.confidence_sum += confidence
+                self.by_label[label] += 1
+                self.by_source[result.get('source') or 'Unknown'] += 1
+
+                hour = int(result.get('analysis_time', 0) // 3600)
+                counts = self.by_hour.get(hour)
+                if counts is None:
+                    counts = self.by_hour[hour] = Counter()
+                    if len(self.by_hour) > self.hours_kept:
+                        del self.by_hour[min(self.by_hour)]
+                counts[label] += 1
+
+                histogram = self.histograms.get(label)
+                if histogram is None:
+                    histogram = self.histograms[label] = [0] * self.confidence_bins
+                histogram[min(int(confidence * self.confidence_bins), self.confidence_bins - 1)] += 1
+
+    def summary(self):
+        """Totals for the metric cards"""
+        with self._lock:
+            return {
+                'total': self.total,
+                'real': self.by_label['REAL'],
+                'fake': self.by_label['FAKE'],
+                'uncertain': self.total - self.by_label['REAL'] - self.by_label['FAKE'],
+                'avg_confidence': self.confidence_sum / self.total if self.total else 0.0,
+                'errors': self.errors
+            }
+
+    def pie_data(self, names=None):
+        """Category / Count frame, one row per label seen"""
+        names = CHART_NAMES if names is None else names
+        with self._lock:
+            counts = dict(self.by_label)
+        rows = Counter()
+        for label, count in counts.items():
+            rows[names.get(label, names.get('UNCERTAIN', label))] += count
+        return pd.DataFrame({'Category': list(rows), 'Count': list(rows.values())})
+
+    def trend_data(self):
+        """Date / Real / Fake / Uncertain frame, one row per hour kept"""
+        with self._lock:
+            hours = {hour: dict(counts) for hour, counts in self.by_hour.items()}
+        rows = []
+        for hour in sorted(hours):
+            counts = hours[hour]
+            real, fake = counts.get('REAL', 0), counts.get('FAKE', 0)
+            rows.append({
+                'Date': pd.Timestamp(hour * 3600, unit='s'),
+                'Real': real,
+                'Fake': fake,
+                'Uncertain': sum(counts.values()) - real - fake
+            })
+        return pd.DataFrame(rows, columns=['Date', 'Real', 'Fake', 'Uncertain'])
+
+    def top_sources(self, n=10):
+        with self._lock:
+            return self.by_source.most_common(n)
+
+    def confidence_histogram(self):
+        """{label: [count per bin]} with bins of width 1 / CONFIDENCE_BINS"""
+        with self._lock:
+            return {label: list(counts) for label, counts in self.histograms.items()}
@@ -0,0 +1,192 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from config import STORE_CONFIG
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Query parameters that only track the visitor, never change the article
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'cmpid'}
+
+COLUMNS = ('content_hash', 'model_version', 'url', 'title', 'prediction', 'confidence',
+           'method', 'created_at', 'updated_at')
+
+def canonical_url(url):
+    """Lowercased scheme/host without www., no fragment, tracking params or trailing slash"""
+    if not url:
+        return None
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+def content_hash(text):
+    """Hash of the scored text, insensitive to case and whitespace"""
+    normalized = ' '.join(text.lower().split())
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+class AnalysisStore:
+    """
+    SQLite (WAL) store of analysis results.
+
+    One row per (content hash, model version), also indexed by canonical URL,
+    so an article is scored once per model version whichever user, feed or
+    page asks for it. Writes go through put_many(), one transaction per call.
+    db_path=None keeps the store in memory (tests, throwaway analyzers).
+    """
+
+    def __init__(self, db_path=None, url_max_age_hours=None):
+        url_max_age_hours = STORE_CONFIG['URL_MAX_AGE_HOURS'] if url_max_age_hours is None else url_max_age_hours
+        self.url_max_age = url_max_age_hours * 3600 if url_max_age_hours else None
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+        self._open(db_path or ':memory:')
+
+    @classmethod
+    def from_config(cls):
+        """Store configured by STORE_CONFIG (None when disabled)"""
+        if not STORE_CONFIG['ENABLED']:
+            return None
+        db_path = STORE_CONFIG['DB_PATH']
+        if db_path and not os.path.isabs(db_path):
+            db_path = os.path.join(PROJECT_ROOT, db_path)
+        return cls(db_path)
+
+    def _open(self, db_path):
+        """Open (or create) the store; without it every lookup is a miss"""
+        try:
+            if db_path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                " content_hash TEXT NOT NULL,"
+                " model_version TEXT NOT NULL,"
+                " url TEXT,"
+                " title TEXT,"
+                " prediction TEXT NOT NULL,"
+                " confidence REAL NOT NULL,"
+                " method TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " PRIMARY KEY (content_hash, model_version))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_analyses_url ON analyses(url, model_version, updated_at)")
+            conn.commit()
+            self._conn = conn
+        except Exception as e:
+            print(f"Analysis store warning: {e}")
+            self._conn = None
+
+    def get(self, key, model_version):
+        """Stored result for a content hash and model version, or None"""
+        row = self._fetch_one(
+            f"SELECT {', '.join(COLUMNS)} FROM analyses WHERE content_hash = ? AND model_version = ?",
+            (key, model_version)
+        )
+        return self._count(row)
+
+    def get_by_url(self, url, model_version):
+        """Latest result stored for this (canonical) URL, unless older than URL_MAX_AGE_HOURS"""
+        url = canonical_url(url)
+        if url is None:
+            return None
+        min_time = time.time() - self.url_max_age if self.url_max_age else 0
+        row = self._fetch_one(
+            f"SELECT {', '.join(COLUMNS)} FROM analyses"
+            " WHERE url = ? AND model_version = ? AND updated_at >= ?"
+            " ORDER BY updated_at DESC LIMIT 1",
+            (url, model_version, min_time)
+        )
+        return self._count(row)
+
+    def _fetch_one(self, query, params):
+        if self._conn is None:
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute(query, params).fetchone()
+            except Exception as e:
+                print(f"Analysis store warning: {e}")
+                return None
+        return dict(zip(COLUMNS, row)) if row else None
+
+    def _count(self, row):
+        if row is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return row
+
+    def put_many(self, records):
+        """
+        Upsert result dicts (COLUMNS keys, timestamps optional) in one transaction.
+        A re-analysis keeps the first created_at and the known URL.
+        """
+        if not records or self._conn is None:
+            return
+        now = time.time()
+        rows = []
+        for record in records:
+            updated_at = record.get('updated_at', now)
+            rows.append((
+                record['content_hash'], record['model_version'], canonical_url(record.get('url')),
+                record.get('title'), record['prediction'], float(record['confidence']),
+                record.get('method'), record.get('created_at', updated_at), updated_at
+            ))
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT INTO analyses ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+                        " ON CONFLICT(content_hash, model_version) DO UPDATE SET"
+                        " url = COALESCE(excluded.url, analyses.url),"
+                        " title = COALESCE(excluded.title, analyses.title),"
+                        " prediction = excluded.prediction,"
+                        " confidence = excluded.confidence,"
+                        " method = excluded.method,"
+                        " updated_at = excluded.updated_at",
+                        rows
+                    )
+            except Exception as e:
+                print(f"Analysis store warning: {e}")
+
+    def stats(self):
+        """Lookup hit rate and number of stored results"""
+        lookups = self.hits + self.misses
+        entries = 0
+        if self._conn is not None:
+            with self._lock:
+                entries = self._conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries
+        }
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
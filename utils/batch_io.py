@@ -0,0 +1,288 @@
+import csv
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+from config import BATCH_CONFIG
+
+INPUT_FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'arrow',
+    '.arrow': 'arrow',
+    '.arrows': 'arrow'
+}
+
+# Formats read with pyarrow (optional dependency), record batch by record batch
+COLUMNAR_FORMATS = ('parquet', 'arrow')
+
+# Written for every scored row, after the kept input columns
+RESULT_FIELDS = ['row', 'prediction', 'confidence', 'method']
+
+def detect_format(path, fmt=None):
+    """'csv', 'jsonl', 'parquet' or 'arrow', from the explicit format or the file extension"""
+    if fmt:
+        return fmt.lower()
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in INPUT_FORMATS:
+        raise ValueError(f"Unsupported input format '{extension}' (expected {', '.join(sorted(INPUT_FORMATS))})")
+    return INPUT_FORMATS[extension]
+
+def row_to_article(row):
+    """Article dict for the analyzer: title plus the first text-like column found"""
+    title = row.get('title')
+    content = ''
+    for column in BATCH_CONFIG['TEXT_COLUMNS']:
+        value = row.get(column)
+        if isinstance(value, str) and value:
+            content = value
+            break
+    return {'title': title if isinstance(title, str) else '', 'content': content}
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError:
+        raise ImportError("Parquet / Arrow / Feather input needs pyarrow (pip install pyarrow)")
+
+class ColumnarSource:
+    """
+    Parquet or Arrow IPC (Feather v2) input read with pyarrow: only the wanted
+    columns are decoded and rows come out as DataFrames of at most
+    `chunk_size` rows, one record batch (or row group slice) at a time.
+    `source` is a path or a binary file object.
+    """
+
+    def __init__(self, source, fmt, columns=None):
+        pa = _import_pyarrow()
+        self.fmt = fmt
+        if fmt == 'parquet':
+            self._parquet = pa.parquet.ParquetFile(source)
+            names = self._parquet.schema_arrow.names
+            self.num_rows = self._parquet.metadata.num_rows
+        else:
+            if isinstance(source, str):
+                source = pa.memory_map(source, 'r')
+            try:
+                self._ipc = pa.ipc.open_file(source)
+                self._batches = None
+            except pa.ArrowInvalid:
+                # Streaming format (.arrows): no footer, batches in order
+                source.seek(0)
+                self._ipc = None
+                self._batches = pa.ipc.open_stream(source)
+            reader = self._ipc or self._batches
+            names = reader.schema.names
+            self.num_rows = (
+                sum(self._ipc.get_batch(i).num_rows for i in range(self._ipc.num_record_batches))
+                if self._ipc is not None else None
+            )
+        self.columns = [name for name in names if columns is None or name in columns]
+
+    def record_batches(self, chunk_size, start_row=0):
+        """Record batches of at most chunk_size rows, from row `start_row` on"""
+        if self.fmt == 'parquet':
+            # Whole row groups before start_row are never read
+            metadata = self._parquet.metadata
+            groups = []
+            for index in range(metadata.num_row_groups):
+                group_rows = metadata.row_group(index).num_rows
+                if start_row >= group_rows and not groups:
+                    start_row -= group_rows
+                else:
+                    groups.append(index)
+            if not groups:
+                return
+            batches = self._parquet.iter_batches(batch_size=chunk_size, row_groups=groups, columns=self.columns)
+        elif self._ipc is not None:
+            batches = (self._ipc.get_batch(i) for i in range(self._ipc.num_record_batches))
+        else:
+            batches = self._batches
+        for batch in batches:
+            if start_row >= batch.num_rows:
+                start_row -= batch.num_rows
+                continue
+            if self.fmt != 'parquet':
+                batch = batch.select(self.columns)
+            # Writers often use very large batches: re-slice to chunk_size rows
+            for start in range(start_row, batch.num_rows, chunk_size):
+                yield batch.slice(start, chunk_size)
+            start_row = 0
+
+    def chunks(self, chunk_size, start_row=0):
+        for batch in self.record_batches(chunk_size, start_row):
+            yield batch.to_pandas()
+
+class ChunkReader:
+    """
+    Read a CSV/JSONL/Parquet/Arrow file chunk by chunk (a DataFrame of at
+    most `chunk_size` rows at a time, so memory stays flat whatever the file
+    size).
+
+    `position` is the number of bytes consumed so far (estimated from the
+    rows read for columnar files), for progress / ETA. With `start_row`, the
+    first rows are skipped (resumed jobs) and numbering starts there.
+    """
+
+    def __init__(self, path, chunk_size=None, fmt=None, columns=None, start_row=0):
+        self.path = path
+        self.chunk_size = chunk_size or BATCH_CONFIG['CHUNK_SIZE']
+        self.fmt = detect_format(path, fmt)
+        self.columns = columns
+        self.total_bytes = os.path.getsize(path)
+        self.start_row = start_row
+        self.rows_read = start_row
+        self.total_rows = None
+        self._handle = None
+
+    @property
+    def position(self):
+        if self.total_rows:
+            return int(self.total_bytes * min(self.rows_read / self.total_rows, 1.0))
+        if self._handle is None or self._handle.closed:
+            return self.total_bytes
+        return self._handle.tell()
+
+    def _number(self, chunk):
+        """Global row numbers as index"""
+        chunk.index = range(self.rows_read, self.rows_read + len(chunk))
+        self.rows_read += len(chunk)
+        return chunk
+
+    def __iter__(self):
+        if self.fmt in COLUMNAR_FORMATS:
+            source = ColumnarSource(self.path, self.fmt, self.columns)
+            self.total_rows = source.num_rows
+            for chunk in source.chunks(self.chunk_size, self.start_row):
+                yield self._number(chunk)
+            return
+
+        with open(self.path, 'rb') as handle:
+            self._handle = handle
+            if self.fmt == 'csv':
+                usecols = None
+                if self.columns:
+                    wanted = set(self.columns)
+                    usecols = lambda column: column in wanted
+                # skiprows counts records (quoted newlines included), the header is kept
+                skiprows = range(1, self.start_row + 1) if self.start_row else None
+                chunks = pd.read_csv(handle, chunksize=self.chunk_size, usecols=usecols, skiprows=skiprows)
+            else:
+                for _ in range(self.start_row):
+                    handle.readline()
+                chunks = pd.read_json(handle, lines=True, chunksize=self.chunk_size)
+            for chunk in chunks:
+                if self.columns and self.fmt != 'csv':
+                    chunk = chunk[[column for column in chunk.columns if column in self.columns]]
+                yield self._number(chunk)
+
+class ResultWriter:
+    """Append result rows to a CSV or JSONL file, flushed after every chunk"""
+
+    def __init__(self, path, fields, fmt=None):
+        self.path = path
+        self.fields = list(fields)
+        self.fmt = detect_format(path, fmt)
+        if self.fmt not in ('csv', 'jsonl'):
+            raise ValueError(f"Results are written as CSV or JSONL, not {self.fmt}")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._handle = open(path, 'a', encoding='utf-8', newline='')
+        self._csv = None
+        if self.fmt == 'csv':
+            self._csv = csv.DictWriter(self._handle, fieldnames=self.fields, extrasaction='ignore')
+            if new_file:
+                self._csv.writeheader()
+
+    def write(self, rows):
+        if self._csv is not None:
+            self._csv.writerows(rows)
+        else:
+            for row in rows:
+                self._handle.write(json.dumps({field: row.get(field) for field in self.fields}, ensure_ascii=False, default=str))
+                self._handle.write('\n')
+        self._handle.flush()
+
+    def sync(self):
+        """Force written rows to disk; returns the file size they end at"""
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        return os.fstat(self._handle.fileno()).st_size
+
+    def close(self):
+        if not self._handle.closed:
+            self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class ProgressReporter:
+    """Throughput and ETA on stderr, at most once per `interval` seconds"""
+
+    def __init__(self, total_bytes, stream=None, interval=None, start_rows=0, start_position=0):
+        self.total_bytes = max(total_bytes, 1)
+        self.stream = stream or sys.stderr
+        self.interval = BATCH_CONFIG['PROGRESS_INTERVAL'] if interval is None else interval
+        self.start = time.perf_counter()
+        self.last_report = 0.0
+        # Resumed jobs: rate and ETA only count this run's work
+        self.start_rows = start_rows
+        self.start_position = start_position
+
+    def update(self, rows, position, force=False):
+        now = time.perf_counter()
+        if not force and now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        elapsed = max(now - self.start, 1e-9)
+        fraction = min(position / self.total_bytes, 1.0)
+        done = position - self.start_position
+        eta = elapsed * (self.total_bytes - position) / done if done > 0 else float('inf')
+        eta_text = time.strftime('%H:%M:%S', time.gmtime(max(eta, 0))) if eta != float('inf') else '--:--:--'
+        self.stream.write(f"\r{rows:,} rows | {(rows - self.start_rows) / elapsed:,.0f} rows/s | {fraction:.1%} | ETA {eta_text}")
+        self.stream.flush()
+
+    def finish(self, rows):
+        self.update(rows, self.total_bytes, force=True)
+        self.stream.write("\n")
+        self.stream.flush()
+
+def score_chunk(analyzer, chunk, keep_columns=()):
+    """
+    Score one DataFrame chunk through the analyzer (one model batch for the
+    whole chunk) and return output rows: kept input columns + RESULT_FIELDS.
+    """
+    records = chunk.to_dict('records')
+    articles = [row_to_article(record) for record in records]
+    results = [
+        result
+        for batch in analyzer.analyze_stream(articles, batch_size=max(len(articles), 1))
+        for result in batch
+    ]
+
+    rows = []
+    for row_index, record, result in zip(chunk.index, records, results):
+        row = {}
+        for column in keep_columns:
+            value = record.get(column)
+            row[column] = None if isinstance(value, float) and value != value else value
+        row.update({
+            'row': int(row_index),
+            'prediction': result['prediction'],
+            'confidence': round(float(result['confidence']), 6),
+            'method': result['method']
+        })
+        rows.append(row)
+    return rows
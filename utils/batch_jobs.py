@@ -0,0 +1,186 @@
+import json
+import os
+import time
+
+from config import BATCH_CONFIG
+from utils.batch_io import ChunkReader, ResultWriter, ProgressReporter, RESULT_FIELDS, score_chunk
+
+def checkpoint_path(output_path):
+    """Checkpoint file kept next to a job's output"""
+    return output_path + '.checkpoint.json'
+
+def write_checkpoint(path, state):
+    """Atomic write: the previous checkpoint stays intact until the new one is on disk"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def read_checkpoint(output_path):
+    """Checkpoint dict for a job's output, or None"""
+    try:
+        with open(checkpoint_path(output_path), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def job_status(output_path):
+    """Progress of the job writing to output_path (None if no checkpoint)"""
+    state = read_checkpoint(output_path)
+    if state is None:
+        return None
+    status = {
+        'status': state['status'],
+        'input': state['input']['path'],
+        'rows_done': state['rows_done'],
+        'total_rows': state.get('total_rows'),
+        'progress': min(state['input_position'] / max(state['input']['size'], 1), 1.0),
+        'analysis_version': state['analysis_version'],
+        'started_at': state['started_at'],
+        'updated_at': state['updated_at'],
+        'error': state.get('error')
+    }
+    if state['status'] == 'completed':
+        status['progress'] = 1.0
+    elif state.get('total_rows'):
+        status['progress'] = state['rows_done'] / state['total_rows']
+    return status
+
+class JobMismatch(ValueError):
+    """Checkpoint written for a different input, output layout or model version"""
+
+class BatchJob:
+    """
+    Resumable scoring job: input file -> output file, chunk by chunk.
+
+    After a chunk has been written and fsync'ed, a checkpoint (rows done,
+    input position, output size) is saved at most every CHECKPOINT_INTERVAL
+    seconds. On resume the output is cut back to the last checkpointed size
+    (dropping rows written after it) and reading restarts at the next row,
+    so every input row ends up in the output exactly once.
+
+    A job can only be resumed with the same input file, output fields and
+    analysis version: results from a retrained classifier are never mixed
+    with older ones.
+    """
+
+    def __init__(self, input_path, output_path, chunk_size=None, input_format=None, output_format=None,
+                 keep_columns=(), checkpoint_interval=None):
+        self.input_path = input_path
+        self.output_path = output_path
+        self.chunk_size = chunk_size or BATCH_CONFIG['CHUNK_SIZE']
+        self.input_format = input_format
+        self.output_format = output_format
+        self.keep_columns = list(keep_columns)
+        self.fields = self.keep_columns + RESULT_FIELDS
+        self.checkpoint_interval = (
+            BATCH_CONFIG['CHECKPOINT_INTERVAL'] if checkpoint_interval is None else checkpoint_interval
+        )
+        self.checkpoint_path = checkpoint_path(output_path)
+        self.state = None
+
+    def _input_identity(self):
+        stat = os.stat(self.input_path)
+        return {'path': os.path.abspath(self.input_path), 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    def _new_state(self, version):
+        now = time.time()
+        return {
+            'status': 'running',
+            'input': self._input_identity(),
+            'fields': self.fields,
+            'analysis_version': version,
+            'rows_done': 0,
+            'total_rows': None,
+            'input_position': 0,
+            'output_bytes': 0,
+            'started_at': now,
+            'updated_at': now
+        }
+
+    def _resume_state(self, version):
+        """Checkpoint to continue from, after checking it belongs to this job"""
+        state = read_checkpoint(self.output_path)
+        if state is None:
+            return None
+        identity = self._input_identity()
+        if (state['input']['path'], state['input']['size'], state['input']['mtime']) != (
+                identity['path'], identity['size'], identity['mtime']):
+            raise JobMismatch(f"{self.input_path} changed since the checkpoint was written")
+        if state['fields'] != self.fields:
+            raise JobMismatch(f"checkpoint was written with fields {state['fields']}, not {self.fields}")
+        if state['analysis_version'] != version:
+            raise JobMismatch("model or rules changed since the checkpoint: start the job again without --resume")
+        return state
+
+    def _save(self, status=None, error=None):
+        if status is not None:
+            self.state['status'] = status
+        if error is not None:
+            self.state['error'] = error
+        self.state['updated_at'] = time.time()
+        write_checkpoint(self.checkpoint_path, self.state)
+
+    def run(self, analyzer, resume=False, progress_stream=None):
+        """
+        Score the input (from the last checkpoint with resume=True, from
+        scratch otherwise); returns the total number of rows in the output.
+        """
+        version = analyzer.analysis_version()
+        state = self._resume_state(version) if resume else None
+        if state is not None and state['status'] == 'completed':
+            self.state = state
+            return state['rows_done']
+
+        if state is None:
+            state = self._new_state(version)
+            output_bytes = 0
+        else:
+            state['status'] = 'running'
+            state.pop('error', None)
+            output_bytes = state['output_bytes']
+        self.state = state
+
+        # Rows written after the last checkpoint are scored again
+        if os.path.exists(self.output_path):
+            with open(self.output_path, 'r+b') as f:
+                f.truncate(output_bytes)
+
+        columns = ['title'] + BATCH_CONFIG['TEXT_COLUMNS'] + self.keep_columns
+        reader = ChunkReader(self.input_path, chunk_size=self.chunk_size, fmt=self.input_format,
+                             columns=columns, start_row=state['rows_done'])
+        progress = ProgressReporter(reader.total_bytes, stream=progress_stream,
+                                    start_rows=state['rows_done'], start_position=state['input_position'])
+        self._save()
+
+        last_checkpoint = time.perf_counter()
+        try:
+            with ResultWriter(self.output_path, self.fields, fmt=self.output_format) as writer:
+                for chunk in reader:
+                    writer.write(score_chunk(analyzer, chunk, self.keep_columns))
+                    progress.update(reader.rows_read, reader.position)
+                    if time.perf_counter() - last_checkpoint >= self.checkpoint_interval:
+                        self._checkpoint(reader, writer)
+                        last_checkpoint = time.perf_counter()
+                self._checkpoint(reader, writer)
+            state['total_rows'] = state['rows_done']
+            self._save('completed')
+        except KeyboardInterrupt:
+            self._save('interrupted')
+            raise
+        except Exception as e:
+            self._save('failed', str(e))
+            raise
+        progress.finish(state['rows_done'])
+        return state['rows_done']
+
+    def _checkpoint(self, reader, writer):
+        # Output first: the checkpoint never points past what is on disk
+        self.state['output_bytes'] = writer.sync()
+        self.state['rows_done'] = reader.rows_read
+        self.state['input_position'] = reader.position
+        if reader.total_rows is not None:
+            self.state['total_rows'] = reader.total_rows
+        self._save()
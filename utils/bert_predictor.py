@@ -1,66 +1,317 @@
-import torch
 import numpy as np
-import joblib
-from transformers import BertTokenizer, BertModel, BertConfig
+import pandas as pd
 import streamlit as st
 import os
 import re
 import string
-from deep_translator import GoogleTranslator
+import hashlib
+from config import BERT_CONFIG, CACHE_CONFIG
+from utils.timing import stage
+from utils.embedding_cache import EmbeddingCache, LRUCache
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# torch / transformers / joblib / deep_translator are imported inside the methods
+# that need them: importing this module stays cheap until models are loaded.
+
+# Text cleaning patterns, compiled once
+URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
+HTML_TAG_PATTERN = re.compile(r'<.*?>')
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+def clean_text_for_bert(text):
+    """Lowercase, strip URLs, HTML tags, punctuation and extra whitespace"""
+    if not isinstance(text, str):
+        return ""
+    
+    text = text.lower()
+    
+    # Remove URLs (the substring checks skip the regex for most articles)
+    if 'http' in text or 'www.' in text:
+        text = URL_PATTERN.sub('', text)
+    
+    # Remove HTML tags
+    if '<' in text:
+        text = HTML_TAG_PATTERN.sub('', text)
+    
+    # Remove punctuation
+    text = text.translate(PUNCTUATION_TABLE)
+    
+    # Remove newlines and extra spaces (same result as re.sub(r'\s+', ' ', text).strip())
+    return ' '.join(text.split())
 
 class BERTPredictor:
-    def __init__(self):
+    def __init__(self, models_dir=None, backend=None, quantize=None, long_document=None, load=True):
         self.model = None
         self.tokenizer = None
         self.classifier = None
+        self.linear_head = None
+        self.bert = None
+        self.embedding_cache = None
+        self.model_version = ""
+        self.classifier_version = ""
+        self.onnx_encoder = None
+        self.backend = backend or BERT_CONFIG['BACKEND']
+        self.quantize = BERT_CONFIG['QUANTIZE'] if quantize is None else quantize
+        
+        # Tokenization / batching settings
+        self.max_length = BERT_CONFIG['MAX_LENGTH']
+        self.batch_size = BERT_CONFIG['EMBED_BATCH_SIZE']
+        self.token_cache = LRUCache(BERT_CONFIG['TOKEN_CACHE_ENTRIES'])
+        
+        # Long-article mode: overlapping windows instead of hard truncation
+        self.long_document = BERT_CONFIG['LONG_DOCUMENT'] if long_document is None else long_document
+        self.window_stride = BERT_CONFIG['WINDOW_STRIDE']
+        self.max_windows = BERT_CONFIG['MAX_WINDOWS']
         
         # ⚠️ FORCE CPU: Optimized for your laptop
-        self.device = torch.device('cpu')
+        self.device = 'cpu'
         
         # Paths to your saved models
-        self.base_path = r"C:\Users\khaol\OneDrive\Desktop\Fake_News_Detection\models"
+        self.base_path = models_dir or r"C:\Users\khaol\OneDrive\Desktop\Fake_News_Detection\models"
         
-        self.load_models()
+        self.verbose = True
+        
+        if load:
+            self.load_models()
     
-    def load_models(self):
-        """Load BERT model, tokenizer, and classifier"""
+    def load_models(self, verbose=True):
+        """Load BERT model, tokenizer, and classifier (verbose=False: no UI messages)"""
+        self.verbose = verbose
         try:
+            import joblib
+            from transformers import BertModel
+            
             # 1. Load the Classifier
             classifier_path = os.path.join(self.base_path, "fake_news_model.pkl")
             if os.path.exists(classifier_path):
                 self.classifier = joblib.load(classifier_path)
-                st.success("✅ Classifier model loaded")
+                self.linear_head = self._extract_linear_head(self.classifier)
+                stat = os.stat(classifier_path)
+                self.classifier_version = f"{stat.st_size}:{int(stat.st_mtime)}"
+                if self.verbose:
+                    st.success("✅ Classifier model loaded")
             else:
                 return False
             
             # 2. Load BERT Tokenizer
             tokenizer_path = os.path.join(self.base_path, "bert_tokenizer")
             if os.path.exists(tokenizer_path):
-                self.tokenizer = BertTokenizer.from_pretrained(tokenizer_path)
-                st.success("✅ BERT tokenizer loaded")
+                self.tokenizer = self._load_tokenizer(tokenizer_path)
+                self.token_cache.clear()
+                if self.verbose:
+                    st.success("✅ BERT tokenizer loaded")
             else:
-                st.error(f"❌ BERT tokenizer not found at {tokenizer_path}")
+                if self.verbose:
+                    st.error(f"❌ BERT tokenizer not found at {tokenizer_path}")
                 return False
             
             # 3. Load BERT Model (MANUAL METHOD)
             bert_path = os.path.join(self.base_path, "bert_model")
             
             if os.path.exists(bert_path):
-                self.bert = BertModel.from_pretrained(bert_path)
+                if self.quantize and self.backend != 'onnx':
+                    self.bert = self._load_quantized_bert(bert_path)
+                else:
+                    self.bert = BertModel.from_pretrained(bert_path)
                 self.bert.to(self.device)
                 self.bert.eval()  # Set to evaluation mode
-                st.success("✅ BERT model loaded")
+                if self.verbose:
+                    st.success("✅ BERT model loaded")
             else:
-                st.error(f"❌ BERT model not found at {bert_path}")
+                if self.verbose:
+                    st.error(f"❌ BERT model not found at {bert_path}")
                 return False
             
-            st.success("🚀 BERT Prediction System Ready!")
+            # 4. Optional ONNX Runtime backend (falls back to torch)
+            self.onnx_encoder = self._load_onnx_encoder(bert_path) if self.backend == 'onnx' else None
+            
+            # 5. Embedding cache (keyed by model version)
+            self.model_version = self._compute_model_version(tokenizer_path, bert_path)
+            self.embedding_cache = self._create_embedding_cache()
+            
+            if self.verbose:
+                st.success("🚀 BERT Prediction System Ready!")
             return True
             
         except Exception as e:
             # Pas d'erreur affichée
             return False
     
+    def _load_tokenizer(self, tokenizer_path):
+        """Rust-backed fast tokenizer from the same folder, slow one as fallback"""
+        from transformers import BertTokenizer, BertTokenizerFast
+        try:
+            return BertTokenizerFast.from_pretrained(tokenizer_path)
+        except Exception as e:
+            print(f"Fast tokenizer unavailable, using BertTokenizer: {e}")
+            return BertTokenizer.from_pretrained(tokenizer_path)
+    
+    def _extract_linear_head(self, classifier):
+        """
+        Pull coef_/intercept_ out of a fitted LogisticRegression so label and
+        probability come from one matmul instead of two sklearn calls.
+        Returns None for any other estimator (sklearn path is used instead).
+        """
+        try:
+            from sklearn.linear_model import LogisticRegression
+        except ImportError:
+            return None
+        if not isinstance(classifier, LogisticRegression) or not hasattr(classifier, 'coef_'):
+            return None
+        
+        coef = np.asarray(classifier.coef_, dtype=np.float64)
+        if coef.shape[0] == 1:
+            mode = 'binary'
+        else:
+            # Same rule sklearn uses to pick one-vs-rest over multinomial
+            multi_class = getattr(classifier, 'multi_class', 'auto')
+            is_ovr = multi_class == 'ovr' or (multi_class in ('auto', 'deprecated') and classifier.solver == 'liblinear')
+            mode = 'ovr' if is_ovr else 'softmax'
+        
+        return {
+            'coef_t': np.ascontiguousarray(coef.T),
+            'intercept': np.asarray(classifier.intercept_, dtype=np.float64),
+            'classes': np.asarray(classifier.classes_),
+            'mode': mode
+        }
+    
+    def _classify(self, embeddings):
+        """Return (predictions, confidences) for a matrix of embeddings"""
+        head = self.linear_head
+        if head is None:
+            predictions = self.classifier.predict(embeddings)
+            if hasattr(self.classifier, 'predict_proba'):
+                confidences = self.classifier.predict_proba(embeddings).max(axis=1)
+            else:
+                # Fallback for models without proba
+                confidences = np.full(len(predictions), 0.9)
+            return predictions, confidences
+        
+        scores = np.asarray(embeddings, dtype=np.float64) @ head['coef_t'] + head['intercept']
+        
+        if head['mode'] == 'binary':
+            positive = 0.5 * (1.0 + np.tanh(0.5 * scores[:, 0]))  # stable sigmoid
+            predictions = head['classes'][(scores[:, 0] > 0).astype(int)]
+            confidences = np.maximum(positive, 1.0 - positive)
+            return predictions, confidences
+        
+        if head['mode'] == 'ovr':
+            probs = 0.5 * (1.0 + np.tanh(0.5 * scores))
+            probs /= probs.sum(axis=1, keepdims=True)
+        else:
+            probs = np.exp(scores - scores.max(axis=1, keepdims=True))
+            probs /= probs.sum(axis=1, keepdims=True)
+        predictions = head['classes'][scores.argmax(axis=1)]
+        return predictions, probs.max(axis=1)
+    
+    def _load_onnx_encoder(self, bert_path=None):
+        """
+        Serve BERT through onnxruntime. The exported graph is reused only while
+        the fp32 weights it came from are unchanged (fingerprint stored next to
+        it in <onnx file>.source), otherwise it is exported again.
+        bert_path defaults to the bert_model folder load_models reads.
+        """
+        if bert_path is None:
+            bert_path = os.path.join(self.base_path, "bert_model")
+        try:
+            from utils.onnx_backend import OnnxBertEncoder, export_bert_to_onnx
+            
+            onnx_path = BERT_CONFIG['ONNX_PATH']
+            if not os.path.isabs(onnx_path):
+                onnx_path = os.path.join(self.base_path, onnx_path)
+            source_path = onnx_path + '.source'
+            source = self._fingerprint_folders([bert_path])
+            
+            exported_from = None
+            if os.path.exists(onnx_path) and os.path.exists(source_path):
+                with open(source_path, encoding='utf-8') as f:
+                    exported_from = f.read().strip()
+            if exported_from != source:
+                if not export_bert_to_onnx(self.bert, onnx_path):
+                    raise RuntimeError(f"ONNX export failed: {onnx_path}")
+                with open(source_path, 'w', encoding='utf-8') as f:
+                    f.write(source)
+            
+            encoder = OnnxBertEncoder(onnx_path, num_threads=BERT_CONFIG['ONNX_THREADS'])
+            if self.verbose:
+                st.success("✅ ONNX Runtime backend loaded")
+            return encoder
+        except Exception as e:
+            # Missing onnxruntime or failed export: keep the torch model
+            print(f"ONNX backend unavailable, using torch: {e}")
+            return None
+    
+    def _load_quantized_bert(self, bert_path):
+        """
+        INT8 dynamic quantization of the Linear layers.
+        
+        The quantized module is cached on disk next to the fp32 weights and is
+        rebuilt only when those weights change.
+        """
+        quantized_path = BERT_CONFIG['QUANTIZED_PATH']
+        if not os.path.isabs(quantized_path):
+            quantized_path = os.path.join(self.base_path, quantized_path)
+        source = self._fingerprint_folders([bert_path])
+        
+        import torch
+        from transformers import BertModel
+        
+        if os.path.exists(quantized_path):
+            try:
+                cached = torch.load(quantized_path, map_location='cpu', weights_only=False)
+                if cached.get('source') == source:
+                    return cached['model']
+            except Exception as e:
+                print(f"Quantized cache warning: {e}")
+        
+        model = BertModel.from_pretrained(bert_path)
+        model.eval()
+        quantized = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        try:
+            torch.save({'source': source, 'model': quantized}, quantized_path)
+        except Exception as e:
+            print(f"Quantized cache warning: {e}")
+        return quantized
+    
+    def _fingerprint_folders(self, folders, extra=""):
+        """Hash of file names, sizes and mtimes under the given folders"""
+        digest = hashlib.sha256(extra.encode("utf-8"))
+        for folder in folders:
+            for name in sorted(os.listdir(folder)):
+                stat = os.stat(os.path.join(folder, name))
+                digest.update(f"{name}:{stat.st_size}:{int(stat.st_mtime)}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+    
+    def _compute_model_version(self, tokenizer_path, bert_path):
+        """Fingerprint of the files (and settings) that determine an embedding"""
+        backend = 'onnx' if self.onnx_encoder is not None else 'torch'
+        precision = 'int8' if self.quantize and backend == 'torch' else 'fp32'
+        settings = f"max_length={self.max_length};backend={backend};precision={precision}"
+        if self.long_document:
+            settings += f";windows={self.max_windows}x{self.window_stride}"
+        return self._fingerprint_folders([tokenizer_path, bert_path], extra=settings)
+    
+    def _create_embedding_cache(self):
+        """Build the two-tier embedding cache from CACHE_CONFIG"""
+        if not CACHE_CONFIG['ENABLED']:
+            return None
+        db_path = CACHE_CONFIG['DISK_PATH']
+        if db_path and not os.path.isabs(db_path):
+            db_path = os.path.join(PROJECT_ROOT, db_path)
+        return EmbeddingCache(
+            db_path=db_path,
+            memory_entries=CACHE_CONFIG['MEMORY_ENTRIES'],
+            max_disk_bytes=CACHE_CONFIG['MAX_DISK_MB'] * 1024 * 1024,
+            model_version=self.model_version
+        )
+    
+    def get_cache_stats(self):
+        """Hit/miss counters of the embedding cache (None when disabled)"""
+        if self.embedding_cache is None:
+            return None
+        return self.embedding_cache.stats()
+    
     def translate_to_english(self, text):
         """
         Helper to automatically translate any input text to English.
@@ -74,6 +325,7 @@ class BERTPredictor:
                 return text
 
             # Initialize translator
+            from deep_translator import GoogleTranslator
             translator = GoogleTranslator(source='auto', target='en')
             translated_text = translator.translate(text)
             return translated_text
@@ -87,48 +339,190 @@ class BERTPredictor:
         """
         Clean text (Standard cleaning for BERT)
         """
-        if not isinstance(text, str):
-            return ""
-            
-        text = text.lower()
+        return clean_text_for_bert(text)
+    
+    def preprocess_texts(self, texts):
+        """
+        Batch version of preprocess_text for a list or pandas Series.
+        
+        A Series comes back as a Series with the same index, anything else as a list.
+        """
+        if isinstance(texts, pd.Series):
+            return texts.map(clean_text_for_bert).astype(object)
+        return [clean_text_for_bert(text) for text in texts]
+    
+    def get_bert_embedding(self, text):
+        """Get BERT embedding for text (Feature Extraction)"""
+        return self.get_bert_embeddings([text])[0]
+    
+    def get_bert_embeddings(self, texts, batch_size=None):
+        """
+        Get BERT embeddings for many texts at once.
+        
+        Texts are sorted by token length and split into buckets, each bucket is
+        padded only to its own longest member and run through BERT in a single
+        forward pass. Embeddings are returned in the original order.
+        """
+        if batch_size is None:
+            batch_size = self.batch_size
+        
+        # Preprocess (as a list: everything below works by position, not by Series index)
+        with stage('preprocess'):
+            processed_texts = list(self.preprocess_texts(texts))
+        if not processed_texts:
+            return np.zeros((0, self.bert.config.hidden_size), dtype=np.float32)
         
-        # Remove URLs
-        text = re.sub(r'https?://\S+|www\.\S+', '', text)
+        if self.embedding_cache is None:
+            return self._compute_embeddings(processed_texts, batch_size)
         
-        # Remove HTML tags
-        text = re.sub(r'<.*?>', '', text)
+        # Look up both cache tiers first, only run BERT on the misses
+        with stage('cache_lookup'):
+            keys = [self.embedding_cache.make_key(text) for text in processed_texts]
+            found = self.embedding_cache.get_many(keys)
         
-        # Remove punctuation
-        text = text.translate(str.maketrans('', '', string.punctuation))
+        missing = {}
+        for key, text in zip(keys, processed_texts):
+            if key not in found and key not in missing:
+                missing[key] = text
         
-        # Remove newlines and extra spaces
-        text = re.sub(r'\n', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
+        if missing:
+            computed = self._compute_embeddings(list(missing.values()), batch_size)
+            new_items = dict(zip(missing.keys(), computed))
+            self.embedding_cache.put_many(new_items)
+            found.update(new_items)
         
-        return text
+        return np.vstack([found[key] for key in keys])
     
-    def get_bert_embedding(self, text):
-        """Get BERT embedding for text (Feature Extraction)"""
-        # Preprocess
-        processed_text = self.preprocess_text(text)
-        
-        # Tokenize
-        inputs = self.tokenizer(
-            processed_text, 
-            return_tensors='pt', 
-            truncation=True,
-            padding=True, 
-            max_length=128
-        ).to(self.device)
+    def _compute_embeddings(self, processed_texts, batch_size):
+        """Tokenize, bucket by length and embed already preprocessed texts"""
+        # Tokenize (no padding yet, each text keeps its own length)
+        with stage('tokenize'):
+            input_ids = self._encode(processed_texts, self._token_budget())
         
-        # Get Embeddings
-        with torch.no_grad():
-            outputs = self.bert(**inputs)
+        if not self.long_document:
+            return self._embed_sequences(input_ids, batch_size)
         
-        # Mean pooling (Average of all word vectors)
-        embedding = outputs.last_hidden_state.mean(dim=1).squeeze()
+        # Long-article mode: all windows of all articles share the same buckets
+        windows, owners = self._split_windows(input_ids)
+        window_embeddings = self._embed_sequences(windows, batch_size)
         
-        return embedding.cpu().numpy()
+        # Pool windows back per article, weighted by their number of tokens
+        weights = np.array([len(window) for window in windows], dtype=np.float64)
+        owners = np.array(owners)
+        embeddings = np.zeros((len(input_ids), window_embeddings.shape[1]), dtype=np.float64)
+        np.add.at(embeddings, owners, window_embeddings * weights[:, None])
+        totals = np.bincount(owners, weights=weights, minlength=len(input_ids))
+        return (embeddings / totals[:, None]).astype(window_embeddings.dtype)
+    
+    def _embed_sequences(self, sequences, batch_size):
+        """Sort token sequences by length, one forward pass per bucket, original order back"""
+        # Length buckets: shortest first, so padding stays minimal
+        order = sorted(range(len(sequences)), key=lambda i: len(sequences[i]))
+        embeddings = [None] * len(sequences)
+        
+        for start in range(0, len(order), batch_size):
+            bucket = order[start:start + batch_size]
+            with stage('forward'):
+                pooled = self._embed_bucket([sequences[i] for i in bucket])
+            for i, vector in zip(bucket, pooled):
+                embeddings[i] = vector
+        
+        return np.vstack(embeddings)
+    
+    def _token_budget(self):
+        """Tokens kept per article: one window, or enough for MAX_WINDOWS windows"""
+        if not self.long_document:
+            return self.max_length
+        return (self.max_windows - 1) * self.window_stride + self.max_length
+    
+    def _split_windows(self, input_ids):
+        """
+        Cut each [CLS] ... [SEP] sequence into overlapping MAX_LENGTH windows.
+        Returns the windows and, for each window, the index of its article.
+        """
+        inner = self.max_length - 2
+        windows = []
+        owners = []
+        for owner, ids in enumerate(input_ids):
+            cls_id, content, sep_id = ids[0], ids[1:-1], ids[-1]
+            for index in range(self.max_windows):
+                start = index * self.window_stride
+                windows.append([cls_id] + content[start:start + inner] + [sep_id])
+                owners.append(owner)
+                if start + inner >= len(content):
+                    break
+        return windows, owners
+    
+    def _encode(self, processed_texts, max_length=None):
+        """Token ids per text: LRU lookups first, one batch encode for the rest"""
+        if max_length is None:
+            max_length = self.max_length
+        input_ids = [self.token_cache.get((max_length, text)) for text in processed_texts]
+        missing = list(dict.fromkeys(
+            text for text, ids in zip(processed_texts, input_ids) if ids is None
+        ))
+        
+        if missing:
+            encoded = self.tokenizer(
+                missing,
+                truncation=True,
+                padding=False,
+                max_length=max_length
+            )['input_ids']
+            fresh = dict(zip(missing, encoded))
+            for text, ids in fresh.items():
+                self.token_cache.put((max_length, text), ids)
+            input_ids = [ids if ids is not None else fresh[text] for text, ids in zip(processed_texts, input_ids)]
+        
+        return input_ids
+    
+    def _embed_bucket(self, bucket_ids):
+        """Run one padded forward pass and mean-pool over real tokens only"""
+        longest = max(len(ids) for ids in bucket_ids)
+        pad_id = self.tokenizer.pad_token_id or 0
+        
+        input_ids = np.full((len(bucket_ids), longest), pad_id, dtype=np.int64)
+        attention_mask = np.zeros((len(bucket_ids), longest), dtype=np.int64)
+        for row, ids in enumerate(bucket_ids):
+            input_ids[row, :len(ids)] = ids
+            attention_mask[row, :len(ids)] = 1
+        
+        # Get Embeddings
+        if self.onnx_encoder is not None:
+            hidden = self.onnx_encoder.last_hidden_state(input_ids, attention_mask)
+        else:
+            import torch
+            with torch.no_grad():
+                outputs = self.bert(
+                    input_ids=torch.from_numpy(input_ids).to(self.device),
+                    attention_mask=torch.from_numpy(attention_mask).to(self.device)
+                )
+            hidden = outputs.last_hidden_state.cpu().numpy()
+        
+        # Mean pooling (Average of all word vectors, padding excluded)
+        mask = attention_mask[:, :, None].astype(hidden.dtype)
+        return (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1)
+    
+    def warm_up(self, texts=None):
+        """
+        Run one throwaway batch through tokenizer, BERT and classifier so the
+        first real request doesn't pay for lazy initialisation. Bypasses the
+        embedding cache, which would otherwise skip the forward pass.
+        """
+        if self.bert is None or self.classifier is None:
+            return False
+        if texts is None:
+            texts = [
+                "Officials confirmed the new budget measures on Monday.",
+                "Shocking secret cure that doctors do not want you to know about"
+            ]
+        try:
+            processed_texts = list(self.preprocess_texts(texts))
+            self._classify(self._compute_embeddings(processed_texts, self.batch_size))
+            return True
+        except Exception as e:
+            print(f"Warm-up warning: {e}")
+            return False
     
     def predict(self, text):
         """Predict if text is fake news"""
@@ -137,7 +531,8 @@ class BERTPredictor:
                 return "UNCERTAIN", 0.0
             
             # 1. TRANSLATE TO ENGLISH FIRST
-            english_text = self.translate_to_english(text)
+            with stage('translate'):
+                english_text = self.translate_to_english(text)
             
             # 2. Convert Text -> Numbers (Embedding)
             embedding = self.get_bert_embedding(english_text)
@@ -145,16 +540,11 @@ class BERTPredictor:
             # Reshape for classifier (1 sample, N features)
             embedding = embedding.reshape(1, -1)
             
-            # 3. Predict with Classifier
-            prediction = self.classifier.predict(embedding)[0]
-            
-            # 4. Get Confidence Score
-            if hasattr(self.classifier, 'predict_proba'):
-                probs = self.classifier.predict_proba(embedding)[0]
-                confidence = max(probs)
-            else:
-                # Fallback for models without proba
-                confidence = 0.9 
+            # 3. Predict + 4. Confidence in a single pass
+            with stage('classifier'):
+                predictions, confidences = self._classify(embedding)
+            prediction = predictions[0]
+            confidence = confidences[0]
             
             # 5. Map Result
             # Based on typical training (0=Fake, 1=Real)
@@ -164,4 +554,40 @@ class BERTPredictor:
             
         except Exception as e:
             # Pas d'erreur affichée
-            return "ERROR", 0.0
\ No newline at end of file
+            return "ERROR", 0.0
+    
+    def predict_many(self, texts, batch_size=None, translated=False):
+        """
+        Predict many texts with batched BERT forward passes
+        (translated=True: texts are already English, skip translate_to_english)
+        """
+        texts = list(texts)
+        try:
+            if self.classifier is None or self.bert is None:
+                return [("UNCERTAIN", 0.0)] * len(texts)
+            if not texts:
+                return []
+            
+            # 1. TRANSLATE TO ENGLISH FIRST
+            if translated:
+                english_texts = texts
+            else:
+                with stage('translate'):
+                    english_texts = [self.translate_to_english(text) for text in texts]
+            
+            # 2. Convert Texts -> Numbers (one embedding row per text)
+            embeddings = self.get_bert_embeddings(english_texts, batch_size=batch_size)
+            
+            # 3. Predict + 4. Confidence for the whole matrix at once
+            with stage('classifier'):
+                predictions, confidences = self._classify(embeddings)
+            
+            # 5. Map Results (0=Fake, 1=Real)
+            return [
+                ("REAL" if prediction == 1 else "FAKE", float(confidence))
+                for prediction, confidence in zip(predictions, confidences)
+            ]
+            
+        except Exception as e:
+            # Pas d'erreur affichée
+            return [("ERROR", 0.0)] * len(texts)
\ No newline at end of file
@@ -0,0 +1,136 @@
+import time
+import threading
+import numpy as np
+
+from config import CASCADE_CONFIG
+from utils.bert_predictor import clean_text_for_bert
+from utils.model_loader import load_sparse_model
+from utils.timing import stage
+
+
+class CascadeScorer:
+    """
+    Two-stage cascade: a cheap TF-IDF/linear model scores every article and
+    only the ones whose margin falls inside the uncertainty band are escalated
+    to the BERT predictor.
+    """
+
+    def __init__(self, bert_predictor, models_dir=None, uncertainty_margin=None):
+        self.bert_predictor = bert_predictor
+        self.uncertainty_margin = (
+            CASCADE_CONFIG['UNCERTAINTY_MARGIN'] if uncertainty_margin is None else uncertainty_margin
+        )
+
+        if models_dir is None:
+            models_dir = CASCADE_CONFIG['MODELS_DIR'] or getattr(bert_predictor, 'base_path', 'models')
+        self.model, self.vectorizer, self.kind = load_sparse_model(models_dir)
+
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def loaded(self):
+        return self.model is not None
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {
+                'articles': 0,
+                'escalated': 0,
+                'stage1_seconds': 0.0,
+                'stage2_seconds': 0.0
+            }
+
+    def _margins(self, texts):
+        """Signed margin per text (> 0 means the positive class)"""
+        features = texts if self.kind == 'pipeline' else self.vectorizer.transform(texts)
+
+        if hasattr(self.model, 'decision_function'):
+            margins = np.asarray(self.model.decision_function(features), dtype=np.float64)
+        else:
+            # Probabilistic models: use the log-odds so the band means the same thing
+            probs = np.clip(self.model.predict_proba(features)[:, 1], 1e-6, 1 - 1e-6)
+            margins = np.log(probs / (1 - probs))
+
+        if margins.ndim > 1:
+            margins = margins[:, -1]
+        return margins
+
+    def _prepare(self, texts):
+        """
+        English text (translated like the BERT stage does) and its cleaned form,
+        which is what the sparse model was trained on.
+        """
+        translate = getattr(self.bert_predictor, 'translate_to_english', None)
+        if translate is not None:
+            with stage('translate'):
+                texts = [translate(text) for text in texts]
+        with stage('preprocess'):
+            cleaned = [clean_text_for_bert(text) for text in texts]
+        return texts, cleaned
+
+    def _is_real_class(self, label):
+        return label in (1, '1', True) or str(label).upper() == 'REAL'
+
+    def score_texts(self, texts):
+        """Return [(label, confidence), ...] in input order"""
+        texts = list(texts)
+        if not texts:
+            return []
+
+        # Stage 1: sparse linear model on everything, same preprocessing as its training data
+        start = time.perf_counter()
+        texts, cleaned = self._prepare(texts)
+        with stage('sparse_model'):
+            margins = self._margins(cleaned)
+        positive_is_real = self._is_real_class(self.model.classes_[-1]) if hasattr(self.model, 'classes_') else True
+        results = []
+        escalate = []
+        for i, margin in enumerate(margins):
+            if abs(margin) < self.uncertainty_margin:
+                escalate.append(i)
+                results.append(None)
+                continue
+            is_real = (margin > 0) == positive_is_real
+            confidence = float(1.0 / (1.0 + np.exp(-abs(margin))))
+            results.append(("REAL" if is_real else "FAKE", confidence))
+        stage1_seconds = time.perf_counter() - start
+
+        # Stage 2: BERT only for the uncertain band
+        stage2_seconds = 0.0
+        bert_ready = self.bert_predictor is not None and getattr(self.bert_predictor, 'bert', None) is not None
+        if escalate and bert_ready:
+            start = time.perf_counter()
+            # Already translated by _prepare: don't pay for a second translation round-trip
+            escalated_results = self.bert_predictor.predict_many([texts[i] for i in escalate], translated=True)
+            stage2_seconds = time.perf_counter() - start
+            for i, result in zip(escalate, escalated_results):
+                results[i] = result
+        else:
+            # No BERT to escalate to: keep the stage-1 guess, flagged as low confidence
+            for i in escalate:
+                is_real = (margins[i] > 0) == positive_is_real
+                results[i] = ("REAL" if is_real else "FAKE", 0.5)
+            escalate = []
+
+        with self._lock:
+            self.stats['articles'] += len(texts)
+            self.stats['escalated'] += len(escalate)
+            self.stats['stage1_seconds'] += stage1_seconds
+            self.stats['stage2_seconds'] += stage2_seconds
+
+        return results
+
+    def get_stats(self):
+        """Escalation rate and per-stage latency (ms per article scored by that stage)"""
+        with self._lock:
+            stats = dict(self.stats)
+        articles = stats['articles']
+        escalated = stats['escalated']
+        return {
+            'articles': articles,
+            'escalated': escalated,
+            'escalation_rate': escalated / articles if articles else 0.0,
+            'stage1_ms_per_article': stats['stage1_seconds'] * 1000 / articles if articles else 0.0,
+            'stage2_ms_per_article': stats['stage2_seconds'] * 1000 / escalated if escalated else 0.0
+        }
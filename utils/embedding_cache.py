@@ -0,0 +1,213 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class LRUCache:
+    """Small bounded in-memory LRU (most recently used entries stay)"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class EmbeddingCache:
+    """
+    Two-tier, content-addressed cache for BERT embeddings.
+
+    Tier 1 is a bounded in-memory LRU, tier 2 a SQLite file that survives
+    restarts. Keys are a hash of the preprocessed text plus the model version,
+    so retraining or swapping the BERT weights never serves stale vectors.
+    """
+
+    def __init__(self, db_path=None, memory_entries=2048, max_disk_bytes=256 * 1024 * 1024, model_version=""):
+        self.model_version = model_version
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = LRUCache(memory_entries)
+
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+
+        self._conn = None
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        if db_path:
+            self._open(db_path)
+
+    def _open(self, db_path):
+        """Open (or create) the on-disk store, memory-only if that fails"""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " vector BLOB NOT NULL,"
+                " nbytes INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_access ON embeddings(last_access)")
+            conn.commit()
+            self._disk_bytes = conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM embeddings").fetchone()[0]
+            self._conn = conn
+        except Exception as e:
+            print(f"Embedding cache warning: {e}")
+            self._conn = None
+
+    def make_key(self, processed_text):
+        """Content address: model version + preprocessed text"""
+        payload = f"{self.model_version}\0{processed_text}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get_many(self, keys):
+        """Return {key: vector} for every key found in either tier"""
+        found = {}
+        disk_keys = []
+        for key in keys:
+            vector = self.memory.get(key)
+            if vector is not None:
+                found[key] = vector
+                self.hits_memory += 1
+            else:
+                disk_keys.append(key)
+
+        if disk_keys and self._conn is not None:
+            disk_found = self._read_disk(disk_keys)
+            for key, vector in disk_found.items():
+                self.memory.put(key, vector)
+                found[key] = vector
+            self.hits_disk += len(disk_found)
+
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, items):
+        """Store {key: vector} in both tiers"""
+        rows = []
+        now = time.time()
+        for key, vector in items.items():
+            vector = np.asarray(vector, dtype=np.float32)
+            self.memory.put(key, vector)
+            blob = vector.tobytes()
+            rows.append((key, blob, len(blob), now))
+
+        if rows and self._conn is not None:
+            self._write_disk(rows)
+
+    def _read_disk(self, keys):
+        found = {}
+        with self._lock:
+            try:
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                    )
+                    for key, blob in cursor:
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+                if found:
+                    now = time.time()
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                        [(now, key) for key in found]
+                    )
+                    self._conn.commit()
+            except Exception as e:
+                print(f"Embedding cache warning: {e}")
+        return found
+
+    def _write_disk(self, rows):
+        with self._lock:
+            try:
+                existing = self._stored_sizes([row[0] for row in rows])
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, nbytes, last_access) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+                self._disk_bytes += sum(row[2] for row in rows) - sum(existing.values())
+                if self._disk_bytes > self.max_disk_bytes:
+                    self._evict()
+            except Exception as e:
+                print(f"Embedding cache warning: {e}")
+
+    def _stored_sizes(self, keys):
+        sizes = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT key, nbytes FROM embeddings WHERE key IN ({placeholders})", chunk
+            )
+            sizes.update(dict(cursor))
+        return sizes
+
+    def _evict(self):
+        """Drop least recently used rows until the store is back under 90% of its budget"""
+        target = int(self.max_disk_bytes * 0.9)
+        cursor = self._conn.execute("SELECT key, nbytes FROM embeddings ORDER BY last_access ASC")
+        victims = []
+        freed = 0
+        for key, nbytes in cursor:
+            if self._disk_bytes - freed <= target:
+                break
+            victims.append((key,))
+            freed += nbytes
+        cursor.close()
+        self._conn.executemany("DELETE FROM embeddings WHERE key = ?", victims)
+        self._conn.commit()
+        self._disk_bytes -= freed
+
+    def stats(self):
+        """Hit/miss counters and current sizes of both tiers"""
+        lookups = self.hits_memory + self.hits_disk + self.misses
+        disk_entries = 0
+        if self._conn is not None:
+            with self._lock:
+                disk_entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {
+            'hits_memory': self.hits_memory,
+            'hits_disk': self.hits_disk,
+            'misses': self.misses,
+            'hit_rate': (self.hits_memory + self.hits_disk) / lookups if lookups else 0.0,
+            'memory_entries': len(self.memory),
+            'disk_entries': disk_entries,
+            'disk_bytes': self._disk_bytes
+        }
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
@@ -9,8 +9,8 @@ import re
 import numpy as np
 from urllib.parse import urlparse
 import streamlit as st
-from duckduckgo_search import DDGS
-from sentence_transformers import CrossEncoder
+from utils.timing import stage
+# duckduckgo_search / sentence_transformers are imported on first use (slow imports)
 
 # ---------------------------
 #  Load / Download Model Locally
@@ -42,6 +42,8 @@ class FactChecker:
     def _load_model(_self):
         """Loads the model. Cached by Streamlit."""
         try:
+            from sentence_transformers import CrossEncoder
+
             # Check standard paths
             if os.path.exists(MODEL_DIR) and len(os.listdir(MODEL_DIR)) > 0:
                 return CrossEncoder(MODEL_DIR)
@@ -82,6 +84,10 @@ class FactChecker:
         """
         clean_q = self._clean_query(query)
         results = []
+        try:
+            from duckduckgo_search import DDGS
+        except ImportError:
+            return results
         
         # Attempt 1: Full Cleaned Title
         try:
@@ -120,7 +126,8 @@ class FactChecker:
         t = self.translations.get(lang, self.translations['en'])
         
         # 1. Perform Smart Search
-        results = self.search_web(claim)
+        with stage('fact_search'):
+            results = self.search_web(claim)
         
         if not results:
             return {"status": t['fake'], "reason": t['no_results'], "confidence": 0.85, "evidence": [], "color": "red"}
@@ -136,7 +143,8 @@ class FactChecker:
             return {"status": t['uncertain'], "reason": "No text to analyze", "confidence": 0, "evidence": [], "color": "orange"}
 
         # 3. Predict
-        logits_list = self.model.predict(snippets)
+        with stage('fact_nli'):
+            logits_list = self.model.predict(snippets)
 
         valid_idx = 0
         for res in results:
@@ -0,0 +1,76 @@
+import os
+import random
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import API_CONFIG, HTTP_CONFIG
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry with "full jitter" backoff: before the n-th retry, sleep a
+    random time in [0, BACKOFF_FACTOR * 2**(n-1)] (capped at BACKOFF_MAX), so
+    clients failing together don't all come back at the same moment.
+    A Retry-After header from the server (429 / 503) still takes precedence.
+    """
+
+    def get_backoff_time(self):
+        errors = [entry for entry in self.history if entry.redirect_location is None]
+        if not errors:
+            return 0
+        ceiling = min(HTTP_CONFIG['BACKOFF_MAX'], HTTP_CONFIG['BACKOFF_FACTOR'] * 2 ** (len(errors) - 1))
+        return random.uniform(0, ceiling)
+
+def make_retry(retries=None):
+    """Bounded retries for idempotent requests: connection errors, read errors and RETRY_STATUSES"""
+    return JitteredRetry(
+        total=API_CONFIG['MAX_RETRIES'] if retries is None else retries,
+        status_forcelist=HTTP_CONFIG['RETRY_STATUSES'],
+        allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+        # After the last retry the error response is returned, callers check status_code
+        raise_on_status=False
+    )
+
+def create_session(retries=None):
+    """New session with keep-alive connection pools per host and the retry policy"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_CONFIG['POOL_HOSTS'],
+        pool_maxsize=HTTP_CONFIG['POOL_SIZE_PER_HOST'],
+        max_retries=make_retry(retries)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+_session = None
+_session_pid = None
+_lock = threading.Lock()
+
+def get_session():
+    """
+    Process-wide session (one per process: a forked worker gets its own
+    instead of sharing the parent's sockets). urllib3 pools are thread-safe.
+    """
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        with _lock:
+            if _session is None or _session_pid != os.getpid():
+                _session = create_session()
+                _session_pid = os.getpid()
+    return _session
+
+def default_timeout(read_timeout=None):
+    """(connect, read) timeout tuple from HTTP_CONFIG"""
+    return (HTTP_CONFIG['CONNECT_TIMEOUT'], HTTP_CONFIG['READ_TIMEOUT'] if read_timeout is None else read_timeout)
+
+def request(method, url, timeout=None, **kwargs):
+    """requests.request through the shared session; timeout = read timeout in seconds or a (connect, read) tuple"""
+    if not isinstance(timeout, tuple):
+        timeout = default_timeout(timeout)
+    return get_session().request(method, url, timeout=timeout, **kwargs)
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
@@ -0,0 +1,94 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from config import SERVER_CONFIG
+
+class MicroBatcher:
+    """
+    Coalesce concurrent requests into model batches.
+
+    Callers submit items and get a Future back. A single worker thread takes
+    the first waiting item, then keeps collecting until it has max_batch_size
+    items or max_wait_ms have passed since that first item, and scores them
+    with one score_fn(items) call (which must return one result per item).
+    The model is therefore only ever used from that one thread.
+    """
+
+    def __init__(self, score_fn, max_batch_size=None, max_wait_ms=None):
+        self.score_fn = score_fn
+        self.max_batch_size = max(1, max_batch_size or SERVER_CONFIG['MAX_BATCH_SIZE'])
+        self.max_wait = (SERVER_CONFIG['MAX_WAIT_MS'] if max_wait_ms is None else max_wait_ms) / 1000
+        self._queue = queue.Queue()
+        self._closed = False
+        self.batches = 0
+        self.items = 0
+        self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, item):
+        """Future resolved with score_fn's result for this item"""
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def submit_many(self, items):
+        return [self.submit(item) for item in items]
+
+    def _collect(self):
+        """Block for a first item, then gather more until the batch is full or the wait is over"""
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                # Close requested: finish this batch first
+                self._queue.put(None)
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            # Skip requests whose caller already gave up
+            live = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+            if not live:
+                continue
+            items = [item for item, _ in live]
+            try:
+                results = self.score_fn(items)
+                for (_, future), result in zip(live, results):
+                    future.set_result(result)
+            except Exception as e:
+                for _, future in live:
+                    future.set_exception(e)
+            self.batches += 1
+            self.items += len(items)
+
+    def stats(self):
+        return {
+            'batches': self.batches,
+            'items': self.items,
+            'avg_batch_size': self.items / self.batches if self.batches else 0.0,
+            'queued': self._queue.qsize()
+        }
+
+    def close(self, timeout=None):
+        """Score what is already queued, then stop the worker"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join(timeout)
@@ -2,9 +2,21 @@ import joblib
 import streamlit as st
 import os
 import glob
-from sklearn.feature_extraction.text import TfidfVectorizer
 
-def find_model_files():
+MODEL_PATTERNS = [
+    '*model*.pkl',
+    '*classifier*.pkl',
+    '*svm*.pkl',
+    '*fake*.pkl'
+]
+
+VECTORIZER_PATTERNS = [
+    '*vectorizer*.pkl',
+    '*tfidf*.pkl',
+    '*count*.pkl'
+]
+
+def find_model_files(models_dir='models'):
     """
     Automatically find model and vectorizer files in the models folder
     """
@@ -15,18 +27,8 @@ def find_model_files():
     }
     
     # Look for common model file patterns
-    model_patterns = [
-        'models/*model*.pkl',
-        'models/*classifier*.pkl', 
-        'models/*svm*.pkl',
-        'models/*fake*.pkl'
-    ]
-    
-    vectorizer_patterns = [
-        'models/*vectorizer*.pkl',
-        'models/*tfidf*.pkl',
-        'models/*count*.pkl'
-    ]
+    model_patterns = [os.path.join(models_dir, pattern) for pattern in MODEL_PATTERNS]
+    vectorizer_patterns = [os.path.join(models_dir, pattern) for pattern in VECTORIZER_PATTERNS]
     
     # Find model files
     for pattern in model_patterns:
@@ -57,6 +59,47 @@ def find_model_files():
     
     return model_files
 
+def load_sparse_model(models_dir='models'):
+    """
+    Quietly load a text-in sparse linear model (TF-IDF + SVM/linear or a full
+    pipeline) for the cascade's first stage. Model files that do not take the
+    vectorizer's output (e.g. the BERT-embedding classifier) are skipped.
+    
+    Returns (model, vectorizer, kind) with kind in 'pipeline', 'separate', 'none'.
+    """
+    vectorizer = None
+    for pattern in VECTORIZER_PATTERNS:
+        files = sorted(glob.glob(os.path.join(models_dir, pattern)))
+        if files:
+            try:
+                vectorizer = joblib.load(files[0])
+            except Exception:
+                vectorizer = None
+            break
+    
+    candidates = []
+    for pattern in MODEL_PATTERNS:
+        for file in sorted(glob.glob(os.path.join(models_dir, pattern))):
+            name = os.path.basename(file).lower()
+            if 'vector' in name or 'tfidf' in name or file in candidates:
+                continue
+            candidates.append(file)
+    
+    for file in candidates:
+        try:
+            model = joblib.load(file)
+        except Exception:
+            continue
+        
+        if hasattr(model, 'steps') or hasattr(model, 'named_steps'):
+            return model, None, 'pipeline'
+        
+        if vectorizer is not None and hasattr(vectorizer, 'vocabulary_'):
+            if getattr(model, 'n_features_in_', None) == len(vectorizer.vocabulary_):
+                return model, vectorizer, 'separate'
+    
+    return None, None, 'none'
+
 @st.cache_resource
 def load_model_with_vectorizer():
     """
@@ -110,6 +153,7 @@ def create_compatible_vectorizer():
     Create a basic TF-IDF vectorizer as fallback
     """
     try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
         vectorizer = TfidfVectorizer(
             max_features=5000,
             min_df=2,
@@ -1,9 +1,9 @@
-import requests
 import json
 import time
 from datetime import datetime, timedelta
 import streamlit as st
-from config import NEWS_API_CONFIG, SEARCH_QUERIES
+from config import SEARCH_QUERIES, API_CONFIG
+from utils import http_session
 
 class NewsFetcher:
     def __init__(self):
@@ -33,7 +33,7 @@ class NewsFetcher:
                 'pageSize': 20
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = http_session.get(url, params=params, timeout=API_CONFIG['NEWS_API_TIMEOUT'])
             
             if response.status_code == 200:
                 articles = response.json().get('articles', [])
@@ -60,7 +60,7 @@ class NewsFetcher:
                 'q': query
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = http_session.get(url, params=params, timeout=API_CONFIG['NEWS_API_TIMEOUT'])
             
             if response.status_code == 200:
                 data = response.json()
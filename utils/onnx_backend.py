@@ -0,0 +1,77 @@
+import os
+import inspect
+import numpy as np
+import torch
+
+
+class _LastHiddenState(torch.nn.Module):
+    """Wrap BertModel so the exported graph has a single, named output"""
+
+    def __init__(self, bert):
+        super().__init__()
+        self.bert = bert
+
+    def forward(self, input_ids, attention_mask):
+        return self.bert(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+
+def export_bert_to_onnx(bert, onnx_path, opset_version=14):
+    """
+    Export a BertModel to ONNX once, with dynamic batch and sequence axes.
+
+    Returns True when the file was written.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(onnx_path)), exist_ok=True)
+    wrapper = _LastHiddenState(bert).eval()
+
+    dummy_ids = torch.ones((2, 8), dtype=torch.long)
+    dummy_mask = torch.ones((2, 8), dtype=torch.long)
+
+    # Newer torch defaults to the dynamo exporter, keep the TorchScript one
+    export_kwargs = {}
+    if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs['dynamo'] = False
+
+    with torch.no_grad():
+        torch.onnx.export(
+            wrapper,
+            (dummy_ids, dummy_mask),
+            onnx_path,
+            input_names=['input_ids', 'attention_mask'],
+            output_names=['last_hidden_state'],
+            dynamic_axes={
+                'input_ids': {0: 'batch', 1: 'sequence'},
+                'attention_mask': {0: 'batch', 1: 'sequence'},
+                'last_hidden_state': {0: 'batch', 1: 'sequence'}
+            },
+            opset_version=opset_version,
+            **export_kwargs
+        )
+    return os.path.exists(onnx_path)
+
+
+class OnnxBertEncoder:
+    """BERT feature extractor served by onnxruntime's CPU execution provider"""
+
+    def __init__(self, onnx_path, num_threads=None):
+        # Optional dependency: only needed when BACKEND == 'onnx'
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.onnx_path = onnx_path
+        self.session = ort.InferenceSession(onnx_path, options, providers=['CPUExecutionProvider'])
+
+    def last_hidden_state(self, input_ids, attention_mask):
+        """Run the encoder on int64 numpy arrays of shape (batch, sequence)"""
+        outputs = self.session.run(
+            ['last_hidden_state'],
+            {
+                'input_ids': np.asarray(input_ids, dtype=np.int64),
+                'attention_mask': np.asarray(attention_mask, dtype=np.int64)
+            }
+        )
+        return outputs[0]
@@ -0,0 +1,151 @@
+import gc
+import os
+import multiprocessing
+from collections import deque
+
+from config import PARALLEL_CONFIG
+
+# Set in each worker process by _init_worker
+_worker_predictor = None
+# Parent's predictors handed to forked workers (copy-on-write, never pickled), per
+# pool and for the pool's whole life: workers the pool respawns fork from it too
+_fork_predictors = {}
+# Why the worker has no model (load failure), reported by _score_shard
+_worker_error = None
+# Objects inherited from the parent that must not be used (or closed) in a worker
+_inherited = []
+
+def _init_worker(threads, pool_key, predictor_kwargs):
+    """Worker start-up: reuse the forked model or load one, pin torch threads"""
+    global _worker_predictor, _worker_error
+
+    import torch
+    torch.set_num_threads(max(1, threads))
+
+    predictor = _fork_predictors.get(pool_key)
+    if predictor is not None:
+        # SQLite connections and ONNX sessions must not cross fork: reopen them
+        if predictor.embedding_cache is not None:
+            _inherited.append(predictor.embedding_cache)
+            predictor.embedding_cache = predictor._create_embedding_cache()
+        if predictor.onnx_encoder is not None:
+            _inherited.append(predictor.onnx_encoder)
+            predictor.onnx_encoder = predictor._load_onnx_encoder()
+    else:
+        from utils.bert_predictor import BERTPredictor
+        predictor = BERTPredictor(load=False, **predictor_kwargs)
+        # Not raised here: an initializer that fails makes the pool respawn workers forever
+        if not predictor.load_models(verbose=False) or predictor.bert is None:
+            _worker_error = f"worker {os.getpid()} could not load the model from {predictor_kwargs['models_dir']}"
+            predictor = None
+
+    _worker_predictor = predictor
+
+def _score_shard(texts):
+    if _worker_predictor is None:
+        raise RuntimeError(_worker_error)
+    return _worker_predictor.predict_many(texts)
+
+class ParallelScorer:
+    """
+    Process pool for bulk scoring with BERTPredictor.
+
+    With the 'fork' start method the parent loads the model once and the
+    workers share its weights copy-on-write (tensor storages are never
+    written, so those pages stay shared). With 'spawn' each worker loads the
+    model itself. Texts go out in shards of SHARD_SIZE and results come back
+    in input order.
+    """
+
+    def __init__(self, predictor=None, models_dir=None, workers=None, threads_per_worker=None,
+                 shard_size=None, start_method=None):
+        self.workers = PARALLEL_CONFIG['WORKERS'] if workers is None else workers
+        if not self.workers:
+            self.workers = os.cpu_count() or 1
+        self.threads_per_worker = threads_per_worker or PARALLEL_CONFIG['TORCH_THREADS_PER_WORKER']
+        self.shard_size = max(1, shard_size or PARALLEL_CONFIG['SHARD_SIZE'])
+        self.start_method = start_method or PARALLEL_CONFIG['START_METHOD']
+        if self.start_method not in multiprocessing.get_all_start_methods():
+            self.start_method = 'spawn'
+
+        if predictor is None:
+            from utils.bert_predictor import BERTPredictor
+            predictor = BERTPredictor(models_dir=models_dir, load=False)
+            predictor.load_models(verbose=False)
+        self.predictor = predictor
+        self.pool = None
+
+    def start(self):
+        """Create the worker pool (no-op with a single worker)"""
+        if self.pool is not None or self.workers <= 1:
+            return self
+
+        predictor_kwargs = {
+            'models_dir': self.predictor.base_path,
+            'backend': self.predictor.backend,
+            'quantize': self.predictor.quantize,
+            'long_document': self.predictor.long_document
+        }
+        context = multiprocessing.get_context(self.start_method)
+        if self.start_method == 'fork':
+            _fork_predictors[id(self)] = self.predictor
+            # Objects that exist now won't be touched by the workers' GC (fewer copied pages)
+            gc.freeze()
+        try:
+            self.pool = context.Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.threads_per_worker, id(self), predictor_kwargs)
+            )
+        except Exception:
+            _fork_predictors.pop(id(self), None)
+            raise
+        finally:
+            if self.start_method == 'fork':
+                gc.unfreeze()
+        return self
+
+    def score_iter(self, texts):
+        """Yield (label, confidence) per text, in input order, as shards complete"""
+        shards = self._shards(texts)
+        if self.workers <= 1:
+            for shard in shards:
+                yield from self.predictor.predict_many(shard)
+            return
+
+        # At most two shards per worker in flight: ordered output, bounded memory
+        self.start()
+        in_flight = deque()
+        for shard in shards:
+            in_flight.append(self.pool.apply_async(_score_shard, (shard,)))
+            if len(in_flight) >= 2 * self.workers:
+                yield from in_flight.popleft().get()
+        while in_flight:
+            yield from in_flight.popleft().get()
+
+    def score(self, texts):
+        """List of (label, confidence) for all texts"""
+        return list(self.score_iter(texts))
+
+    def _shards(self, texts):
+        shard = []
+        for text in texts:
+            shard.append(text)
+            if len(shard) >= self.shard_size:
+                yield shard
+                shard = []
+        if shard:
+            yield shard
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        _fork_predictors.pop(id(self), None)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
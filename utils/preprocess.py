@@ -1,11 +1,21 @@
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
+import threading
+from functools import lru_cache
+import pandas as pd
+
+# NLTK is imported and its data checked on first use, not on import
+lemmatizer = None
+stop_words = None
+_nltk_lock = threading.Lock()
+
+# Cleaning patterns, compiled once
+URL_PATTERN = re.compile(r'http\S+')
+NON_LETTER_PATTERN = re.compile(r'[^a-zA-Z\s]')
 
 # Download required NLTK data
 def download_nltk_data():
+    import nltk
+
     try:
         nltk.data.find('tokenizers/punkt')
     except LookupError:
@@ -21,12 +31,31 @@ def download_nltk_data():
     except LookupError:
         nltk.download('wordnet')
 
-# Download NLTK data on import
-download_nltk_data()
+def ensure_nltk_data():
+    """Check/download NLTK data and initialize lemmatizer and stopwords (once)"""
+    global lemmatizer, stop_words
+    if stop_words is not None:
+        return
+    with _nltk_lock:
+        if stop_words is not None:
+            return
+        download_nltk_data()
 
-# Initialize lemmatizer and stopwords
-lemmatizer = WordNetLemmatizer()
-stop_words = set(stopwords.words('english'))
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+        lemmatizer = WordNetLemmatizer()
+        stop_words = set(stopwords.words('english'))
+
+@lru_cache(maxsize=65536)
+def _normalize_token(token):
+    """Lemma of a token, or '' for stopwords and tokens of 2 letters or less"""
+    if token in stop_words or len(token) <= 2:
+        return ''
+    return lemmatizer.lemmatize(token)
+
+def _join_tokens(tokens):
+    """Drop stopwords/short tokens and lemmatize (cached per distinct token)"""
+    return ' '.join(lemma for lemma in map(_normalize_token, tokens) if lemma)
 
 def preprocess_text(text):
     """
@@ -42,34 +71,63 @@ def preprocess_text(text):
         return ""
     
     try:
+        ensure_nltk_data()
+
         # Convert to lowercase
         text = text.lower()
         
         # Remove URLs
-        text = re.sub(r'http\S+', '', text)
+        text = URL_PATTERN.sub('', text)
         
         # Remove special characters and digits, keep only letters and spaces
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
+        text = NON_LETTER_PATTERN.sub('', text)
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Tokenize
-        tokens = word_tokenize(text)
+        # Remove extra whitespace and tokenize: only letters and whitespace are
+        # left at this point, so word_tokenize would return exactly these words
+        tokens = text.split()
+        text = ' '.join(tokens)
         
         # Remove stopwords and lemmatize
-        processed_tokens = []
-        for token in tokens:
-            if token not in stop_words and len(token) > 2:
-                lemmatized_token = lemmatizer.lemmatize(token)
-                processed_tokens.append(lemmatized_token)
-        
-        return ' '.join(processed_tokens)
+        return _join_tokens(tokens)
     
     except Exception as e:
         print(f"Error in preprocessing: {e}")
         return text  # Return original text if preprocessing fails
 
+def preprocess_texts(texts):
+    """
+    Batch version of preprocess_text
+    
+    Args:
+        texts (list or pd.Series): Input texts
+    
+    Returns:
+        list or pd.Series: Preprocessed texts (a Series keeps its index)
+    """
+    is_series = isinstance(texts, pd.Series)
+    values = texts.tolist() if is_series else list(texts)
+    
+    try:
+        # NLTK check once for the whole batch, then one fused pass per text
+        ensure_nltk_data()
+        processed = [_preprocess_checked(text) for text in values]
+    
+    except Exception as e:
+        print(f"Error in batch preprocessing: {e}")
+        # Same fallback as preprocess_text: original text
+        processed = [text if isinstance(text, str) and text.strip() else "" for text in values]
+    
+    return pd.Series(processed, index=texts.index, dtype=object) if is_series else processed
+
+def _preprocess_checked(text):
+    """preprocess_text body for an already initialized NLTK"""
+    if not isinstance(text, str):
+        return ""
+    text = text.lower()
+    if 'http' in text:
+        text = URL_PATTERN.sub('', text)
+    return _join_tokens(NON_LETTER_PATTERN.sub('', text).split())
+
 def get_text_statistics(text):
     """
     Get basic statistics about the text
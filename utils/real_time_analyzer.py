@@ -2,53 +2,97 @@ import pandas as pd
 import streamlit as st
 import time
 import numpy as np
-import re
+import threading
+from config import ANALYSIS_CONFIG, CASCADE_CONFIG
+from utils.rules import RuleEngine
+from utils import timing
+from utils.analysis_store import AnalysisStore, content_hash
+from utils.aggregates import AnalysisAggregates
 
 try:
     from utils.bert_predictor import BERTPredictor
+    from utils.cascade import CascadeScorer
 except ImportError as e:
     # Pas de notification d'erreur
     pass
 
+class ThrottledProgress:
+    """Streamlit progress bar that redraws at most once per interval"""
+    
+    def __init__(self, progress_bar, total, interval=None):
+        self.progress_bar = progress_bar
+        self.total = max(total, 1)
+        self.interval = ANALYSIS_CONFIG['PROGRESS_INTERVAL'] if interval is None else interval
+        self.last_draw = 0.0
+    
+    def update(self, done, force=False):
+        now = time.perf_counter()
+        if force or now - self.last_draw >= self.interval:
+            self.progress_bar.progress(min(done / self.total, 1.0))
+            self.last_draw = now
+
 class RealTimeAnalyzer:
-    def __init__(self):
+    def __init__(self, background=False, models_dir=None, store=None):
+        self.models_dir = models_dir
         self.bert_predictor = None
+        self.cascade = None
+        self.scorer = None  # optional ParallelScorer for bulk jobs
         self.model_loaded = False
-        self.load_models()
+        self.status = "loading"
+        self.ready_event = threading.Event()
+        self.rules = RuleEngine.from_file()
+        # Shared result store (store=False: always re-analyze)
+        self.store = AnalysisStore.from_config() if store is None else (store or None)
+        # Dashboard rollups, fed by every analyzed batch
+        self.aggregates = AnalysisAggregates()
+        
+        if background:
+            # Rule-based results are served until the loader thread flips model_loaded
+            loader = threading.Thread(target=self.load_models, kwargs={'verbose': False}, name="model-loader", daemon=True)
+            loader.start()
+        else:
+            self.load_models()
     
-    def load_models(self):
-        """Load BERT-based models silently"""
+    def load_models(self, verbose=False):
+        """Load BERT-based models silently, then warm them up"""
         try:
-            self.bert_predictor = BERTPredictor()
-            self.model_loaded = self.bert_predictor.load_models()
+            bert_predictor = BERTPredictor(models_dir=self.models_dir, load=False)
+            loaded = bert_predictor.load_models(verbose=verbose)
+            
+            # Optional cascade: sparse linear model first, BERT for uncertain articles
+            cascade = None
+            if loaded and CASCADE_CONFIG['ENABLED']:
+                cascade = CascadeScorer(bert_predictor)
+                cascade = cascade if cascade.loaded else None
+            
+            if loaded:
+                bert_predictor.warm_up()
+            
+            # Publish only once everything is ready
+            self.bert_predictor = bert_predictor
+            self.cascade = cascade
+            self.model_loaded = loaded
+            self.status = "ready" if loaded else "fallback"
             # Pas de messages de succès/erreur
                 
         except Exception as e:
             # Pas de notification d'erreur
             self.model_loaded = False
+            self.status = "fallback"
+        finally:
+            self.ready_event.set()
+    
+    def is_ready(self):
+        """True once loading finished (successfully or not)"""
+        return self.ready_event.is_set()
+    
+    def wait_until_ready(self, timeout=None):
+        """Block until the background loader is done (CLI / server use)"""
+        return self.ready_event.wait(timeout)
     
     def enhanced_pre_detection(self, text):
         """Enhanced rule-based detection for obvious fake news"""
-        text_lower = text.lower()
-        
-        # OBVIOUS FAKE NEWS PATTERNS
-        obvious_fake_patterns = [
-            r'vampire', r'werewolf', r'zombie', r'alien.*abduction', r'bigfoot',
-            r'loch ness', r'ghost.*killed', r'supernatural.*kill',
-            r'miracle.*cure', r'instant.*weight loss', r'one weird trick',
-            r'doctors hate', r'secret.*government', r'202[5-9].*killed'
-        ]
-        
-        # Check for obvious fake patterns
-        fake_matches = 0
-        for pattern in obvious_fake_patterns:
-            if re.search(pattern, text_lower):
-                fake_matches += 1
-        
-        if fake_matches >= 1:
-            return True, 0.95
-        
-        return None, None
+        return self.rules.pre_detection(text)
     
     def predict_with_bert(self, text):
         """Predict using BERT model"""
@@ -61,9 +105,9 @@ class RealTimeAnalyzer:
                 else:
                     return "REAL", pre_confidence
             
-            # Use BERT model
+            # Use BERT model (through the cascade when enabled)
             if self.model_loaded and self.bert_predictor:
-                return self.bert_predictor.predict(text)
+                return self.predict_texts_with_model([text])[0]
             else:
                 return self.rule_based_analysis(text)
                 
@@ -71,9 +115,33 @@ class RealTimeAnalyzer:
             # Pas d'erreur affichée
             return self.rule_based_analysis(text)
     
+    def predict_texts_with_model(self, texts):
+        """Score texts with the cascade if enabled, otherwise batched BERT"""
+        if self.cascade is not None:
+            return self.cascade.score_texts(texts)
+        if self.scorer is not None:
+            return self.scorer.score(texts)
+        return self.bert_predictor.predict_many(texts)
+    
+    def predict_texts_safely(self, texts):
+        """
+        Batched model scoring, rule-based fallback if the batch fails.
+        Returns (predictions, method override): the override is "Rule-Based"
+        when the fallback was used, None for real model output.
+        """
+        try:
+            return self.predict_texts_with_model(texts), None
+        except Exception as e:
+            # Pas d'erreur affichée
+            return [self.rule_based_analysis(text) for text in texts], "Rule-Based"
+    
+    def article_text(self, article):
+        """Text scored for an article: title followed by content"""
+        return f"{article.get('title', '')} {article.get('content', '')}"
+    
     def predict_article(self, article):
         """Predict if an article is fake news"""
-        text = f"{article['title']} {article['content']}"
+        text = self.article_text(article)
         
         if self.model_loaded:
             return self.predict_with_bert(text)
@@ -82,33 +150,149 @@ class RealTimeAnalyzer:
     
     def rule_based_analysis(self, text):
         """Rule-based fake news detection as fallback"""
-        text_lower = text.lower()
-        
-        fake_indicators = [
-            'breaking', 'shocking', 'secret', 'hidden', 'they don\'t want you to know',
-            'miracle', 'instant', 'urgent', 'warning', 'alert', 'fake', 'hoax',
-            'vampire', 'werewolf', 'zombie', 'alien', 'bigfoot', 'ghost'
-        ]
+        return self.rules.rule_based(text)
+    
+    def analyze_stream(self, articles, batch_size=None):
+        """
+        Yield analysis results micro-batch by micro-batch, as soon as they are scored.
         
-        reliability_indicators = [
-            'according to study', 'research shows', 'official report',
-            'experts say', 'peer-reviewed', 'journal', 'university', 'study'
-        ]
+        Each yielded list holds result dicts (same fields as analyze_news_batch)
+        in input order; concatenated they equal analyze_news_batch(articles).
+        `articles` can be any iterable, it is consumed lazily.
+        """
+        # Snapshot: the background loader may finish in the middle of the stream
+        return self._analyze_stream(articles, self.model_loaded, batch_size)
+    
+    def _analyze_stream(self, articles, model_loaded, batch_size=None):
+        method = self.get_model_info() if model_loaded else "Rule-Based"
+        batch_size = max(1, batch_size or ANALYSIS_CONFIG['BATCH_SIZE'])
+        store = self.store
+        version = self.analysis_version(model_loaded)
         
-        fake_score = sum(2 for word in fake_indicators if word in text_lower)
-        reliability_score = sum(1 for word in reliability_indicators if word in text_lower)
+        ready = []    # results (or articles waiting for the model) in input order
+        pending = []  # (position in ready, text, stage timings) of the articles waiting for the model
+        fresh = []    # (position in ready, content hash or None) of the newly analyzed results
         
-        total_score = reliability_score - fake_score
+        for article in articles:
+            text = self.article_text(article)
+            
+            # 1. Stored result, else pre-detection (or rule-based analysis without a model)
+            prediction = None
+            stored = None
+            key = None
+            with timing.collect() as article_timings:
+                if store is not None:
+                    with timing.stage('store_lookup'):
+                        key = content_hash(text)
+                        stored = store.get(key, version)
+                if stored is None and model_loaded:
+                    with timing.stage('pre_detection'):
+                        pre_detection, pre_confidence = self.enhanced_pre_detection(text)
+                    if pre_detection is not None:
+                        prediction = ("FAKE" if pre_detection else "REAL", pre_confidence)
+                elif stored is None:
+                    with timing.stage('rules'):
+                        prediction = self.rule_based_analysis(text)
+            
+            if stored is not None:
+                ready.append(self._stored_result(article, stored, article_timings))
+            elif prediction is None:
+                pending.append((len(ready), text, article_timings))
+                ready.append(article)
+            else:
+                ready.append(self._make_result(article, prediction, method, article_timings))
+            if stored is None:
+                fresh.append((len(ready) - 1, key))
+            
+            # 2. A full model batch (or a full batch of rule results) is flushed right away
+            if len(pending) >= batch_size or (not pending and len(ready) >= batch_size):
+                self._score_pending(ready, pending, method)
+                self._store_results(ready, fresh, version, method)
+                self._aggregate(ready, fresh)
+                yield ready
+                ready, pending, fresh = [], [], []
         
-        if total_score >= 2:
-            return "REAL", 0.8
-        elif total_score <= -1:
-            return "FAKE", 0.9
-        else:
-            return "UNCERTAIN", 0.5
+        if ready:
+            self._score_pending(ready, pending, method)
+            self._store_results(ready, fresh, version, method)
+            self._aggregate(ready, fresh)
+            yield ready
+    
+    def _score_pending(self, ready, pending, method):
+        """Replace the articles waiting in `ready` by their model results (one batch)"""
+        if not pending:
+            return
+        with timing.collect() as batch_timings:
+            predictions, fallback_method = self.predict_texts_safely([text for _, text, _ in pending])
+        for (position, _, article_timings), prediction in zip(pending, predictions):
+            # Batched stages are shared evenly by the articles of the batch
+            for name, seconds in batch_timings.items():
+                article_timings[name] = article_timings.get(name, 0.0) + seconds / len(pending)
+            ready[position] = self._make_result(ready[position], prediction, fallback_method or method, article_timings)
+    
+    def _store_results(self, ready, fresh, version, method):
+        """
+        Save the newly analyzed results of a micro-batch (one transaction).
+        Model failures ("ERROR") and rule-based fallbacks are not real verdicts
+        for this version: they are scored again next time instead.
+        """
+        if self.store is None:
+            return
+        fresh = [
+            (position, key) for position, key in fresh
+            if ready[position]['prediction'] != "ERROR" and ready[position]['method'] == method
+        ]
+        if not fresh:
+            return
+        with timing.stage('store_write'):
+            self.store.put_many([
+                {
+                    'content_hash': key,
+                    'model_version': version,
+                    'url': ready[position].get('url'),
+                    'title': ready[position].get('title'),
+                    'prediction': ready[position]['prediction'],
+                    'confidence': ready[position]['confidence'],
+                    'method': ready[position]['method'],
+                    'updated_at': ready[position]['analysis_time']
+                }
+                for position, key in fresh
+            ])
+    
+    def _aggregate(self, ready, fresh):
+        """Dashboard rollups: only newly analyzed results (store hits were counted when first analyzed)"""
+        self.aggregates.update_many([ready[position] for position, _ in fresh])
+    
+    def _stored_result(self, article, stored, stage_timings=None):
+        """Result dict for an article found in the store (same fields as a fresh one)"""
+        result = self._make_result(article, (stored['prediction'], stored['confidence']), stored['method'], stage_timings)
+        result['analysis_time'] = stored['updated_at']
+        return result
+    
+    def _make_result(self, article, prediction, method, stage_timings=None):
+        prediction, confidence = prediction
+        result = {
+            **article,
+            'prediction': prediction,
+            'confidence': confidence,
+            'analysis_time': time.time(),
+            'method': method
+        }
+        if timing.timings.enabled:
+            # Per-article stage durations in ms, 'total' is their sum
+            breakdown = timing.breakdown_ms(stage_timings or {})
+            breakdown['total'] = round(sum(breakdown.values()), 3)
+            result['timings'] = breakdown
+        return result
     
     def analyze_news_batch(self, articles):
-        """Analyze a batch of articles in real-time"""
+        """
+        Analyze a batch of articles in real-time.
+        
+        Consumes analyze_stream: pre-detection per article, the survivors go
+        through the model ANALYSIS_CONFIG['BATCH_SIZE'] texts per call.
+        Results come back in input order with the same fields as before.
+        """
         results = []
         
         if not articles:
@@ -117,32 +301,88 @@ class RealTimeAnalyzer:
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        if self.model_loaded:
-            method = "BERT Model + Enhanced Detection"
+        model_loaded = self.model_loaded
+        if model_loaded:
+            method = self.get_model_info()
         else:
             method = "Rule-Based"
             
         status_text.text(f"🔄 Analyzing with {method}...")
         
-        for i, article in enumerate(articles):
-            prediction, confidence = self.predict_article(article)
-            
-            result = {
-                **article,
-                'prediction': prediction,
-                'confidence': confidence,
-                'analysis_time': time.time(),
-                'method': method
-            }
-            results.append(result)
-            
-            progress_bar.progress((i + 1) / len(articles))
+        progress = ThrottledProgress(progress_bar, len(articles))
+        for batch in self._analyze_stream(articles, model_loaded):
+            results.extend(batch)
+            progress.update(len(results))
         
+        progress.update(len(results), force=True)
         status_text.text("✅ Analysis complete!")
         return results
     
-    def get_model_info(self):
-        """Get information about the loaded model"""
+    def get_model_info(self, include_timings=False):
+        """
+        Get information about the loaded model.
+        With include_timings=True returns {'model': <description>, 'timings': get_timing_stats()}.
+        """
         if not self.model_loaded:
-            return "Rule-Based Analysis"
-        return "BERT Model + Enhanced Detection"
\ No newline at end of file
+            info = "Rule-Based Analysis"
+        elif self.cascade is not None:
+            info = "TF-IDF → BERT Cascade + Enhanced Detection"
+        else:
+            info = "BERT Model + Enhanced Detection"
+        if include_timings:
+            return {'model': info, 'timings': self.get_timing_stats()}
+        return info
+    
+    def analysis_version(self, model_loaded=None):
+        """Version stored results are keyed by: scoring path, model files and rules"""
+        if model_loaded is None:
+            model_loaded = self.model_loaded
+        if not model_loaded:
+            return f"rules:{self.rules.version}"
+        predictor = self.bert_predictor
+        version = (
+            f"{self.get_model_info()}"
+            f"|bert:{getattr(predictor, 'model_version', '')}:{getattr(predictor, 'classifier_version', '')}"
+            f"|rules:{self.rules.version}"
+        )
+        if self.cascade is not None:
+            version += f"|margin:{self.cascade.uncertainty_margin}"
+        return version
+    
+    def analyze_article(self, article):
+        """Result dict for one article, from the store when it was already analyzed"""
+        return next(self.analyze_stream([article]))[0]
+    
+    def lookup_url(self, url):
+        """Recent stored result for a URL (skips scraping it again), or None"""
+        if self.store is None:
+            return None
+        return self.store.get_by_url(url, self.analysis_version())
+    
+    def get_store_stats(self):
+        """Hit rate and size of the analysis store (None when disabled)"""
+        if self.store is None:
+            return None
+        return self.store.stats()
+    
+    def get_timing_stats(self):
+        """Rolling p50/p95/p99 (ms) per pipeline stage, {} when timing is disabled"""
+        return timing.get_stats()
+    
+    def get_cascade_stats(self):
+        """Per-stage escalation rate and latency (None when the cascade is off)"""
+        if self.cascade is None:
+            return None
+        return self.cascade.get_stats()
+
+# Process-wide engine: Streamlit reruns re-execute app.py, not this module
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_analyzer(background=True):
+    """Return the shared RealTimeAnalyzer, creating (and loading) it only once"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = RealTimeAnalyzer(background=background)
+    return _engine
\ No newline at end of file
@@ -0,0 +1,172 @@
+import json
+import os
+import re
+from collections import namedtuple
+
+from config import ANALYSIS_CONFIG
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SUPPORTED_SCHEMA = 1
+
+# Built-in rules, used when the rules file is missing or invalid
+DEFAULT_RULES = {
+    'schema': 1,
+    'version': 'builtin',
+    'pre_detection': {
+        'confidence': 0.95,
+        'rules': [
+            {'name': 'vampire', 'pattern': r'vampire', 'requires': ['vampire']},
+            {'name': 'werewolf', 'pattern': r'werewolf', 'requires': ['werewolf']},
+            {'name': 'zombie', 'pattern': r'zombie', 'requires': ['zombie']},
+            {'name': 'alien_abduction', 'pattern': r'alien.*abduction', 'requires': ['alien', 'abduction']},
+            {'name': 'bigfoot', 'pattern': r'bigfoot', 'requires': ['bigfoot']},
+            {'name': 'loch_ness', 'pattern': r'loch ness', 'requires': ['loch ness']},
+            {'name': 'ghost_killed', 'pattern': r'ghost.*killed', 'requires': ['ghost', 'killed']},
+            {'name': 'supernatural_kill', 'pattern': r'supernatural.*kill', 'requires': ['supernatural', 'kill']},
+            {'name': 'miracle_cure', 'pattern': r'miracle.*cure', 'requires': ['miracle', 'cure']},
+            {'name': 'instant_weight_loss', 'pattern': r'instant.*weight loss', 'requires': ['instant', 'weight loss']},
+            {'name': 'one_weird_trick', 'pattern': r'one weird trick', 'requires': ['one weird trick']},
+            {'name': 'doctors_hate', 'pattern': r'doctors hate', 'requires': ['doctors hate']},
+            {'name': 'secret_government', 'pattern': r'secret.*government', 'requires': ['secret', 'government']},
+            {'name': 'future_killed', 'pattern': r'202[5-9].*killed', 'requires': ['202', 'killed']}
+        ]
+    },
+    'indicators': {
+        'fake': {
+            'weight': 2,
+            'terms': [
+                'breaking', 'shocking', 'secret', 'hidden', 'they don\'t want you to know',
+                'miracle', 'instant', 'urgent', 'warning', 'alert', 'fake', 'hoax',
+                'vampire', 'werewolf', 'zombie', 'alien', 'bigfoot', 'ghost'
+            ]
+        },
+        'reliable': {
+            'weight': 1,
+            'terms': [
+                'according to study', 'research shows', 'official report',
+                'experts say', 'peer-reviewed', 'journal', 'university', 'study'
+            ]
+        }
+    },
+    'verdicts': {
+        'real_min_score': 2,
+        'real_confidence': 0.8,
+        'fake_max_score': -1,
+        'fake_confidence': 0.9,
+        'uncertain_confidence': 0.5
+    }
+}
+
+# Everything one scan finds in a (lowercased) text
+RuleMatches = namedtuple('RuleMatches', ['pre_detection', 'fake_terms', 'reliable_terms'])
+
+def load_rules(path=None):
+    """Read the rules file; fall back to the built-in rules if it is missing or invalid"""
+    if path is None:
+        path = ANALYSIS_CONFIG['RULES_PATH']
+    if not os.path.isabs(path):
+        path = os.path.join(PROJECT_ROOT, path)
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            rules = json.load(f)
+        if rules.get('schema') != SUPPORTED_SCHEMA:
+            raise ValueError(f"unsupported schema {rules.get('schema')!r}")
+        # Compile once to reject broken patterns before they replace the defaults
+        RuleEngine(rules)
+        return rules
+    except Exception as e:
+        print(f"Rules file warning ({path}): {e}; using built-in rules")
+        return DEFAULT_RULES
+
+class RuleEngine:
+    """
+    Pre-detection patterns and indicator terms compiled once.
+
+    Every rule depends on literals (indicator terms, the literals a pattern
+    requires); those are found with str's substring search, which on CPython
+    beats both a combined alternation regex and a Python-level Aho-Corasick
+    automaton for a few dozen literals. A pattern's regex only runs once all
+    its required literals are present.
+    """
+
+    def __init__(self, rules=None):
+        rules = DEFAULT_RULES if rules is None else rules
+        self.version = str(rules.get('version', ''))
+
+        pre_detection = rules['pre_detection']
+        self.pre_confidence = pre_detection['confidence']
+        # (name, compiled pattern, required literals in file order)
+        self.pre_rules = [
+            (rule['name'], re.compile(rule['pattern']), tuple(rule.get('requires', ())))
+            for rule in pre_detection['rules']
+        ]
+
+        indicators = rules['indicators']
+        self.fake_weight = indicators['fake']['weight']
+        self.reliable_weight = indicators['reliable']['weight']
+        self.fake_terms = list(indicators['fake']['terms'])
+        self.reliable_terms = list(indicators['reliable']['terms'])
+
+        self.verdicts = dict(rules['verdicts'])
+
+        self.term_literals = sorted(set(self.fake_terms) | set(self.reliable_terms))
+        anchors = set().union(*(requires for _, _, requires in self.pre_rules))
+        self.literals = sorted(set(self.term_literals) | anchors)
+
+    @classmethod
+    def from_file(cls, path=None):
+        return cls(load_rules(path))
+
+    def find_literals(self, text_lower):
+        """Set of rule literals contained in the (lowercased) text"""
+        return {literal for literal in self.literals if literal in text_lower}
+
+    def scan(self, text):
+        """All pre-detection rules and indicator terms matching the text"""
+        text_lower = text.lower()
+        found = self.find_literals(text_lower)
+        pre_detection = [
+            name for name, pattern, requires in self.pre_rules
+            if found.issuperset(requires) and pattern.search(text_lower)
+        ]
+        return RuleMatches(
+            pre_detection=pre_detection,
+            fake_terms=[term for term in self.fake_terms if term in found],
+            reliable_terms=[term for term in self.reliable_terms if term in found]
+        )
+
+    def pre_detection(self, text):
+        """(True, confidence) if an obvious-fake pattern matches, else (None, None)"""
+        text_lower = text.lower()
+        for _, pattern, requires in self.pre_rules:
+            # Cheap literal checks first; most articles fail on the first one
+            for literal in requires:
+                if literal not in text_lower:
+                    break
+            else:
+                if pattern.search(text_lower):
+                    return True, self.pre_confidence
+        return None, None
+
+    def rule_based(self, text):
+        """Indicator score -> (label, confidence)"""
+        return self.verdict(text.lower())
+
+    def verdict(self, found):
+        """
+        (label, confidence) from the indicator terms in `found`: the lowercased
+        text itself, or a set of terms already matched (see scan())
+        """
+        fake_score = self.fake_weight * sum(1 for term in self.fake_terms if term in found)
+        reliability_score = self.reliable_weight * sum(1 for term in self.reliable_terms if term in found)
+
+        total_score = reliability_score - fake_score
+
+        if total_score >= self.verdicts['real_min_score']:
+            return "REAL", self.verdicts['real_confidence']
+        elif total_score <= self.verdicts['fake_max_score']:
+            return "FAKE", self.verdicts['fake_confidence']
+        else:
+            return "UNCERTAIN", self.verdicts['uncertain_confidence']
@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+from config import TIMING_CONFIG
+
+# Shared no-op context: the whole cost of a disabled stage() is one flag check
+_NULL_STAGE = nullcontext()
+
+class StageTimings:
+    """
+    Rolling latency window per pipeline stage.
+
+    Keeps the last WINDOW durations of each stage and computes p50/p95/p99
+    on demand. Durations recorded inside collect() are also summed into that
+    collector, which is how per-article breakdowns are built.
+    """
+
+    def __init__(self, window=None, enabled=None):
+        self.window = window or TIMING_CONFIG['WINDOW']
+        self.enabled = TIMING_CONFIG['ENABLED'] if enabled is None else enabled
+        self._samples = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def stage(self, name):
+        """Context manager timing one run of a stage"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name, seconds):
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+                self._totals[name] = 0
+            samples.append(seconds)
+            self._totals[name] += 1
+        for collector in getattr(self._local, 'collectors', ()):
+            collector[name] = collector.get(name, 0.0) + seconds
+
+    @contextmanager
+    def collect(self):
+        """Sum of the stage durations recorded by this thread inside the block (seconds)"""
+        collector = {}
+        if not self.enabled:
+            yield collector
+            return
+        collectors = getattr(self._local, 'collectors', None)
+        if collectors is None:
+            collectors = self._local.collectors = []
+        collectors.append(collector)
+        try:
+            yield collector
+        finally:
+            collectors.remove(collector)
+
+    def get_stats(self):
+        """{stage: {'count', 'p50_ms', 'p95_ms', 'p99_ms'}} over the rolling window"""
+        with self._lock:
+            snapshot = {name: (list(samples), self._totals[name]) for name, samples in self._samples.items()}
+        stats = {}
+        for name, (samples, count) in snapshot.items():
+            p50, p95, p99 = np.percentile(np.asarray(samples) * 1000, [50, 95, 99])
+            stats[name] = {
+                'count': count,
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99)
+            }
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+class _Stage:
+    __slots__ = ('timings', 'name', 'start')
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timings.record(self.name, time.perf_counter() - self.start)
+        return False
+
+# Process-wide recorder shared by the predictor, scraper, fact checker and analyzer
+timings = StageTimings()
+
+def stage(name):
+    return timings.stage(name)
+
+def collect():
+    return timings.collect()
+
+def get_stats():
+    return timings.get_stats()
+
+def breakdown_ms(collected, share=1):
+    """Collected seconds -> per-article milliseconds (batched stages split evenly over `share` articles)"""
+    return {name: round(seconds * 1000 / share, 3) for name, seconds in collected.items()}
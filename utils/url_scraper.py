@@ -1,25 +1,55 @@
-import requests
-from bs4 import BeautifulSoup
 import streamlit as st
 import re
-import nltk
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlsplit
+from config import SCRAPER_CONFIG, HTTP_CONFIG
+from utils import http_session
+from utils.timing import stage
+
+# BeautifulSoup, newspaper3k and NLTK are imported on first scrape (slow imports)
+_nltk_checked = False
+_nltk_lock = threading.Lock()
 
 class URLScraper:
-    def __init__(self):
+    def __init__(self, quiet=False):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        # Ensure NLTK data is available for newspaper3k
-        self._ensure_nltk_data()
+        # quiet: no Streamlit messages (scripts, worker threads)
+        self.quiet = quiet
+    
+    def _notify(self, message, quiet=None):
+        if not (self.quiet if quiet is None else quiet):
+            st.info(message)
     
     def _ensure_nltk_data(self):
-        """Silently check and download required NLTK data"""
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt', quiet=True)
+        """Silently check and download required NLTK data (once per process)"""
+        global _nltk_checked
+        if _nltk_checked:
+            return
+        with _nltk_lock:
+            if _nltk_checked:
+                return
+            import nltk
+            try:
+                nltk.data.find('tokenizers/punkt')
+            except LookupError:
+                nltk.download('punkt', quiet=True)
+            _nltk_checked = True
 
-    def scrape_with_newspaper3k(self, url):
+    def fetch_html(self, url, timeout=None):
+        """Page HTML through the shared keep-alive session (retries included)"""
+        response = http_session.get(url, headers=self.headers, timeout=timeout)
+        response.raise_for_status()
+        # text/html without a charset: requests falls back to ISO-8859-1, guess from the bytes instead
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = response.apparent_encoding
+        return response
+    
+    def scrape_with_newspaper3k(self, url, html=None, quiet=None):
         """Scrape article content using newspaper3k library"""
         try:
             # Try to import newspaper3k
@@ -27,9 +57,12 @@ class URLScraper:
                 from newspaper import Article
                 from newspaper import Config
             except ImportError:
-                st.warning("newspaper3k not available, using fallback method")
+                self._notify("newspaper3k not available, using fallback method", quiet)
                 return {'success': False, 'error': 'newspaper3k not installed'}
             
+            # Ensure NLTK data is available for newspaper3k
+            self._ensure_nltk_data()
+            
             # Configure to mimic a browser
             config = Config()
             config.browser_user_agent = self.headers['User-Agent']
@@ -37,7 +70,10 @@ class URLScraper:
             
             # newspaper3k auto-detects language, which is usually sufficient
             article = Article(url, config=config)
-            article.download()
+            # Page fetched by our session (pooled connections, retries), newspaper only parses it
+            if html is None:
+                html = self.fetch_html(url).text
+            article.download(input_html=html)
             article.parse()
             
             # Only perform NLP if we have content
@@ -66,13 +102,15 @@ class URLScraper:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
-    def scrape_with_bs4(self, url):
+    def scrape_with_bs4(self, url, html=None):
         """Fallback scraping with BeautifulSoup"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
+            from bs4 import BeautifulSoup
+            
+            if html is None:
+                html = self.fetch_html(url).content
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Remove script and style elements
             for script in soup(["script", "style", "nav", "header", "footer", "aside", "form", "iframe", "noscript"]):
@@ -172,8 +210,8 @@ class URLScraper:
         
         return text.strip()
     
-    def scrape_article(self, url):
-        """Main function to scrape article from URL"""
+    def scrape_article(self, url, timeout=None, quiet=None):
+        """Main function to scrape article from URL (timeout: read timeout in seconds)"""
         # Validate URL
         if not url:
             return {'success': False, 'error': 'No URL provided'}
@@ -181,18 +219,29 @@ class URLScraper:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        alert_box("Message à afficher", alert_type="success")
-
+        # Downloaded once, parsed by both methods
+        try:
+            with stage('fetch'):
+                response = self.fetch_html(url, timeout=timeout)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Could not download this URL: {e}',
+                'title': 'Extraction failed',
+                'content': 'Unable to download the page. The website might be down or blocking scrapers.'
+            }
         
         # Try newspaper3k first (Better at detecting main content)
-        result = self.scrape_with_newspaper3k(url)
+        with stage('scrape'):
+            result = self.scrape_with_newspaper3k(url, html=response.text, quiet=quiet)
         
         if result['success']:
             return result
         
         # If newspaper3k fails, try BeautifulSoup
-        alert_box("Trying alternative scraping method...", alert_type="info")
-        result = self.scrape_with_bs4(url)
+        self._notify("Trying alternative scraping method...", quiet)
+        with stage('scrape'):
+            result = self.scrape_with_bs4(url, html=response.content)
         
         if result['success']:
             return result
@@ -203,4 +252,82 @@ class URLScraper:
             'error': 'Could not extract meaningful content from this URL',
             'title': 'Extraction failed',
             'content': 'Unable to extract article content. The website might be blocking scrapers or require JavaScript.'
-        }
\ No newline at end of file
+        }
+    
+    def scrape_many(self, urls, max_workers=None, per_host=None, host_interval=None, deadline=None):
+        """
+        Scrape several URLs concurrently; yields (url, result) as each one finishes.
+
+        At most max_workers pages are in progress overall, at most per_host
+        for a given site, and requests to the same site start at least
+        host_interval seconds apart. A URL still running `deadline` seconds
+        after it started is reported as failed and no longer waited for, so
+        a slow site only holds up its own URLs. Runs quietly (no Streamlit
+        calls from worker threads).
+        """
+        max_workers = max(1, max_workers or SCRAPER_CONFIG['MAX_WORKERS'])
+        per_host = max(1, per_host or SCRAPER_CONFIG['PER_HOST'])
+        host_interval = SCRAPER_CONFIG['HOST_INTERVAL'] if host_interval is None else host_interval
+        deadline = deadline or SCRAPER_CONFIG['URL_DEADLINE']
+        
+        # One queue per host, hosts served in order of first appearance
+        queues = {}
+        for url in urls:
+            if not url:
+                yield url, {'success': False, 'error': 'No URL provided'}
+                continue
+            full_url = url if url.startswith(('http://', 'https://')) else 'https://' + url
+            queues.setdefault(urlsplit(full_url).netloc.lower(), deque()).append(url)
+        
+        active = {host: 0 for host in queues}
+        next_start = {host: 0.0 for host in queues}
+        running = {}  # future -> (url, host, deadline time, reported)
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scraper")
+        try:
+            while queues or any(not reported for _, _, _, reported in running.values()):
+                # 1. Start every URL allowed by the global, per-host and rate limits
+                now = time.monotonic()
+                for host in list(queues):
+                    while (queues[host] and len(running) < max_workers
+                           and active[host] < per_host and now >= next_start[host]):
+                        url = queues[host].popleft()
+                        future = pool.submit(self.scrape_article, url, min(deadline, HTTP_CONFIG['READ_TIMEOUT']), True)
+                        running[future] = (url, host, now + deadline, False)
+                        active[host] += 1
+                        next_start[host] = now + host_interval
+                    if not queues[host]:
+                        del queues[host]
+                
+                # 2. Sleep until a result, a deadline or the next allowed start
+                wake_times = [end for _, _, end, reported in running.values() if not reported]
+                wake_times += [
+                    next_start[host] for host in queues
+                    if active[host] < per_host and len(running) < max_workers
+                ]
+                timeout = max(0.0, min(wake_times) - time.monotonic()) if wake_times else None
+                if running:
+                    done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    # Only rate-limited hosts left
+                    time.sleep(timeout or 0)
+                    done = set()
+                
+                # 3. Finished URLs (abandoned ones only free their slot)
+                for future in done:
+                    url, host, _, reported = running.pop(future)
+                    active[host] -= 1
+                    if not reported:
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {'success': False, 'error': str(e)}
+                        yield url, result
+                
+                # 4. Past their deadline: reported now, still counted against limits until they return
+                now = time.monotonic()
+                for future, (url, host, end, reported) in list(running.items()):
+                    if not reported and now >= end:
+                        running[future] = (url, host, end, True)
+                        yield url, {'success': False, 'error': f'Timed out after {deadline:g}s'}
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)